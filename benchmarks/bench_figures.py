@@ -0,0 +1,59 @@
+"""
+Benchmark of the figure payload sent to the browser, before and after encoding.
+
+Run from the repository root:
+    python -m benchmarks.bench_figures
+"""
+import time
+import numpy as np
+from modules.geometry import get_default_params, calculate_3d_coordinates
+from modules.forces import calculate_forces
+from modules.visualization import (
+    create_barrier_diagram, create_top_view, create_3d_view,
+    MAX_RESULT_ANNOTATIONS, LOD_DETAIL_POINTS
+)
+from modules.figure_encoding import encode_figure, figure_json_size
+
+SUPPORT_COUNTS = (3, 12, 40, 100)
+LOAD_CELL_SHARE = 0.7
+SEED = 0
+
+def build_views(barrier_config, results):
+    """Figures shown by the analyzer, with the options it uses"""
+    return {
+        'side': create_barrier_diagram(barrier_config, results, max_annotations=MAX_RESULT_ANNOTATIONS, lang='en'),
+        'top': create_top_view(barrier_config, lang='en'),
+        '3d': create_3d_view(barrier_config, results, detail_points=LOD_DETAIL_POINTS, lang='en')
+    }
+
+def main():
+    rng = np.random.default_rng(SEED)
+    params = get_default_params()
+    totals = [0, 0]
+
+    print(f"{'supports':>8} {'view':>5} {'traces':>7} {'before B':>10} {'after B':>10} {'ratio':>6} {'encode ms':>10}")
+    for num_supports in SUPPORT_COUNTS:
+        params['num_supports'] = num_supports
+        barrier_config = calculate_3d_coordinates(params)
+
+        # Measured forces on a share of the cables, as after loading logger data
+        for cable in barrier_config['cables'].values():
+            cable['has_load_cell'] = bool(rng.random() < LOAD_CELL_SHARE)
+            cable['force'] = float(rng.uniform(0, 100))
+        results = calculate_forces(barrier_config)
+
+        for view, fig in build_views(barrier_config, results).items():
+            start = time.perf_counter()
+            encoded = encode_figure(fig)
+            encode_time = time.perf_counter() - start
+
+            before, after = figure_json_size(fig), figure_json_size(encoded)
+            totals[0] += before
+            totals[1] += after
+            print(f"{num_supports:>8} {view:>5} {len(fig.data):>7} {before:>10} {after:>10} "
+                  f"{before / after:>5.1f}x {encode_time * 1e3:>10.1f}")
+
+    print(f"\nTotal: {totals[0]} B before, {totals[1]} B after ({totals[0] / totals[1]:.1f}x smaller)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of the barrier geometry builder for growing support counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_geometry
+"""
+import time
+import numpy as np
+from modules.geometry import get_default_params, build_barrier_model
+
+SUPPORT_COUNTS = (10, 30, 100, 300, 1000)
+REPEATS = 20
+
+def time_call(func, repeats=REPEATS):
+    """Median wall time of func in seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+def main():
+    params = get_default_params()
+    rows = []
+
+    print(f"{'supports':>8} {'nodes':>7} {'cables':>7} {'model ms':>10} {'dict view ms':>13} {'us/support':>11}")
+    for num_supports in SUPPORT_COUNTS:
+        params['num_supports'] = num_supports
+        model = build_barrier_model(params)
+
+        build_time = time_call(lambda: build_barrier_model(params))
+        view_time = time_call(model.to_config, repeats=5)
+        rows.append((num_supports, build_time))
+
+        print(f"{num_supports:>8} {model.num_nodes:>7} {model.num_cables:>7} "
+              f"{build_time * 1e3:>10.3f} {view_time * 1e3:>13.3f} {build_time / num_supports * 1e6:>11.2f}")
+
+    # Slope of log(time) over log(supports), 1.0 means linear scaling
+    counts, times = np.array(rows).T
+    slope = np.polyfit(np.log(counts[1:]), np.log(times[1:]), 1)[0]
+    print(f"\nScaling exponent (30..{SUPPORT_COUNTS[-1]} supports): {slope:.2f}")
+
+if __name__ == "__main__":
+    main()
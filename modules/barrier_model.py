@@ -0,0 +1,331 @@
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+import numpy as np
+
+# Display color of each cable type
+CABLE_COLORS = {
+    'rhs': 'green',
+    'tso': 'red',
+    'tsu': 'red',
+    'zw': 'gold',
+    'sa': 'blue'
+}
+
+# Point of a support a cable of each type is attached to
+CABLE_ATTACHMENT = {
+    'rhs': 'top',
+    'tso': 'top',
+    'tsu': 'base',
+    'zw': 'mid',
+    'sa': 'top'
+}
+
+# Label columns of to_arrays(), stored as UTF-8 byte strings
+STRING_COLUMNS = (
+    'node_element', 'node_point', 'support_ids', 'support_names',
+    'anchor_ids', 'anchor_names', 'cable_ids', 'cable_names'
+)
+
+def _encode_strings(values):
+    return np.char.encode(np.asarray(values, dtype=str), 'utf-8')
+
+def _decode_strings(values):
+    return np.char.decode(np.asarray(values), 'utf-8').tolist()
+
+class BarrierConfig(dict):
+    """
+    Nested barrier configuration dictionary produced by BarrierModel.to_config().
+
+    Behaves exactly like a plain dict (JSON, session state) but keeps a
+    reference to the model it was produced from, so array based code does
+    not need to parse the dictionary again. Indices derived from the topology
+    (see forces.get_force_index) are cached on the instance as well.
+    """
+    model = None
+    force_index = None
+
+class ConfigOverlay(Mapping):
+    """
+    Read-only view of a barrier configuration with some parameters overridden.
+
+    Supports, anchors and cables are the objects of the underlying
+    configuration, only the small params dictionary is merged. Used instead
+    of a deep copy when a figure should show e.g. a different terrain
+    inclination than the stored one.
+    """
+
+    def __init__(self, barrier_config, **param_overrides):
+        self._config = barrier_config
+        self._params = None
+        if 'params' in barrier_config:
+            self._params = MappingProxyType({**barrier_config['params'], **param_overrides})
+
+    def __getitem__(self, key):
+        if key == 'params' and self._params is not None:
+            return self._params
+        return self._config[key]
+
+    def __iter__(self):
+        return iter(self._config)
+
+    def __len__(self):
+        return len(self._config)
+
+def get_barrier_model(barrier_config):
+    """Array model of a barrier configuration, built from the dictionary if needed"""
+    model = getattr(barrier_config, 'model', None)
+    if model is None:
+        model = BarrierModel.from_config(barrier_config)
+    return model
+
+class BarrierModel:
+    """
+    Compact array representation of a barrier configuration.
+
+    All support points and anchors are rows of one (N, 3) node array and every
+    cable is a row of an (M, 2) connectivity array referencing those nodes.
+    Per-cable attributes (type, force, load cell) are parallel arrays. The
+    nested dictionary layout used by the UI is only produced on demand by
+    to_config().
+    """
+
+    def __init__(self, params, nodes, node_element, node_point,
+                 support_ids, support_names, anchor_ids, anchor_names,
+                 cables, cable_ids, cable_names, cable_types,
+                 forces=None, has_load_cell=None):
+        # Parameters the geometry was built with
+        self.params = dict(params)
+        self.nodes = np.asarray(nodes, dtype=np.float64).reshape(-1, 3)
+        self.node_element = list(node_element)
+        self.node_point = list(node_point)
+        self.support_ids = list(support_ids)
+        self.support_names = list(support_names)
+        self.anchor_ids = list(anchor_ids)
+        self.anchor_names = list(anchor_names)
+        self.cables = np.asarray(cables, dtype=np.int32).reshape(-1, 2)
+        self.cable_ids = list(cable_ids)
+        self.cable_names = list(cable_names)
+        self.cable_types = np.asarray(cable_types, dtype='<U3')
+
+        num_cables = len(self.cable_ids)
+        self.forces = (np.zeros(num_cables) if forces is None
+                       else np.asarray(forces, dtype=np.float64))
+        self.has_load_cell = (np.zeros(num_cables, dtype=bool) if has_load_cell is None
+                              else np.asarray(has_load_cell, dtype=bool))
+
+        # Slices of node groups, only known for models built from parameters
+        self.node_groups = None
+
+        self._node_index = None
+
+    @property
+    def num_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def num_cables(self):
+        return len(self.cables)
+
+    @property
+    def node_index(self):
+        """Lookup of node row by (element id, point name)"""
+        if self._node_index is None:
+            self._node_index = {
+                (element, point): i
+                for i, (element, point) in enumerate(zip(self.node_element, self.node_point))
+            }
+        return self._node_index
+
+    def node(self, element, point='position'):
+        """Coordinates of one node as an (x, y, z) array"""
+        return self.nodes[self.node_index[(element, point)]]
+
+    def cable_endpoints(self):
+        """Start and end coordinates of all cables as two (M, 3) arrays"""
+        return self.nodes[self.cables[:, 0]], self.nodes[self.cables[:, 1]]
+
+    def with_nodes(self, params, nodes):
+        """Copy of the model with new parameters and node coordinates but the same topology"""
+        model = BarrierModel(
+            params, nodes, self.node_element, self.node_point,
+            self.support_ids, self.support_names, self.anchor_ids, self.anchor_names,
+            self.cables, self.cable_ids, self.cable_names, self.cable_types,
+            forces=self.forces.copy(), has_load_cell=self.has_load_cell.copy()
+        )
+        model.node_groups = self.node_groups
+        model._node_index = self._node_index
+        return model
+
+    def copy_measurements(self, other):
+        """Take over force and load cell values of cables with the same id from another model"""
+        positions = {cable_id: i for i, cable_id in enumerate(other.cable_ids)}
+        for i, cable_id in enumerate(self.cable_ids):
+            j = positions.get(cable_id)
+            if j is not None:
+                self.forces[i] = other.forces[j]
+                self.has_load_cell[i] = other.has_load_cell[j]
+
+    def read_measurements(self, cables):
+        """Copy force and load cell values from a cables dictionary into the arrays"""
+        for i, cable_id in enumerate(self.cable_ids):
+            cable = cables.get(cable_id)
+            if cable is not None:
+                self.forces[i] = cable.get('force', 0.0)
+                self.has_load_cell[i] = cable.get('has_load_cell', False)
+
+    def to_config(self):
+        """
+        Produce the nested dictionary view of the barrier.
+
+        Returns:
+            Barrier configuration with 'supports', 'anchors', 'cables' and 'params'
+        """
+        coords = [dict(zip('xyz', row)) for row in self.nodes.tolist()]
+        index = self.node_index
+
+        supports = {}
+        for support_id, name in zip(self.support_ids, self.support_names):
+            supports[support_id] = {
+                'base': coords[index[(support_id, 'base')]],
+                'top': coords[index[(support_id, 'top')]],
+                'length': self.params.get('L'),
+                'name': name,
+                'mid': coords[index[(support_id, 'mid')]]
+            }
+
+        anchors = {
+            anchor_id: {'position': coords[index[(anchor_id, 'position')]], 'name': name}
+            for anchor_id, name in zip(self.anchor_ids, self.anchor_names)
+        }
+
+        cables = {}
+        forces = self.forces.tolist()
+        has_load_cell = self.has_load_cell.tolist()
+        cable_types = self.cable_types.tolist()
+        for i, (start, end) in enumerate(self.cables.tolist()):
+            cable_type = cable_types[i]
+            cables[self.cable_ids[i]] = {
+                'start': self.node_element[start],
+                'end': self.node_element[end],
+                'type': cable_type,
+                'name': self.cable_names[i],
+                'force': forces[i],
+                'has_load_cell': has_load_cell[i],
+                'color': CABLE_COLORS.get(cable_type, 'gray'),
+                'start_coords': dict(coords[start]),
+                'end_coords': dict(coords[end])
+            }
+
+        config = BarrierConfig(
+            supports=supports,
+            anchors=anchors,
+            cables=cables,
+            params=dict(self.params)
+        )
+        config.model = self
+        return config
+
+    @classmethod
+    def from_config(cls, barrier_config):
+        """
+        Build the array model from a nested barrier configuration dictionary.
+
+        Cables are attached to the support point given by CABLE_ATTACHMENT for
+        their type. Missing mid-points are placed halfway up the support.
+        """
+        supports = barrier_config.get('supports', {})
+        anchors = barrier_config.get('anchors', {})
+
+        nodes, node_element, node_point = [], [], []
+
+        def add_node(element, point, coords):
+            nodes.append((coords.get('x', 0.0), coords.get('y', 0.0), coords.get('z', 0.0)))
+            node_element.append(element)
+            node_point.append(point)
+
+        for support_id, support in supports.items():
+            base = support.get('base', {})
+            top = support.get('top', base)
+            mid = support.get('mid') or {
+                'x': (base.get('x', 0.0) + top.get('x', 0.0)) / 2,
+                'y': base.get('y', 0.0),
+                'z': (base.get('z', 0.0) + top.get('z', 0.0)) / 2
+            }
+            add_node(support_id, 'base', base)
+            add_node(support_id, 'top', top)
+            add_node(support_id, 'mid', mid)
+
+        for anchor_id, anchor in anchors.items():
+            add_node(anchor_id, 'position', anchor.get('position', {}))
+
+        index = {(element, point): i for i, (element, point) in enumerate(zip(node_element, node_point))}
+
+        def node_of(element, cable_type):
+            if element in supports:
+                return index[(element, CABLE_ATTACHMENT.get(cable_type, 'top'))]
+            return index[(element, 'position')]
+
+        connectivity, cable_ids, cable_names, cable_types, forces, has_load_cell = [], [], [], [], [], []
+        for cable_id, cable in barrier_config.get('cables', {}).items():
+            start, end = cable.get('start'), cable.get('end')
+            cable_type = cable.get('type', '')
+            if start not in supports and start not in anchors:
+                continue
+            if end not in supports and end not in anchors:
+                continue
+            connectivity.append((node_of(start, cable_type), node_of(end, cable_type)))
+            cable_ids.append(cable_id)
+            cable_names.append(cable.get('name', cable_id))
+            cable_types.append(cable_type)
+            forces.append(cable.get('force', 0.0))
+            has_load_cell.append(cable.get('has_load_cell', False))
+
+        return cls(
+            barrier_config.get('params', {}), nodes, node_element, node_point,
+            list(supports), [s.get('name', s_id) for s_id, s in supports.items()],
+            list(anchors), [a.get('name', a_id) for a_id, a in anchors.items()],
+            connectivity, cable_ids, cable_names, cable_types,
+            forces=forces, has_load_cell=has_load_cell
+        )
+
+    def to_arrays(self):
+        """
+        Columnar serialization of the model.
+
+        Returns:
+            Dictionary of NumPy arrays, labels are UTF-8 byte strings and
+            parameters are stored as a JSON string
+        """
+        arrays = {
+            'nodes': self.nodes,
+            'cables': self.cables,
+            'cable_types': np.char.encode(self.cable_types, 'ascii'),
+            'forces': self.forces,
+            'has_load_cell': self.has_load_cell,
+            'params': np.asarray(json.dumps(self.params, default=float))
+        }
+        for column in STRING_COLUMNS:
+            arrays[column] = _encode_strings(getattr(self, column))
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Rebuild a model from the output of to_arrays()"""
+        labels = {column: _decode_strings(arrays[column]) for column in STRING_COLUMNS}
+        return cls(
+            json.loads(str(arrays['params'])),
+            arrays['nodes'],
+            labels['node_element'],
+            labels['node_point'],
+            labels['support_ids'],
+            labels['support_names'],
+            labels['anchor_ids'],
+            labels['anchor_names'],
+            arrays['cables'],
+            labels['cable_ids'],
+            labels['cable_names'],
+            np.char.decode(np.asarray(arrays['cable_types']), 'ascii'),
+            forces=arrays['forces'],
+            has_load_cell=arrays['has_load_cell']
+        )
@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss counters.
+
+    Safe to share between threads, the Streamlit server runs sessions concurrently.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return the cached value and mark it as recently used"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond maxsize"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() on a miss"""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key=None):
+        """Remove one entry, or all entries if no key is given"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def resize(self, maxsize):
+        """Change the maximum number of entries"""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def info(self):
+        """Cache statistics"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'maxsize': self.maxsize
+        }
+
+    def _evict(self):
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
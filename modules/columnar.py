@@ -0,0 +1,218 @@
+import io
+import json
+import numpy as np
+from modules.barrier_model import BarrierModel, STRING_COLUMNS, get_barrier_model
+from modules.forces import calculate_forces
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, archives are written as NPZ without it
+    pa = None
+    pq = None
+
+COLUMNAR_FORMATS = ('parquet', 'npz')
+
+# Format written when none is given, Parquet needs pyarrow
+DEFAULT_COLUMNAR_FORMAT = 'parquet' if pa is not None else 'npz'
+
+# MIME type of the downloads of each format
+COLUMNAR_MIME_TYPES = {
+    'parquet': 'application/vnd.apache.parquet',
+    'npz': 'application/octet-stream'
+}
+
+# Suffix of the offsets array of a list column in NPZ archives
+OFFSETS_SUFFIX = '.offsets'
+
+# Columns holding one value per configuration, all others hold one list per configuration
+SCALAR_COLUMNS = ('total_anchor_force', 'total_support_force')
+
+# Prefix of the columns holding the geometry parameters
+PARAM_PREFIX = 'param_'
+
+def config_columns(barrier_config, results=None):
+    """
+    Typed columns of one barrier configuration and its force results.
+
+    Node coordinates and cable connectivity are split into one column per
+    axis (node_x, node_y, node_z, cable_start, cable_end), labels are strings
+    and every parameter gets its own param_<name> column.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        results: Output of calculate_forces, computed if not given
+
+    Returns:
+        Dictionary of 1D NumPy arrays (list columns) and scalars
+    """
+    if results is None:
+        results = calculate_forces(barrier_config)
+
+    # The dictionary holds the current measurements and parameters, the cached model may not
+    model = get_barrier_model(barrier_config)
+    model = model.with_nodes(barrier_config.get('params', model.params), model.nodes)
+    model.read_measurements(barrier_config.get('cables', {}))
+    arrays = model.to_arrays()
+
+    columns = {
+        'node_x': model.nodes[:, 0],
+        'node_y': model.nodes[:, 1],
+        'node_z': model.nodes[:, 2],
+        'cable_start': model.cables[:, 0],
+        'cable_end': model.cables[:, 1],
+        'cable_types': model.cable_types.astype(str),
+        'forces': model.forces,
+        'has_load_cell': model.has_load_cell
+    }
+    for column in STRING_COLUMNS:
+        columns[column] = np.asarray(getattr(model, column), dtype=str)
+
+    columns['anchor_forces'] = np.array([results.get(anchor_id, 0.0) for anchor_id in model.anchor_ids], dtype=float)
+    columns['support_forces'] = np.array([results.get(support_id, 0.0) for support_id in model.support_ids], dtype=float)
+    columns['total_anchor_force'] = float(results.get('total_anchor_force', 0.0))
+    columns['total_support_force'] = float(results.get('total_support_force', 0.0))
+
+    for name, value in json.loads(str(arrays['params'])).items():
+        columns[f"{PARAM_PREFIX}{name}"] = value
+
+    return columns
+
+def _model_from_columns(columns):
+    """Rebuild the array model from the columns of one configuration"""
+    params = {
+        name[len(PARAM_PREFIX):]: _python_value(value)
+        for name, value in columns.items() if name.startswith(PARAM_PREFIX)
+    }
+    labels = {column: np.asarray(columns[column]).astype(str).tolist() for column in STRING_COLUMNS}
+    return BarrierModel(
+        params,
+        np.column_stack([columns['node_x'], columns['node_y'], columns['node_z']]),
+        labels['node_element'],
+        labels['node_point'],
+        labels['support_ids'],
+        labels['support_names'],
+        labels['anchor_ids'],
+        labels['anchor_names'],
+        np.column_stack([columns['cable_start'], columns['cable_end']]),
+        labels['cable_ids'],
+        labels['cable_names'],
+        np.asarray(columns['cable_types']).astype(str),
+        forces=columns['forces'],
+        has_load_cell=columns['has_load_cell']
+    )
+
+def _python_value(value):
+    return value.item() if hasattr(value, 'item') else value
+
+# ======= Writers =======
+
+def write_columnar(rows, fmt=None):
+    """
+    Serialize configurations into one columnar archive, one row per configuration.
+
+    Args:
+        rows: Iterable of column dictionaries from config_columns
+        fmt: 'parquet' or 'npz', defaults to DEFAULT_COLUMNAR_FORMAT
+
+    Returns:
+        Archive bytes
+    """
+    fmt = fmt or DEFAULT_COLUMNAR_FORMAT
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {fmt}")
+    if fmt == 'parquet' and pa is None:
+        raise ImportError("Parquet export requires pyarrow, use the 'npz' format instead")
+
+    # Collect the columns of all rows, parameters missing in a row stay empty
+    rows = list(rows)
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    table = {name: [row.get(name) for row in rows] for name in names}
+
+    buffer = io.BytesIO()
+    if fmt == 'parquet':
+        pq.write_table(pa.table({name: pa.array(values) for name, values in table.items()}), buffer)
+    else:
+        np.savez_compressed(buffer, **_npz_arrays(table))
+    return buffer.getvalue()
+
+def _npz_arrays(table):
+    # List columns are stored like Arrow list arrays, as concatenated values plus row offsets
+    arrays = {}
+    for name, values in table.items():
+        if name in SCALAR_COLUMNS or name.startswith(PARAM_PREFIX):
+            arrays[name] = np.asarray([np.nan if value is None else value for value in values])
+            continue
+        lengths = [len(value) for value in values]
+        arrays[name] = np.concatenate(values) if values else np.array([])
+        arrays[f"{name}{OFFSETS_SUFFIX}"] = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    return arrays
+
+def export_columnar(barrier_config, results=None, fmt=None):
+    """Columnar archive with a single configuration, see write_columnar"""
+    return write_columnar([config_columns(barrier_config, results)], fmt)
+
+# ======= Readers =======
+
+def read_columnar(data):
+    """
+    Read all configurations from a Parquet or NPZ archive written by write_columnar.
+
+    Args:
+        data: Archive bytes, the format is detected from the file signature
+
+    Returns:
+        List of BarrierConfig dictionaries in row order
+
+    Raises:
+        ValueError: If the data is neither a Parquet nor an NPZ archive
+    """
+    if data[:4] == b'PAR1':
+        if pq is None:
+            raise ImportError("Reading Parquet archives requires pyarrow")
+        arrays = _parquet_arrays(pq.read_table(io.BytesIO(data)))
+    elif data[:2] == b'PK':
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+    else:
+        raise ValueError("Not a Parquet or NPZ archive")
+
+    configs = []
+    for row in _rows(arrays):
+        # Parameters missing in this row were written as empty values
+        row = {
+            name: value for name, value in row.items()
+            if not (name.startswith(PARAM_PREFIX) and (value is None or value != value))
+        }
+        configs.append(_model_from_columns(row).to_config())
+    return configs
+
+def _parquet_arrays(table):
+    # Same layout as the NPZ archives, list columns are read as values plus offsets without Python lists
+    arrays = {}
+    for name in table.column_names:
+        column = table.column(name).combine_chunks()
+        if pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+            arrays[name] = column.flatten().to_numpy(zero_copy_only=False)
+            arrays[f"{name}{OFFSETS_SUFFIX}"] = column.offsets.to_numpy().astype(np.int64)
+        else:
+            arrays[name] = column.to_numpy(zero_copy_only=False)
+    return arrays
+
+def _rows(arrays):
+    offsets = {name[:-len(OFFSETS_SUFFIX)]: arrays[name] for name in arrays if name.endswith(OFFSETS_SUFFIX)}
+    scalars = [name for name in arrays if name not in offsets and not name.endswith(OFFSETS_SUFFIX)]
+    num_rows = len(next(iter(offsets.values()))) - 1 if offsets else 0
+
+    for i in range(num_rows):
+        row = {name: arrays[name][i] for name in scalars}
+        for name, bounds in offsets.items():
+            row[name] = arrays[name][bounds[i]:bounds[i + 1]]
+        yield row
+
+def import_columnar(data):
+    """First configuration of a columnar archive, ready for st.session_state.barrier_config"""
+    configs = read_columnar(data)
+    if not configs:
+        raise ValueError("The archive contains no configuration")
+    return configs[0]
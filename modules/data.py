@@ -1,6 +1,44 @@
 import json
+import os
+import glob
+import pandas as pd
 import streamlit as st
 from modules.geometry import get_default_params, calculate_3d_coordinates
+from modules.barrier_model import BarrierConfig
+
+# Suffix of the file a user's barrier configuration is saved in
+CONFIG_FILE_SUFFIX = "_barrier_config.json"
+
+def config_file_path(username):
+    """Path of the saved barrier configuration of a user"""
+    return f"{username}{CONFIG_FILE_SUFFIX}"
+
+def list_saved_configs():
+    """Sorted usernames that have a saved barrier configuration"""
+    paths = glob.glob(f"*{CONFIG_FILE_SUFFIX}")
+    return sorted(os.path.basename(path)[:-len(CONFIG_FILE_SUFFIX)] for path in paths)
+
+def read_barrier_config(username):
+    """
+    Read the saved barrier configuration of a user, without falling back to defaults.
+
+    Raises:
+        FileNotFoundError: If the user has no saved configuration
+        ValueError: If the file is not valid JSON
+    """
+    with open(config_file_path(username), "r") as f:
+        config = json.load(f)
+
+    # Ensure 'params' key exists
+    if 'params' not in config:
+        config['params'] = get_default_params()
+
+    # Ensure required structure exists
+    for key in ('supports', 'anchors', 'cables'):
+        config.setdefault(key, {})
+
+    # Wrap in BarrierConfig so topology indices can be cached on it
+    return BarrierConfig(config)
 
 def init_barrier_config():
     """Create a new barrier configuration with default parameters"""
@@ -10,22 +48,7 @@ def init_barrier_config():
 def load_barrier_config(username):
     """Load barrier configuration for a specific user"""
     try:
-        with open(f"{username}_barrier_config.json", "r") as f:
-            config = json.load(f)
-            
-            # Ensure 'params' key exists
-            if 'params' not in config:
-                config['params'] = get_default_params()
-                
-            # Ensure required structure exists
-            if 'supports' not in config:
-                config['supports'] = {}
-            if 'anchors' not in config:
-                config['anchors'] = {}
-            if 'cables' not in config:
-                config['cables'] = {}
-                
-            return config
+        return read_barrier_config(username)
     except FileNotFoundError:
         # Return default config if no saved config exists
         return init_barrier_config()
@@ -40,7 +63,47 @@ def save_barrier_config(username, config):
         config['params'] = get_default_params()
         
     try:
-        with open(f"{username}_barrier_config.json", "w") as f:
+        with open(config_file_path(username), "w") as f:
             json.dump(config, f, indent=4)
     except Exception as e:
-        st.error(f"Error saving configuration: {e}")
\ No newline at end of file
+        st.error(f"Error saving configuration: {e}")
+
+def load_force_recording(file, config):
+    """
+    Read a load cell recording from a CSV file.
+
+    The first column holds the sample times in seconds, every further column
+    the forces in kN of one cable, named by its id or its display name.
+
+    Args:
+        file: Path or file-like object of the CSV file
+        config: Barrier configuration the cables belong to
+
+    Returns:
+        (times, (T, n_columns) force matrix, cable ids of the columns)
+
+    Raises:
+        ValueError: If the file has no samples, a column matches no cable or a value is not numeric
+    """
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    df = pd.read_csv(file)
+    if df.empty or df.shape[1] < 2:
+        raise ValueError("expected a time column and at least one cable column")
+
+    cables = config.get('cables', {})
+    by_name = {cable.get('name', cable_id): cable_id for cable_id, cable in cables.items()}
+    cable_ids = []
+    for column in df.columns[1:]:
+        name = str(column).strip()
+        cable_id = name if name in cables else by_name.get(name)
+        if cable_id is None:
+            raise ValueError(f"unknown cable '{column}'")
+        cable_ids.append(cable_id)
+
+    values = df.apply(pd.to_numeric, errors='coerce')
+    if values.isna().any().any():
+        raise ValueError("all values must be numeric")
+
+    return values.iloc[:, 0].to_numpy(dtype=float), values.iloc[:, 1:].to_numpy(dtype=float), cable_ids
+
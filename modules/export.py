@@ -0,0 +1,171 @@
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+import pandas as pd
+from modules.forces import calculate_forces
+from modules.data import config_file_path, read_barrier_config
+from modules.translations import get_translation
+
+# ======= Result tables =======
+
+def build_anchor_table(barrier_config, results, lang):
+    """Table of the retention cable anchors with their forces and positions"""
+    anchor_data = []
+    for anchor_id, anchor in barrier_config['anchors'].items():
+        # Skip anchors without position data
+        if 'position' not in anchor:
+            continue
+            
+        if anchor_id.startswith('v'):  # Only include retention cable anchors
+            anchor_data.append({
+                get_translation('anchor', lang): anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}"),
+                f"{get_translation('force', lang)} (kN)": round(results.get(anchor_id, 0), 1),
+                f"X ({get_translation('meter', lang)})": round(anchor['position'].get('x', 0), 2),
+                f"Y ({get_translation('meter', lang)})": round(anchor['position'].get('y', 0), 2),
+                f"Z ({get_translation('meter', lang)})": round(anchor['position'].get('z', 0), 2)
+            })
+    
+    return pd.DataFrame(anchor_data)
+
+def build_support_table(barrier_config, results, lang):
+    """Table of the supports with their forces and base and top positions"""
+    support_data = []
+    for support_id, support in barrier_config['supports'].items():
+        # Skip supports without required data
+        if 'base' not in support or 'top' not in support:
+            continue
+            
+        support_data.append({
+            get_translation('support', lang): support.get('name', f"{get_translation('support', lang)} {support_id}"),
+            f"{get_translation('force', lang)} (kN)": round(results.get(support_id, 0), 1),
+            f"{get_translation('base', lang)} X ({get_translation('meter', lang)})": round(support['base'].get('x', 0), 2),
+            f"{get_translation('base', lang)} Y ({get_translation('meter', lang)})": round(support['base'].get('y', 0), 2),
+            f"{get_translation('base', lang)} Z ({get_translation('meter', lang)})": round(support['base'].get('z', 0), 2),
+            f"{get_translation('top', lang)} X ({get_translation('meter', lang)})": round(support['top'].get('x', 0), 2),
+            f"{get_translation('top', lang)} Y ({get_translation('meter', lang)})": round(support['top'].get('y', 0), 2),
+            f"{get_translation('top', lang)} Z ({get_translation('meter', lang)})": round(support['top'].get('z', 0), 2)
+        })
+    
+    return pd.DataFrame(support_data)
+
+def build_cable_table(barrier_config, lang):
+    """Table of the cables with their measured forces and end coordinates"""
+    cable_data = []
+    for cable_id, cable in barrier_config['cables'].items():
+        # Skip cables without required coordinates
+        if 'start_coords' not in cable or 'end_coords' not in cable:
+            continue
+            
+        # Use get() method to safely retrieve values with defaults
+        start_coords = cable.get('start_coords', {})
+        end_coords = cable.get('end_coords', {})
+        
+        cable_data.append({
+            get_translation('cable', lang): cable.get('name', f"{get_translation('cable', lang)} {cable_id}"),
+            get_translation('type', lang): cable.get('type', '').upper(),
+            f"{get_translation('force', lang)} (kN)": cable.get('force', 0) if cable.get('has_load_cell', False) else get_translation("no_measurement", lang),
+            get_translation('has_load_cell', lang): get_translation("yes", lang) if cable.get('has_load_cell', False) else get_translation("no", lang),
+            f"{get_translation('start', lang)} X": round(start_coords.get('x', 0), 2),
+            f"{get_translation('start', lang)} Y": round(start_coords.get('y', 0), 2),
+            f"{get_translation('start', lang)} Z": round(start_coords.get('z', 0), 2),
+            f"{get_translation('end', lang)} X": round(end_coords.get('x', 0), 2),
+            f"{get_translation('end', lang)} Y": round(end_coords.get('y', 0), 2),
+            f"{get_translation('end', lang)} Z": round(end_coords.get('z', 0), 2)
+        })
+    
+    return pd.DataFrame(cable_data)
+
+# ======= Bulk export =======
+
+class _ChunkBuffer(io.RawIOBase):
+    """Write-only stream collecting bytes until they are taken with pop()"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def _write_json(archive, name, data):
+    with io.TextIOWrapper(archive.open(name, 'w'), encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+def _write_csv(archive, name, df):
+    with io.TextIOWrapper(archive.open(name, 'w'), encoding='utf-8', newline='') as f:
+        df.to_csv(f, index=False)
+
+def summary_row(username, barrier_config, results, lang):
+    """Summary table row of one saved configuration"""
+    cables = barrier_config['cables'].values()
+    cable_forces = [cable.get('force', 0) for cable in cables if cable.get('has_load_cell', False)]
+    anchor_forces = [results.get(anchor_id, 0) for anchor_id in barrier_config['anchors'] if anchor_id.startswith('v')]
+    support_forces = [results.get(support_id, 0) for support_id in barrier_config['supports']]
+    return {
+        get_translation('user', lang): username,
+        get_translation('supports', lang): len(barrier_config['supports']),
+        get_translation('anchors', lang): len(anchor_forces),
+        get_translation('num_load_cells', lang): len(cable_forces),
+        f"{get_translation('total_anchor_force', lang)} (kN)": round(results.get('total_anchor_force', 0), 1),
+        f"{get_translation('total_support_force', lang)} (kN)": round(results.get('total_support_force', 0), 1),
+        f"{get_translation('max_anchor_force', lang)} (kN)": round(max(anchor_forces, default=0), 1),
+        f"{get_translation('max_support_force', lang)} (kN)": round(max(support_forces, default=0), 1),
+        f"{get_translation('max_cable_force', lang)} (kN)": round(max(cable_forces, default=0), 1),
+        get_translation('last_saved', lang): datetime.fromtimestamp(
+            os.path.getmtime(config_file_path(username))
+        ).strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def iter_bulk_export(usernames, lang='en'):
+    """
+    ZIP archive with the results of several saved configurations, produced in chunks.
+
+    Every configuration is read, calculated and written on its own, so only one
+    configuration and the compressed archive bytes are held at a time. The
+    archive contains a folder per user with the configuration, the force
+    results and the anchor, support and cable tables, and a summary.csv with
+    one row per configuration. Files that cannot be read are listed in the
+    summary with their error.
+
+    Args:
+        usernames: Users whose saved configurations are exported
+        lang: Language of the table headings
+
+    Yields:
+        Consecutive bytes of the ZIP archive, one chunk per configuration
+    """
+    buffer = _ChunkBuffer()
+    summary = []
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for username in usernames:
+            try:
+                barrier_config = read_barrier_config(username)
+                results = calculate_forces(barrier_config)
+            except (OSError, ValueError, KeyError) as e:
+                summary.append({
+                    get_translation('user', lang): username,
+                    get_translation('error', lang): str(e)
+                })
+                continue
+
+            _write_json(archive, f"{username}/barrier_config.json", barrier_config)
+            _write_json(archive, f"{username}/force_results.json", results)
+            _write_csv(archive, f"{username}/anchor_forces.csv", build_anchor_table(barrier_config, results, lang))
+            _write_csv(archive, f"{username}/support_forces.csv", build_support_table(barrier_config, results, lang))
+            _write_csv(archive, f"{username}/cable_forces.csv", build_cable_table(barrier_config, lang))
+            summary.append(summary_row(username, barrier_config, results, lang))
+            yield buffer.pop()
+
+        _write_csv(archive, "summary.csv", pd.DataFrame(summary).convert_dtypes())
+    yield buffer.pop()
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import streamlit as st
+from modules.cache import LRUCache
+from modules.figure_encoding import encode_figure
+
+# Figures shared by all sessions of the server process
+FIGURE_CACHE = LRUCache(maxsize=64)
+
+# Figures kept per browser session, checked before the shared cache
+SESSION_FIGURE_CACHE_SIZE = 8
+
+def figure_cache_key(barrier_config, view, lang, phi=None):
+    """
+    Stable hash of everything a barrier figure depends on.
+
+    The figures read the geometry, the cable forces and load cells and the
+    terrain inclination only, so other parameters being edited do not change
+    the key.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        view: Name of the view including its options, e.g. 'results_side'
+        lang: Display language
+        phi: Terrain inclination shown, defaults to params['phi']
+
+    Returns:
+        Hexadecimal digest string
+    """
+    if phi is None:
+        phi = barrier_config.get('params', {}).get('phi')
+
+    payload = json.dumps(
+        [
+            view, lang, phi,
+            barrier_config.get('supports', {}),
+            barrier_config.get('anchors', {}),
+            barrier_config.get('cables', {})
+        ],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def get_session_figure_cache():
+    """Figure cache of the current session, created on first use"""
+    if 'figure_cache' not in st.session_state:
+        st.session_state.figure_cache = LRUCache(maxsize=SESSION_FIGURE_CACHE_SIZE)
+    return st.session_state.figure_cache
+
+def get_cached_figure(key, build):
+    """
+    Return the figure for key from the session or the shared cache.
+
+    On a miss in both tiers build() is called and the figure is stored in both,
+    compacted with encode_figure as it is only used for display. Cached figures
+    are shared between reruns and sessions and must not be modified by the
+    caller.
+    """
+    session_cache = get_session_figure_cache()
+    fig = session_cache.get(key)
+    if fig is None:
+        fig = FIGURE_CACHE.get_or_compute(key, lambda: encode_figure(build()))
+        session_cache.put(key, fig)
+    return fig
+
+def clear_figure_caches():
+    """Drop all cached figures of the current session and the shared cache"""
+    get_session_figure_cache().invalidate()
+    FIGURE_CACHE.invalidate()
@@ -0,0 +1,250 @@
+import base64
+import json
+from collections import Counter
+import numpy as np
+import plotly.graph_objects as go
+
+# Decimal places kept for coordinates and hover values, 3 = millimetres
+COORDINATE_PRECISION = 3
+
+# Arrays shorter than this stay JSON lists, base64 only pays off for longer arrays
+TYPED_ARRAY_MIN_LENGTH = 8
+
+# float32 represents integers up to 2**24 exactly, larger scaled values keep float64
+FLOAT32_LIMIT = 2 ** 24
+
+# Trace attributes holding coordinates and mesh vertex indices
+COORDINATE_ATTRIBUTES = ('x', 'y', 'z')
+INDEX_ATTRIBUTES = ('i', 'j', 'k')
+
+# Trace attributes whose values are moved into the template when all traces of a type share them
+STYLE_ATTRIBUTES = (
+    'mode', 'line', 'marker', 'opacity', 'hoverinfo', 'hovertemplate', 'showlegend',
+    'color', 'colorscale', 'showscale', 'flatshading'
+)
+
+# Per point style arrays replaced by a single value when all points are equal
+POINT_STYLE_ATTRIBUTES = {
+    'marker': ('color', 'size', 'symbol', 'opacity'),
+    'line': ('color', 'width')
+}
+
+# Template layout sections of subplot types and the trace types drawn on them
+SUBPLOT_TRACE_TYPES = {
+    'geo': ('scattergeo', 'choropleth'),
+    'mapbox': ('scattermapbox', 'choroplethmapbox', 'densitymapbox'),
+    'polar': ('scatterpolar', 'scatterpolargl', 'barpolar'),
+    'ternary': ('scatterternary',),
+    'scene': ('scatter3d', 'mesh3d', 'surface', 'cone', 'streamtube', 'volume', 'isosurface')
+}
+
+# Annotation attributes that differ per annotation and are never shared
+ANNOTATION_DATA_ATTRIBUTES = ('x', 'y', 'text')
+
+def figure_json_size(fig):
+    """Number of bytes of the JSON sent to the browser for a figure"""
+    return len(fig.to_json(validate=False).encode('utf-8'))
+
+def encode_figure(fig, precision=COORDINATE_PRECISION):
+    """
+    Compact copy of a figure for sending to the browser.
+
+    Coordinates are rounded to the given number of decimals and longer arrays
+    are stored as float32, which plotly serializes as base64 typed arrays.
+    Style attributes that are identical for all traces of a type, and for all
+    annotations, are moved into the figure template so they are sent once.
+
+    The encoded figure looks the same in the browser, but the styles read from
+    its traces in Python are no longer complete. Encode figures only right
+    before they are displayed.
+
+    Args:
+        fig: Plotly figure, not modified
+        precision: Decimal places kept for coordinates and hover values
+
+    Returns:
+        New go.Figure
+    """
+    spec = fig.to_plotly_json()
+    layout = spec.setdefault('layout', {})
+
+    for trace in spec['data']:
+        for attribute in COORDINATE_ATTRIBUTES:
+            if attribute in trace:
+                trace[attribute] = _encode_coordinates(trace[attribute], precision)
+        for attribute in INDEX_ATTRIBUTES:
+            if attribute in trace:
+                trace[attribute] = _encode_indices(trace[attribute])
+        if 'customdata' in trace:
+            trace['customdata'] = _round_values(trace['customdata'], precision)
+        _collapse_point_styles(trace)
+
+    template = layout.get('template') or {}
+    template = {
+        'data': _share_trace_styles(spec['data'], template.get('data', {})),
+        'layout': _used_template_layout(template.get('layout', {}), spec['data'])
+    }
+    if layout.get('annotations'):
+        template['layout']['annotationdefaults'] = _share_styles(
+            layout['annotations'],
+            template['layout'].get('annotationdefaults', {}),
+            exclude=ANNOTATION_DATA_ATTRIBUTES
+        )
+    layout['template'] = template
+
+    return go.Figure(spec, skip_invalid=False)
+
+# ======= Numeric arrays =======
+
+def _decode_typed_array(values):
+    # plotly may already have packed an array as {'dtype', 'bdata', 'shape'}
+    if not (isinstance(values, dict) and 'bdata' in values):
+        return values
+    array = np.frombuffer(base64.b64decode(values['bdata']), dtype=np.dtype(values['dtype']))
+    if 'shape' in values:
+        array = array.reshape([int(size) for size in str(values['shape']).split(',')])
+    return array
+
+def _encode_coordinates(values, precision):
+    try:
+        array = np.asarray(_decode_typed_array(values), dtype=float)
+    except (TypeError, ValueError):
+        # Categorical or mixed values are left as they are
+        return values
+
+    array = np.round(array, precision)
+    if array.ndim == 1 and array.size < TYPED_ARRAY_MIN_LENGTH:
+        return [None if np.isnan(value) else value for value in array.tolist()]
+
+    finite = np.abs(array[np.isfinite(array)])
+    if finite.size == 0 or finite.max() * 10 ** precision < FLOAT32_LIMIT:
+        return array.astype(np.float32)
+    return array
+
+def _encode_indices(values):
+    array = np.asarray(_decode_typed_array(values))
+    if array.size == 0 or not np.issubdtype(array.dtype, np.integer) or array.min() < 0:
+        return values
+    return array.astype(np.uint16 if array.max() <= np.iinfo(np.uint16).max else np.uint32)
+
+def _round_values(values, precision):
+    # Hover values are nested lists mixing names, numbers and None
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    if isinstance(values, (list, tuple)):
+        return [_round_values(value, precision) for value in values]
+    if isinstance(values, (float, np.floating)):
+        return round(float(values), precision)
+    return values
+
+def _collapse_point_styles(trace):
+    for attribute, keys in POINT_STYLE_ATTRIBUTES.items():
+        style = trace.get(attribute)
+        if not isinstance(style, dict):
+            continue
+        for key in keys:
+            values = style.get(key)
+            if isinstance(values, (list, tuple, np.ndarray)) and len(values) > 0:
+                first = _dumps(values[0])
+                if all(_dumps(value) == first for value in values[1:]):
+                    style[key] = values[0].item() if hasattr(values[0], 'item') else values[0]
+
+# ======= Shared styles =======
+
+def _used_template_layout(template_layout, traces):
+    # Sections of subplot types without traces have no effect on the figure
+    trace_types = {trace.get('type', 'scatter') for trace in traces}
+    return {
+        key: value for key, value in template_layout.items()
+        if key not in SUBPLOT_TRACE_TYPES or trace_types.intersection(SUBPLOT_TRACE_TYPES[key])
+    }
+
+def _flatten(value, path=()):
+    # Map attribute paths to scalar values, lists and arrays are per point and not shared
+    if isinstance(value, dict):
+        items = {}
+        for key, item in value.items():
+            items.update(_flatten(item, path + (key,)))
+        return items
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return {}
+    return {path: value}
+
+def _style_paths(item, include=None, exclude=()):
+    keys = [key for key in item if key not in exclude and (include is None or key in include)]
+    return _flatten({key: item[key] for key in keys})
+
+def _remove_path(item, path):
+    parent = item
+    for key in path[:-1]:
+        parent = parent[key]
+    del parent[path[-1]]
+
+    # Drop dictionaries left empty, e.g. 'line' after removing its color and width
+    for depth in range(len(path) - 1, 0, -1):
+        parent = item
+        for key in path[:depth - 1]:
+            parent = parent[key]
+        if parent[path[depth - 1]]:
+            break
+        del parent[path[depth - 1]]
+
+def _dumps(value):
+    # Hashable form of a style value, numpy scalars become Python numbers
+    return json.dumps(value, sort_keys=True, default=lambda item: item.item() if hasattr(item, 'item') else str(item))
+
+def _merge(base, overrides):
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def _share_styles(items, defaults, include=None, exclude=()):
+    """
+    Move style values common to items into defaults.
+
+    A path is shared only if every item defines it, so items relying on the
+    previous default are not affected. The most frequent value becomes the new
+    default and is removed from the items having it.
+    """
+    styles = [_style_paths(item, include, exclude) for item in items]
+    if len(styles) < 2:
+        return defaults
+
+    shared = {}
+    for path in set.intersection(*(set(style) for style in styles)):
+        counts = Counter(_dumps(style[path]) for style in styles)
+        encoded, count = counts.most_common(1)[0]
+        if count < 2:
+            continue
+        value = json.loads(encoded)
+        for item, style in zip(items, styles):
+            if _dumps(style[path]) == encoded:
+                _remove_path(item, path)
+
+        target = shared
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+
+    return _merge(defaults, shared)
+
+def _share_trace_styles(traces, template_data):
+    # Template entries are kept only for trace types used by the figure
+    data = {}
+    by_type = {}
+    for trace in traces:
+        by_type.setdefault(trace.get('type', 'scatter'), []).append(trace)
+
+    for trace_type, items in by_type.items():
+        defaults = template_data.get(trace_type, [{}])
+        if len(defaults) > 1:
+            # Templates cycling through several styles cannot take shared values
+            data[trace_type] = defaults
+            continue
+        data[trace_type] = [_share_styles(items, defaults[0], include=STYLE_ATTRIBUTES)]
+
+    return data
@@ -1,44 +1,190 @@
-def calculate_forces(barrier_config):
-    """Calculate forces at each anchor and support based on measured cable forces"""
-    results = {}
-    
-    # Get safe references to configuration components
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # scipy is optional, dense matrices are used without it
+    sparse = None
+
+def build_force_index(barrier_config):
+    """
+    Index of which anchor and support every cable transfers its force to.
+
+    A cable acts on its start point if that is an anchor (support), otherwise
+    on its end point. The index only depends on the topology of the barrier.
+
+    Returns:
+        Dictionary with 'cable_ids', 'anchor_ids', 'support_ids', the per-cable
+        'cable_anchor' and 'cable_support' positions (-1 if none) and the
+        'retention_mask' of anchors counted in the total anchor force
+    """
     anchors = barrier_config.get('anchors', {})
     supports = barrier_config.get('supports', {})
     cables = barrier_config.get('cables', {})
-    
-    # Reset all anchor forces to 0
-    for anchor_id in anchors:
-        results[anchor_id] = 0.0
-    
-    # Reset all support forces to 0
-    for support_id in supports:
-        results[support_id] = 0.0
-    
-    # Iterate through cables to accumulate forces
-    for cable_id, cable in cables.items():
-        # Skip if no load cell or zero force
-        if not cable.get('has_load_cell', False) or cable.get('force', 0) == 0:
-            continue
-        
-        # Get start and end points
+
+    anchor_ids = list(anchors)
+    support_ids = list(supports)
+    anchor_position = {anchor_id: i for i, anchor_id in enumerate(anchor_ids)}
+    support_position = {support_id: i for i, support_id in enumerate(support_ids)}
+
+    cable_anchor = np.full(len(cables), -1, dtype=np.int64)
+    cable_support = np.full(len(cables), -1, dtype=np.int64)
+
+    for i, cable in enumerate(cables.values()):
         start_point = cable.get('start', '')
         end_point = cable.get('end', '')
-        
-        # Add force to anchors
-        if start_point in anchors:
-            results[start_point] += cable.get('force', 0)
-        elif end_point in anchors:
-            results[end_point] += cable.get('force', 0)
-        
-        # Add force to supports
-        if start_point in supports:
-            results[start_point] += cable.get('force', 0)
-        elif end_point in supports:
-            results[end_point] += cable.get('force', 0)
-    
+        cable_anchor[i] = anchor_position.get(start_point, anchor_position.get(end_point, -1))
+        cable_support[i] = support_position.get(start_point, support_position.get(end_point, -1))
+
+    return {
+        'cable_ids': list(cables),
+        'anchor_ids': anchor_ids,
+        'support_ids': support_ids,
+        'cable_anchor': cable_anchor,
+        'cable_support': cable_support,
+        'retention_mask': np.array([anchor_id.startswith('v') for anchor_id in anchor_ids], dtype=bool)
+    }
+
+def get_force_index(barrier_config):
+    """
+    Force index of a barrier configuration, cached on the configuration.
+
+    Configurations produced by the geometry functions (BarrierConfig) keep their
+    index until the geometry is rebuilt, which always creates a new configuration.
+    Plain dictionaries get a fresh index on every call.
+    """
+    index = getattr(barrier_config, 'force_index', None)
+    if index is not None and len(index['cable_ids']) == len(barrier_config.get('cables', {})):
+        return index
+
+    index = build_force_index(barrier_config)
+    if hasattr(barrier_config, 'force_index'):
+        barrier_config.force_index = index
+    return index
+
+def invalidate_force_index(barrier_config):
+    """Drop the cached force index, e.g. after cables were added or removed in place"""
+    if hasattr(barrier_config, 'force_index'):
+        barrier_config.force_index = None
+
+def calculate_forces(barrier_config):
+    """Calculate forces at each anchor and support based on measured cable forces"""
+    index = get_force_index(barrier_config)
+
+    # Measured force of every cable, zero without load cell
+    forces = np.array([
+        cable.get('force', 0) if cable.get('has_load_cell', False) else 0.0
+        for cable in barrier_config.get('cables', {}).values()
+    ], dtype=np.float64)
+
+    # Accumulate forces on the anchor and support each cable acts on
+    has_anchor = index['cable_anchor'] >= 0
+    anchor_forces = np.bincount(
+        index['cable_anchor'][has_anchor], weights=forces[has_anchor], minlength=len(index['anchor_ids'])
+    )
+    has_support = index['cable_support'] >= 0
+    support_forces = np.bincount(
+        index['cable_support'][has_support], weights=forces[has_support], minlength=len(index['support_ids'])
+    )
+
+    results = dict(zip(index['anchor_ids'], anchor_forces.tolist()))
+    results.update(zip(index['support_ids'], support_forces.tolist()))
+
     # Calculate total forces
-    results['total_anchor_force'] = sum(results.get(a_id, 0) for a_id in anchors if a_id.startswith('v'))
-    results['total_support_force'] = sum(results.get(s_id, 0) for s_id in supports)
-    
-    return results
\ No newline at end of file
+    results['total_anchor_force'] = float(anchor_forces[index['retention_mask']].sum())
+    results['total_support_force'] = float(support_forces.sum())
+
+    return results
+
+def build_force_incidence(barrier_config, cable_ids=None):
+    """
+    Incidence matrices mapping cable forces onto anchors and supports.
+
+    A cable contributes to its start point if that is an anchor (support),
+    otherwise to its end point, exactly like calculate_forces. Cables without
+    a load cell do not contribute.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        cable_ids: Cables in the order of the force columns, defaults to all cables
+
+    Returns:
+        Dictionary with 'cable_ids', 'anchor_ids', 'support_ids', the (cables x anchors)
+        'anchor_matrix', the (cables x supports) 'support_matrix' and the
+        'retention_mask' of anchors counted in the total anchor force
+    """
+    index = get_force_index(barrier_config)
+    cables = barrier_config.get('cables', {})
+
+    cable_ids = index['cable_ids'] if cable_ids is None else list(cable_ids)
+    position = {cable_id: i for i, cable_id in enumerate(index['cable_ids'])}
+    rows = np.array([position[cable_id] for cable_id in cable_ids], dtype=np.int64)
+    measured = np.array([cables[cable_id].get('has_load_cell', False) for cable_id in cable_ids], dtype=bool)
+
+    cable_anchor = np.where(measured, index['cable_anchor'][rows], -1)
+    cable_support = np.where(measured, index['cable_support'][rows], -1)
+
+    return {
+        'cable_ids': cable_ids,
+        'anchor_ids': index['anchor_ids'],
+        'support_ids': index['support_ids'],
+        'anchor_matrix': _incidence_matrix(cable_anchor, len(index['anchor_ids'])),
+        'support_matrix': _incidence_matrix(cable_support, len(index['support_ids'])),
+        'retention_mask': index['retention_mask']
+    }
+
+def _incidence_matrix(columns, num_columns):
+    """0/1 matrix with a one in column columns[row] of every row (none where -1), sparse if scipy is available"""
+    num_rows = len(columns)
+    rows = np.flatnonzero(columns >= 0)
+    columns = columns[rows]
+
+    if sparse is not None:
+        return sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, columns)), shape=(num_rows, num_columns)
+        )
+
+    matrix = np.zeros((num_rows, num_columns))
+    matrix[rows, columns] = 1.0
+    return matrix
+
+def _apply_incidence(forces, matrix):
+    """(T, cables) forces times a (cables, points) incidence matrix"""
+    if sparse is not None and sparse.issparse(matrix):
+        return np.asarray((matrix.T @ forces.T).T)
+    return forces @ matrix
+
+def calculate_forces_batch(barrier_config, force_matrix, cable_ids=None, incidence=None):
+    """
+    Calculate anchor and support forces for many measurement snapshots at once.
+
+    Args:
+        barrier_config: Barrier configuration dictionary (fixed topology)
+        force_matrix: (T, n_cables) array of cable forces, one row per sample
+        cable_ids: Cables in the order of the force_matrix columns, defaults to all cables
+        incidence: Precomputed result of build_force_incidence for the same cables
+
+    Returns:
+        Dictionary with 'anchor_ids', 'support_ids', the (T, n_anchors) 'anchors' and
+        (T, n_supports) 'supports' resultants and the (T,) 'total_anchor_force' and
+        'total_support_force'
+    """
+    if incidence is None:
+        incidence = build_force_incidence(barrier_config, cable_ids)
+
+    forces = np.atleast_2d(np.asarray(force_matrix, dtype=np.float64))
+    if forces.shape[1] != len(incidence['cable_ids']):
+        raise ValueError(
+            f"force_matrix has {forces.shape[1]} columns but {len(incidence['cable_ids'])} cables were given"
+        )
+
+    anchor_forces = _apply_incidence(forces, incidence['anchor_matrix'])
+    support_forces = _apply_incidence(forces, incidence['support_matrix'])
+
+    return {
+        'anchor_ids': incidence['anchor_ids'],
+        'support_ids': incidence['support_ids'],
+        'anchors': anchor_forces,
+        'supports': support_forces,
+        'total_anchor_force': anchor_forces[:, incidence['retention_mask']].sum(axis=1),
+        'total_support_force': support_forces.sum(axis=1)
+    }
@@ -1,4 +1,7 @@
 import numpy as np
+from modules.solvers import SOLVER_TOL, solve_inverse
+from modules.barrier_model import BarrierModel, get_barrier_model
+from modules.cache import LRUCache
 
 def deg_to_rad(degrees):
     """Convert degrees to radians"""
@@ -8,47 +11,153 @@ def rad_to_deg(radians):
     """Convert radians to degrees"""
     return radians * 180.0 / np.pi
 
+def _round_angles(values, decimals):
+    """Round an angle array if decimals is given"""
+    return values if decimals is None else np.round(values, decimals)
+
+def calculate_tau_batch(epsilon, h, L, f, decimals=None):
+    """
+    Vectorized tau angle (degrees) for arrays of epsilon, h, L, and f.
+
+    Inputs are broadcast against each other, so scalars and arrays can be mixed.
+
+    Args:
+        epsilon: Support inclination (degrees)
+        h: Distance between support foot and anchoring (m)
+        L: Support length (m)
+        f: Foundation overhang (m)
+        decimals: Number of decimals to round to, None keeps full precision
+
+    Returns:
+        Array of tau angles
+    """
+    epsilon_rad = deg_to_rad(np.asarray(epsilon, dtype=float))
+    tau_rad = epsilon_rad + np.arctan2(h - L * np.sin(epsilon_rad), L * np.cos(epsilon_rad) + f)
+    return _round_angles(rad_to_deg(tau_rad), decimals)
+
+def calculate_theta_batch(d, h, L, epsilon, f, decimals=None):
+    """
+    Vectorized theta angle (degrees) for arrays of d, h, L, epsilon, and f.
+
+    Args:
+        d: Distance between supports (m)
+        h: Distance between support foot and anchoring (m)
+        L: Support length (m)
+        epsilon: Support inclination (degrees)
+        f: Foundation overhang (m)
+        decimals: Number of decimals to round to, None keeps full precision
+
+    Returns:
+        Array of theta angles
+    """
+    epsilon_rad = deg_to_rad(np.asarray(epsilon, dtype=float))
+    denominator = np.hypot(h - L * np.sin(epsilon_rad), L * np.cos(epsilon_rad) + f)
+    theta_rad = np.arctan2(np.asarray(d, dtype=float) / 2, denominator)
+    return _round_angles(rad_to_deg(theta_rad), decimals)
+
+def calculate_delta_batch(L, b, decimals=None):
+    """
+    Vectorized delta angle (degrees) for arrays of L and b.
+
+    Args:
+        L: Support length (m)
+        b: Distance between edge support and anchor (m)
+        decimals: Number of decimals to round to, None keeps full precision
+
+    Returns:
+        Array of delta angles
+    """
+    delta_rad = np.arctan2(np.asarray(L, dtype=float), b)
+    return _round_angles(rad_to_deg(delta_rad), decimals)
+
+def calculate_angles_batch(epsilon, h, L, f, d, b, decimals=None):
+    """
+    Evaluate tau, theta, and delta for many parameter combinations at once.
+
+    The trigonometric terms shared by tau and theta are computed only once, so
+    this is cheaper than calling the three batch functions separately.
+
+    Args:
+        epsilon, h, L, f, d, b: Parameter values or arrays, broadcast together
+        decimals: Number of decimals to round to, None keeps full precision
+
+    Returns:
+        Dictionary with 'tau', 'theta' and 'delta' arrays
+    """
+    epsilon_rad = deg_to_rad(np.asarray(epsilon, dtype=float))
+    dz = h - L * np.sin(epsilon_rad)
+    dx = L * np.cos(epsilon_rad) + f
+
+    tau = rad_to_deg(epsilon_rad + np.arctan2(dz, dx))
+    theta = rad_to_deg(np.arctan2(np.asarray(d, dtype=float) / 2, np.hypot(dz, dx)))
+    delta = rad_to_deg(np.arctan2(np.asarray(L, dtype=float), b))
+
+    return {
+        'tau': _round_angles(tau, decimals),
+        'theta': _round_angles(theta, decimals),
+        'delta': _round_angles(delta, decimals)
+    }
+
 def calculate_tau(epsilon, h, L, f):
     """Calculate tau angle based on epsilon, h, L, and f"""
-    epsilon_rad = deg_to_rad(epsilon)
-    tau_rad = epsilon_rad + np.arctan2(h - L * np.sin(epsilon_rad), L * np.cos(epsilon_rad) + f)
-    tau_deg = rad_to_deg(tau_rad)
-    return round(tau_deg, 1)
+    return calculate_tau_batch(epsilon, h, L, f, decimals=1)[()]
 
 def calculate_theta(d, h, L, epsilon, f):
     """Calculate theta angle based on d, h, L, epsilon, and f"""
-    epsilon_rad = deg_to_rad(epsilon)
-    numerator = d / 2
-    denominator = np.sqrt((h - L * np.sin(epsilon_rad))**2 + (L * np.cos(epsilon_rad) + f)**2)
-    theta_rad = np.arctan2(numerator, denominator)
-    theta_deg = rad_to_deg(theta_rad)
-    return round(theta_deg, 1)
+    return calculate_theta_batch(d, h, L, epsilon, f, decimals=1)[()]
 
 def calculate_delta(L, b):
     """Calculate delta angle based on L and b"""
-    delta_rad = np.arctan2(L, b)
-    delta_deg = rad_to_deg(delta_rad)
-    return round(delta_deg, 1)
+    return calculate_delta_batch(L, b, decimals=1)[()]
+
+def _retention_distance(d, theta):
+    """Distance between support top and anchor that yields theta for a given d"""
+    theta_rad = deg_to_rad(theta)
+    if not 0 < theta_rad < np.pi / 2:
+        return None
+    return d / (2 * np.tan(theta_rad))
+
+def _quadratic_branches(center, radicand):
+    """Both roots center +/- sqrt(radicand), empty if the radicand is negative"""
+    if radicand < 0:
+        return ()
+    root = np.sqrt(radicand)
+    return (center + root, center - root)
+
+def solve_epsilon_from_tau(tau, h, L, f, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve epsilon (degrees) from tau, h, L, and f.
+
+    With u = tau - epsilon the tau relation reduces to
+    f*sin(u) - h*cos(u) = -L*sin(tau), which is inverted analytically.
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    tau_rad = deg_to_rad(tau)
+    R = np.hypot(h, f)
+    candidates = []
+    if R > 0:
+        ratio = -L * np.sin(tau_rad) / R
+        if abs(ratio) <= 1:
+            alpha = np.arctan2(h, f)
+            for u in (alpha + np.arcsin(ratio), alpha + np.pi - np.arcsin(ratio)):
+                # Wrap epsilon into (-180, 180] degrees
+                epsilon_rad = (tau_rad - u + np.pi) % (2 * np.pi) - np.pi
+                candidates.append(rad_to_deg(epsilon_rad))
+
+    return solve_inverse(
+        lambda eps: calculate_tau_batch(eps, h, L, f), tau, 0, 89,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
 
 def calculate_epsilon_from_tau(tau, h, L, f):
     """Calculate epsilon based on tau, h, L, and f"""
-    tau_rad = deg_to_rad(tau)
-    
-    # Use a numerical approach with 1000 test points
-    epsilon_range = np.linspace(0, 89, 1000)  # Avoid 90 degrees
-    min_error = float('inf')
-    best_epsilon = 10.0  # Default
-    
-    for eps in epsilon_range:
-        eps_rad = deg_to_rad(eps)
-        calculated_tau_rad = eps_rad + np.arctan2(h - L * np.sin(eps_rad), L * np.cos(eps_rad) + f)
-        error = abs(calculated_tau_rad - tau_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_epsilon = eps
-    
-    return round(best_epsilon, 1)
+    return round(solve_epsilon_from_tau(tau, h, L, f)['value'], 1)
 
 def calculate_d_from_theta(theta, h, L, epsilon, f):
     """Calculate d based on theta, h, L, epsilon, and f"""
@@ -108,125 +217,259 @@ def calculate_f_from_tau_epsilon_h_L(tau, epsilon, h, L):
     
     return round(max(0.1, f), 1)  # Ensure f is at least 0.1
 
+def solve_L_from_tau_epsilon_h_f(tau, epsilon, h, f, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve L (m) from tau, epsilon, h, and f.
+
+    The tau relation is linear in L: L*sin(tau) = h*cos(u) - f*sin(u) with u = tau - epsilon.
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    tau_rad = deg_to_rad(tau)
+    u = tau_rad - deg_to_rad(epsilon)
+    candidates = []
+    if abs(np.sin(tau_rad)) > 1e-12:
+        candidates.append((h * np.cos(u) - f * np.sin(u)) / np.sin(tau_rad))
+
+    return solve_inverse(
+        lambda L: calculate_tau_batch(epsilon, h, L, f), tau, 0.5, 20,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
+
 def calculate_L_from_tau_epsilon_h_f(tau, epsilon, h, f):
     """Calculate L based on tau, epsilon, h, and f"""
-    tau_rad = deg_to_rad(tau)
-    epsilon_rad = deg_to_rad(epsilon)
-    
-    # Use numerical approach with 1000 test points
-    L_range = np.linspace(0.5, 20, 1000)  # Reasonable L range
-    min_error = float('inf')
-    best_L = 5.0  # Default
-    
-    for L_test in L_range:
-        calculated_tau_rad = epsilon_rad + np.arctan2(
-            h - L_test * np.sin(epsilon_rad), 
-            L_test * np.cos(epsilon_rad) + f
-        )
-        error = abs(calculated_tau_rad - tau_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_L = L_test
-    
-    return round(best_L, 1)
+    return round(solve_L_from_tau_epsilon_h_f(tau, epsilon, h, f)['value'], 1)
+
+def solve_epsilon_from_theta_d_h_L_f(theta, d, h, L, f, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve epsilon (degrees) from theta, d, h, L, and f.
+
+    The theta relation fixes the support top to anchor distance D, which gives
+    f*cos(epsilon) - h*sin(epsilon) = (D^2 - h^2 - f^2 - L^2) / (2L).
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    D = _retention_distance(d, theta)
+    R = np.hypot(h, f)
+    candidates = []
+    if D is not None and R > 0 and L > 0:
+        ratio = (D**2 - h**2 - f**2 - L**2) / (2 * L * R)
+        if abs(ratio) <= 1:
+            beta = np.arctan2(h, f)
+            for sign in (1, -1):
+                candidates.append(rad_to_deg(sign * np.arccos(ratio) - beta))
+
+    return solve_inverse(
+        lambda eps: calculate_theta_batch(d, h, L, eps, f), theta, 0, 89,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
 
 def calculate_epsilon_from_theta_d_h_L_f(theta, d, h, L, f):
-    """Calculate epsilon based on theta, d, h, L, and f using numerical approach"""
-    theta_rad = deg_to_rad(theta)
-    
-    # Use numerical approach with 1000 test points
-    epsilon_range = np.linspace(0, 89, 1000)  # Avoid 90 degrees
-    min_error = float('inf')
-    best_epsilon = 10.0  # Default
-    
-    for eps in epsilon_range:
-        eps_rad = deg_to_rad(eps)
-        
-        # Compute the denominator using the current epsilon value
-        denominator = np.sqrt((h - L * np.sin(eps_rad))**2 + (L * np.cos(eps_rad) + f)**2)
-        
-        # Calculate theta for this epsilon
-        calculated_theta_rad = np.arctan2(d/2, denominator)
-        error = abs(calculated_theta_rad - theta_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_epsilon = eps
-    
-    return round(best_epsilon, 1)
+    """Calculate epsilon based on theta, d, h, L, and f"""
+    return round(solve_epsilon_from_theta_d_h_L_f(theta, d, h, L, f)['value'], 1)
+
+def solve_h_from_theta_d_L_epsilon_f(theta, d, L, epsilon, f, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve h (m) from theta, d, L, epsilon, and f.
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    epsilon_rad = deg_to_rad(epsilon)
+    D = _retention_distance(d, theta)
+    candidates = ()
+    if D is not None:
+        candidates = _quadratic_branches(L * np.sin(epsilon_rad), D**2 - (L * np.cos(epsilon_rad) + f)**2)
+
+    return solve_inverse(
+        lambda h: calculate_theta_batch(d, h, L, epsilon, f), theta, 0.5, 30,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
 
 def calculate_h_from_theta_d_L_epsilon_f(theta, d, L, epsilon, f):
     """Calculate h based on theta, d, L, epsilon, and f"""
-    theta_rad = deg_to_rad(theta)
+    return round(solve_h_from_theta_d_L_epsilon_f(theta, d, L, epsilon, f)['value'], 1)
+
+def solve_f_from_theta_d_h_L_epsilon(theta, d, h, L, epsilon, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve f (m) from theta, d, h, L, and epsilon.
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
     epsilon_rad = deg_to_rad(epsilon)
-    
-    # Use numerical approach with 1000 test points
-    h_range = np.linspace(0.5, 30, 1000)  # Reasonable h range
-    min_error = float('inf')
-    best_h = 6.0  # Default
-    
-    for h_test in h_range:
-        # Compute denominator with the current h value
-        denominator = np.sqrt((h_test - L * np.sin(epsilon_rad))**2 + (L * np.cos(epsilon_rad) + f)**2)
-        
-        # Calculate theta for this h
-        calculated_theta_rad = np.arctan2(d/2, denominator)
-        error = abs(calculated_theta_rad - theta_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_h = h_test
-    
-    return round(best_h, 1)
+    D = _retention_distance(d, theta)
+    candidates = ()
+    if D is not None:
+        candidates = _quadratic_branches(-L * np.cos(epsilon_rad), D**2 - (h - L * np.sin(epsilon_rad))**2)
+
+    return solve_inverse(
+        lambda f: calculate_theta_batch(d, h, L, epsilon, f), theta, 0.1, 10,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
 
 def calculate_f_from_theta_d_h_L_epsilon(theta, d, h, L, epsilon):
     """Calculate f based on theta, d, h, L, and epsilon"""
-    theta_rad = deg_to_rad(theta)
+    return round(solve_f_from_theta_d_h_L_epsilon(theta, d, h, L, epsilon)['value'], 1)
+
+def solve_L_from_theta_d_h_epsilon_f(theta, d, h, epsilon, f, tol=SOLVER_TOL, prefer=None):
+    """
+    Solve L (m) from theta, d, h, epsilon, and f.
+
+    The theta relation is quadratic in L:
+    L^2 + 2L*(f*cos(epsilon) - h*sin(epsilon)) + h^2 + f^2 - D^2 = 0.
+
+    Args:
+        tol: Absolute tolerance of the solution
+        prefer: Optional value used to pick among several valid solutions
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
     epsilon_rad = deg_to_rad(epsilon)
-    
-    # Use numerical approach with 1000 test points
-    f_range = np.linspace(0.1, 10, 1000)  # Reasonable f range
-    min_error = float('inf')
-    best_f = 0.5  # Default
-    
-    for f_test in f_range:
-        # Compute denominator with the current f value
-        denominator = np.sqrt((h - L * np.sin(epsilon_rad))**2 + (L * np.cos(epsilon_rad) + f_test)**2)
-        
-        # Calculate theta for this f
-        calculated_theta_rad = np.arctan2(d/2, denominator)
-        error = abs(calculated_theta_rad - theta_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_f = f_test
-    
-    return round(best_f, 1)
+    D = _retention_distance(d, theta)
+    candidates = ()
+    if D is not None:
+        p = f * np.cos(epsilon_rad) - h * np.sin(epsilon_rad)
+        candidates = _quadratic_branches(-p, p**2 - (h**2 + f**2 - D**2))
+
+    return solve_inverse(
+        lambda L: calculate_theta_batch(d, h, L, epsilon, f), theta, 0.5, 20,
+        candidates=candidates, tol=tol, prefer=prefer
+    )
 
 def calculate_L_from_theta_d_h_epsilon_f(theta, d, h, epsilon, f):
     """Calculate L based on theta, d, h, epsilon, and f"""
-    theta_rad = deg_to_rad(theta)
-    epsilon_rad = deg_to_rad(epsilon)
-    
-    # Use numerical approach with 1000 test points
-    L_range = np.linspace(0.5, 20, 1000)  # Reasonable L range
-    min_error = float('inf')
-    best_L = 5.0  # Default
-    
-    for L_test in L_range:
-        # Compute denominator with the current L value
-        denominator = np.sqrt((h - L_test * np.sin(epsilon_rad))**2 + (L_test * np.cos(epsilon_rad) + f)**2)
-        
-        # Calculate theta for this L
-        calculated_theta_rad = np.arctan2(d/2, denominator)
-        error = abs(calculated_theta_rad - theta_rad)
-        
-        if error < min_error:
-            min_error = error
-            best_L = L_test
-    
-    return round(best_L, 1)
+    return round(solve_L_from_theta_d_h_epsilon_f(theta, d, h, epsilon, f)['value'], 1)
+
+# Derived angles and the input parameters they are calculated from
+PARAMETER_DEPENDENCIES = {
+    'tau': ('epsilon', 'h', 'L', 'f'),
+    'theta': ('d', 'h', 'L', 'epsilon', 'f'),
+    'delta': ('L', 'b'),
+}
+
+# Input parameter that is solved for when a derived angle is edited directly
+INVERSE_PARAMETERS = {
+    'theta': 'd',
+    'tau': 'epsilon',
+    'delta': 'b',
+}
+
+# Values used for parameters missing from a parameter dictionary
+PARAMETER_FALLBACKS = {
+    'epsilon': 10.0, 'h': 6.0, 'L': 5.0, 'f': 0.5, 'd': 10.0, 'b': 8.0,
+    'tau': 0.0, 'theta': 0.0, 'delta': 0.0, 'phi': 15.0
+}
+
+def _topological_order(dependencies):
+    """Order the nodes of a dependency graph so that every node follows its inputs"""
+    order = []
+    remaining = {node: set(inputs) for node, inputs in dependencies.items()}
+    resolved = {i for inputs in dependencies.values() for i in inputs} - set(dependencies)
+    order.extend(sorted(resolved))
+
+    while remaining:
+        ready = sorted(node for node, inputs in remaining.items() if inputs <= resolved)
+        if not ready:
+            raise ValueError("Parameter dependencies contain a cycle")
+        for node in ready:
+            del remaining[node]
+        resolved.update(ready)
+        order.extend(ready)
+
+    return order
+
+PARAMETER_ORDER = _topological_order(PARAMETER_DEPENDENCIES)
+
+def _calculate_derived(name, p):
+    """Recalculate one derived angle from the parameter values p"""
+    if name == 'tau':
+        return calculate_tau(p['epsilon'], p['h'], p['L'], p['f'])
+    if name == 'theta':
+        return calculate_theta(p['d'], p['h'], p['L'], p['epsilon'], p['f'])
+    return calculate_delta(p['L'], p['b'])
+
+def _solve_inverse_parameter(name, value, p):
+    """Solve the input parameter driven by the derived angle name for the given value"""
+    if name == 'theta':
+        return calculate_d_from_theta(value, p['h'], p['L'], p['epsilon'], p['f'])
+    if name == 'tau':
+        # Stay on the solution branch closest to the current inclination
+        solution = solve_epsilon_from_tau(value, p['h'], p['L'], p['f'], prefer=p['epsilon'])
+        return round(solution['value'], 1)
+    return calculate_b_from_delta(value, p['L'])
+
+def propagate_parameter_change(params, changed_param=None, new_value=None):
+    """
+    Update the changed parameter and recompute only the parameters that depend on it.
+
+    Derived angles are recomputed in topological order of PARAMETER_DEPENDENCIES
+    when at least one of their inputs changed. Editing a derived angle solves
+    its input given by INVERSE_PARAMETERS and keeps the edited angle fixed.
+    Without a changed parameter all derived angles are recomputed.
+
+    Args:
+        params: Dictionary of current parameter values
+        changed_param: Name of the parameter that was changed
+        new_value: New value for the changed parameter
+
+    Returns:
+        Tuple of the updated parameters dictionary and the list of parameters
+        whose value changed
+    """
+    updated_params = params.copy()
+    values = {name: updated_params.get(name, fallback) for name, fallback in PARAMETER_FALLBACKS.items()}
+
+    touched = []
+    pinned = set()
+
+    if changed_param and new_value is not None:
+        updated_params[changed_param] = new_value
+        values[changed_param] = new_value
+        touched.append(changed_param)
+
+        if changed_param in INVERSE_PARAMETERS:
+            source = INVERSE_PARAMETERS[changed_param]
+            values[source] = updated_params[source] = _solve_inverse_parameter(changed_param, new_value, values)
+            touched.append(source)
+            pinned.add(changed_param)
+        dirty = set(touched)
+    else:
+        # No parameter was changed, calculate all dependent values
+        dirty = set(PARAMETER_ORDER)
+
+    for name in PARAMETER_ORDER:
+        inputs = PARAMETER_DEPENDENCIES.get(name)
+        if inputs and name not in pinned and dirty.intersection(inputs):
+            values[name] = updated_params[name] = _calculate_derived(name, values)
+            dirty.add(name)
+            touched.append(name)
+
+    changed_params = [
+        name for name in touched
+        if name in params and updated_params[name] != params[name]
+    ]
+
+    return updated_params, changed_params
 
 def recalculate_parameters(params, changed_param=None, new_value=None):
     """
@@ -240,100 +483,23 @@ def recalculate_parameters(params, changed_param=None, new_value=None):
     Returns:
         Updated parameters dictionary
     """
-    # Create a copy of the parameters
-    updated_params = params.copy()
-    
-    # Update the changed parameter if provided
-    if changed_param and new_value is not None:
-        updated_params[changed_param] = new_value
-    
-    # Extract parameters for easier reference
-    epsilon = updated_params.get('epsilon', 10.0)
-    h = updated_params.get('h', 6.0)
-    L = updated_params.get('L', 5.0)
-    f = updated_params.get('f', 0.5)
-    d = updated_params.get('d', 10.0)
-    b = updated_params.get('b', 8.0)
-    tau = updated_params.get('tau', 0.0)
-    theta = updated_params.get('theta', 0.0)
-    delta = updated_params.get('delta', 0.0)
-    phi = updated_params.get('phi', 15.0)
-    
-    # Define which parameter was changed and update dependencies accordingly
-    if changed_param == 'theta':
-        updated_params['d'] = calculate_d_from_theta(
-            new_value, h, L, epsilon, f
-        )
-        
-    elif changed_param == 'tau':
-        updated_params['epsilon'] = calculate_epsilon_from_tau(
-            new_value, h, L, f
-        )
-        updated_params['theta'] = calculate_theta(
-            updated_params['d'], h, L, updated_params['epsilon'], f
-        )
-        
-    elif changed_param == 'delta':
-        updated_params['b'] = calculate_b_from_delta(
-            new_value, L
-        )
-        
-    elif changed_param == 'epsilon':
-        updated_params['tau'] = calculate_tau(
-            new_value, h, L, f
-        )
-        updated_params['theta'] = calculate_theta(
-            d, h, L, new_value, f
-        )
-        
-    elif changed_param == 'd':
-        updated_params['theta'] = calculate_theta(
-            new_value, h, L, epsilon, f
-        )
-        
-    elif changed_param == 'b':
-        updated_params['delta'] = calculate_delta(
-            L, new_value
-        )
-        
-    elif changed_param == 'L':
-        updated_params['tau'] = calculate_tau(
-            epsilon, h, new_value, f
-        )
-        updated_params['theta'] = calculate_theta(
-            d, h, new_value, epsilon, f
-        )
-        updated_params['delta'] = calculate_delta(
-            new_value, b
-        )
-        
-    elif changed_param == 'h':
-        updated_params['tau'] = calculate_tau(
-            epsilon, new_value, L, f
-        )
-        updated_params['theta'] = calculate_theta(
-            d, new_value, L, epsilon, f
-        )
-        
-    elif changed_param == 'f':
-        updated_params['tau'] = calculate_tau(
-            epsilon, h, L, new_value
-        )
-        updated_params['theta'] = calculate_theta(
-            d, h, L, epsilon, new_value
-        )
-
-    elif changed_param == 'phi':
-        pass
-    
-    # If no parameter was changed, calculate all dependent values
-    else:
-        updated_params['tau'] = calculate_tau(epsilon, h, L, f)
-        updated_params['theta'] = calculate_theta(d, h, L, epsilon, f)
-        updated_params['delta'] = calculate_delta(L, b)
-    
+    updated_params, _ = propagate_parameter_change(params, changed_param, new_value)
     return updated_params
 
+# Acceptable ranges for parameters
+PARAM_LIMITS = {
+    'epsilon': (0, 80),    # Support inclination (degrees)
+    'h': (0.5, 30),        # Distance between support foot and anchoring (m)
+    'L': (1, 20),          # Support length (m)
+    'f': (0.1, 10),        # Foundation overhang (m)
+    'd': (1, 50),          # Distance between supports (m)
+    'b': (0.5, 50),        # Distance between edge support and anchor (m)
+    'delta': (0, 89),      # Angle between horizontal and upper support beam (degrees)
+    'theta': (0, 89),      # Angle between vertical and retaining cable (degrees)
+    'tau': (0, 89),        # Angle between support axis and retaining cable axis (degrees)
+    'phi': (0, 90),
+}
+
 def validate_parameter_limits(params, param_name=None):
     """
     Validate that parameters are within acceptable ranges.
@@ -345,28 +511,14 @@ def validate_parameter_limits(params, param_name=None):
     Returns:
         Dictionary with validation results
     """
-    # Define acceptable ranges for parameters
-    param_limits = {
-        'epsilon': (0, 80),    # Support inclination (degrees)
-        'h': (0.5, 30),        # Distance between support foot and anchoring (m)
-        'L': (1, 20),          # Support length (m)
-        'f': (0.1, 10),        # Foundation overhang (m)
-        'd': (1, 50),          # Distance between supports (m)
-        'b': (0.5, 50),        # Distance between edge support and anchor (m)
-        'delta': (0, 89),      # Angle between horizontal and upper support beam (degrees)
-        'theta': (0, 89),      # Angle between vertical and retaining cable (degrees)
-        'tau': (0, 89),        # Angle between support axis and retaining cable axis (degrees)
-        'phi': (0, 90),
-    }
-    
     validation_results = {}
     
     # Check specific parameter or all parameters
-    params_to_check = [param_name] if param_name else param_limits.keys()
+    params_to_check = [param_name] if param_name else PARAM_LIMITS.keys()
     
     for param in params_to_check:
-        if param in params and param in param_limits:
-            min_val, max_val = param_limits[param]
+        if param in params and param in PARAM_LIMITS:
+            min_val, max_val = PARAM_LIMITS[param]
             value = params[param]
             
             # Check if parameter is within limits
@@ -389,6 +541,26 @@ def validate_parameter_limits(params, param_name=None):
     
     return validation_results
 
+def validate_parameter_limits_batch(columns):
+    """
+    Vectorized limit check for arrays of parameter values.
+
+    Args:
+        columns: Dictionary of parameter name to value array
+
+    Returns:
+        Dictionary of parameter name to boolean array (True where within limits)
+    """
+    validation_results = {}
+
+    for param, values in columns.items():
+        if param in PARAM_LIMITS:
+            min_val, max_val = PARAM_LIMITS[param]
+            values = np.asarray(values)
+            validation_results[param] = (values >= min_val) & (values <= max_val)
+
+    return validation_results
+
 def update_parameter(params, param_name, new_value):
     """
     Update a single parameter and recalculate all dependent parameters.
@@ -402,19 +574,8 @@ def update_parameter(params, param_name, new_value):
     Returns:
         Updated parameters dictionary and list of parameters that changed
     """
-    # Store original values to track changes
-    original_values = params.copy()
-    
-    # Call recalculate_parameters to update all dependent parameters
-    updated_params = recalculate_parameters(params, param_name, new_value)
-    
-    # Track which parameters changed (for UI highlighting/updates)
-    changed_params = []
-    for key in updated_params:
-        if key in original_values and updated_params[key] != original_values[key]:
-            changed_params.append(key)
-    
-    return updated_params, changed_params
+    # Only the parameters reached through the dependency graph can change
+    return propagate_parameter_change(params, param_name, new_value)
 
 def apply_parameter_changes(params, param_name, new_value):
     """
@@ -473,6 +634,48 @@ def apply_parameter_changes(params, param_name, new_value):
     
     return updated_params, changed_params, full_validation, warnings
 
+# Memoized results of apply_parameter_changes, see apply_parameter_changes_cached
+PARAMETER_CACHE = LRUCache(maxsize=256)
+
+def _parameter_cache_key(params, param_name, new_value):
+    """Hashable key of a parameter change: (changed param, new value, frozen input params)"""
+    return (param_name, new_value, tuple(sorted(params.items())))
+
+def apply_parameter_changes_cached(params, param_name, new_value, cache=PARAMETER_CACHE):
+    """
+    Memoized version of apply_parameter_changes.
+
+    Users often toggle back and forth between the same values, repeated edits
+    are answered from a bounded LRU cache keyed on the change and the full
+    input parameters. Results are copied so callers can modify them freely.
+
+    Args:
+        params: Current parameter values
+        param_name: Name of parameter being changed
+        new_value: New value for the parameter
+        cache: LRUCache holding the results
+
+    Returns:
+        Same tuple as apply_parameter_changes
+    """
+    try:
+        key = _parameter_cache_key(params, param_name, new_value)
+        hash(key)
+    except TypeError:
+        # Unhashable parameter values can't be memoized
+        return apply_parameter_changes(params, param_name, new_value)
+
+    updated_params, changed_params, validation, warnings = cache.get_or_compute(
+        key, lambda: apply_parameter_changes(params, param_name, new_value)
+    )
+
+    return (
+        dict(updated_params),
+        list(changed_params),
+        {param: dict(result) for param, result in validation.items()},
+        list(warnings)
+    )
+
 def get_default_params():
     """Return default parameter values with calculated angles"""
     base_params = {
@@ -516,481 +719,259 @@ def get_default_params():
     
     return base_params
 
-# Keep the existing calculate_3d_coordinates function
-def calculate_3d_coordinates(params):
+# Anchors at both ends of the barrier: (id, name)
+END_ANCHORS = (
+    ('tso1_anchor', 'Tso1 Anchor'),
+    ('tso2_anchor', 'Tso2 Anchor'),
+    ('tsu1_anchor', 'Tsu1 Anchor'),
+    ('tsu2_anchor', 'Tsu2 Anchor'),
+    ('sa1_anchor', 'Sa1 Anchor'),
+    ('sa2_anchor', 'Sa2 Anchor')
+)
+
+# Node groups of the barrier model and the parameters their coordinates depend on
+GEOMETRY_DEPENDENCIES = {
+    'support_bases': ('d',),
+    'support_tops': ('d', 'L', 'epsilon', 'phi'),
+    'support_mids': ('d', 'L', 'epsilon', 'phi'),
+    'retention_anchors': ('d', 'h', 'phi'),
+    'end_anchors': ('b', 'd'),
+}
+
+# Parameters that change the barrier topology and require a full rebuild
+TOPOLOGY_PARAMETERS = ('num_supports',)
+
+def node_group_slices(num_supports):
     """
-    Calculate 3D coordinates for all components of the rockfall barrier
-    based on the geometric parameters.
+    Rows of each node group in the node array of a model with num_supports supports.
+
+    Node layout for n supports: bases [0, n), tops [n, 2n), mid-points [2n, 3n),
+    retention anchors V1..Vn+1 [3n, 4n+1) followed by the END_ANCHORS.
+    """
+    n = num_supports
+    return {
+        'support_bases': slice(0, n),
+        'support_tops': slice(n, 2 * n),
+        'support_mids': slice(2 * n, 3 * n),
+        'retention_anchors': slice(3 * n, 4 * n + 1),
+        'end_anchors': slice(4 * n + 1, 4 * n + 1 + len(END_ANCHORS)),
+    }
+
+def calculate_node_group(group, params):
+    """
+    Coordinates of one node group (see GEOMETRY_DEPENDENCIES) as an (k, 3) array.
     """
-    b = params['b']
+    n = params['num_supports']
     d = params['d']
-    f = params['f']
-    h = params['h']
-    L = params['L']
-    
-    theta = deg_to_rad(params['theta'])
-    delta = deg_to_rad(params['delta'])
-    delta1 = deg_to_rad(params['delta1']) if params['has_delta1'] else None
-    delta2 = deg_to_rad(params['delta2']) if params['has_delta2'] else None
-    epsilon = deg_to_rad(params['epsilon'])  
-    tau = deg_to_rad(params['tau'])
-    phi = deg_to_rad(params['phi'])
-    
-    # Number of field sections (supports minus 1)
-    num_fields = params['num_supports'] - 1
-    
+
     # Total barrier length
-    total_length = (num_fields * d)
-    
-    # Initialize dictionaries to store coordinates
-    supports = {}
-    anchors = {}
-    cables = {}
-    
-    # Calculate terrain height at each position based on inclination
-    def terrain_height(x):
-        return x * np.tan(phi)
+    total_length = (n - 1) * d
 
 # ======= SUPPORTS =======
 
-    # Calculate support positions and orientations
-    for i in range(params['num_supports']):
-        # Support base position (x, y, z)
-        # Posts are placed along the y-axis with x=0
-        x = 0
-        y = i * d
-        z = 0
-        
-        # Step 1: Calculate direction vector for support considering both inclinations
-        # Normal to terrain is (-sin(phi), 0, cos(phi))
-        # Rotate this normal by epsilon in the x-z plane
+    # Posts are placed along the y-axis with x=0
+    if group == 'support_bases':
+        nodes = np.zeros((n, 3))
+        nodes[:, 1] = np.arange(n) * d
+        return nodes
+
+    if group in ('support_tops', 'support_mids'):
+        epsilon = deg_to_rad(params['epsilon'])
+        phi = deg_to_rad(params['phi'])
+
+        # Normal to terrain is (-sin(phi), 0, cos(phi)), rotated by epsilon in the x-z plane
         normal_x = -np.sin(phi)
         normal_z = np.cos(phi)
-        
-        # Apply rotation by epsilon around y-axis to the normal vector
-        # This gives the direction of the support
-        support_dir_x = normal_x * np.cos(epsilon) - normal_z * np.sin(epsilon)
-        support_dir_z = normal_x * np.sin(epsilon) + normal_z * np.cos(epsilon)
-        
-        # Normalize the direction vector
-        dir_length = np.sqrt(support_dir_x**2 + support_dir_z**2)
-        support_dir_x /= dir_length
-        support_dir_z /= dir_length
-        
-        # Calculate top position using the normalized direction
-        top_x = x + L * support_dir_x
-        top_y = y  # y-coordinate remains the same
-        top_z = z + L * support_dir_z
-        
-        supports[f's{i+1}'] = {
-            'base': {'x': x, 'y': y, 'z': z},
-            'top': {'x': top_x, 'y': top_y, 'z': top_z},
-            'length': L,
-            'name': f'S{i+1}'
-        }
+        support_dir = np.array([
+            normal_x * np.cos(epsilon) - normal_z * np.sin(epsilon),
+            0.0,
+            normal_x * np.sin(epsilon) + normal_z * np.cos(epsilon)
+        ])
+        support_dir /= np.sqrt(support_dir[0]**2 + support_dir[2]**2)
+
+        nodes = np.empty((n, 3))
+        nodes[:] = params['L'] * support_dir
+        if group == 'support_mids':
+            # Intermediate position for the catching cables (50% height)
+            nodes /= 2
+        nodes[:, 1] = np.arange(n) * d
+        return nodes
 
 # ======= ANCHORS =======
 
-    # Calculate position for retention cable anchors
-    num_anchors = params['num_supports'] + 1
-    for i in range(num_anchors):
-        if i == 0:  # First anchor
-            y = -d/2
-        elif i == num_anchors-1:  # Last anchor
-            y = total_length + d/2
-        else:
-            y = (i-1) * d + d/2
-        
-        x = np.cos(phi) * h
-        z = np.sin(phi) * h
-
-        anchors[f'v{i+1}'] = {
-            'position': {'x': x, 'y': y, 'z': z},
-            'name': f'V{i+1}'
-        }
-
-    # Calculate positions for upper support cable anchors
-    anchors['tso1_anchor'] = {
-        'position': {'x': 0, 'y': -b, 'z': 0},
-        'name': 'Tso1 Anchor'
-    }
+    if group == 'retention_anchors':
+        phi = deg_to_rad(params['phi'])
+        h = params['h']
+
+        # Halfway between supports and d/2 beyond both ends
+        anchor_y = (np.arange(n + 1) - 1) * d + d/2
+        anchor_y[0] = -d/2
+        anchor_y[n] = total_length + d/2
+
+        nodes = np.empty((n + 1, 3))
+        nodes[:] = (np.cos(phi) * h, 0, np.sin(phi) * h)
+        nodes[:, 1] = anchor_y
+        return nodes
+
+    if group == 'end_anchors':
+        b = params['b']
+
+        # Upper support cable, lower support cable and lateral bracing anchors
+        nodes = np.zeros((len(END_ANCHORS), 3))
+        nodes[:, 1] = (
+            -b,                          # tso1_anchor
+            total_length + b,            # tso2_anchor
+            -b + 1.5,                    # tsu1_anchor
+            total_length + b - 1.5,      # tsu2_anchor
+            -b,                          # sa1_anchor
+            total_length + b             # sa2_anchor
+        )
+        return nodes
 
-    anchors['tso2_anchor'] = {
-        'position': {'x': 0, 'y': total_length + b, 'z': 0},
-        'name': 'Tso2 Anchor'
-    }
+    raise ValueError(f"Unknown node group: {group}")
 
-    # Calculate positions for lower support cable anchors (closer to supports)
-    anchors['tsu1_anchor'] = {
-        'position': {'x': 0, 'y': -b + 1.5, 'z': 0},
-        'name': 'Tsu1 Anchor'
-    }
+def build_barrier_model(params):
+    """
+    Calculate the array-backed model of the rockfall barrier
+    based on the geometric parameters.
+    """
+    n = params['num_supports']
 
-    anchors['tsu2_anchor'] = {
-        'position': {'x': 0, 'y': total_length + b - 1.5, 'z': 0},
-        'name': 'Tsu2 Anchor'
-    }
-    
-    # Calculate positions for lateral bracing anchors (seitliche Abspannung)
-    anchors['sa1_anchor'] = {
-        'position': {'x': 0, 'y': -b, 'z': 0},
-        'name': 'Sa1 Anchor'
-    }
-    
-    anchors['sa2_anchor'] = {
-        'position': {'x': 0, 'y': total_length + b, 'z': 0},
-        'name': 'Sa2 Anchor'
-    }
+    groups = node_group_slices(n)
+    nodes = np.empty((groups['end_anchors'].stop, 3))
+    for group, rows in groups.items():
+        nodes[rows] = calculate_node_group(group, params)
 
-# ======= CABLES =======
+    base = groups['support_bases'].start
+    top = groups['support_tops'].start
+    mid = groups['support_mids'].start
+    v = groups['retention_anchors'].start
+    end_anchor = {anchor_id: groups['end_anchors'].start + k for k, (anchor_id, _) in enumerate(END_ANCHORS)}
+    support_index = np.arange(n)
 
-## RETENTION CABLES (Rückhalteseile)
-    for i in range(params['num_supports']):
-        cable_id = f'rhs{i+1}'
-        support_id = f's{i+1}'
-        
-        if i == 0:  # First support connects to first anchor
-            anchor_id = 'v1'
-        else:
-            anchor_id = f'v{i+1}'
-        
-        cables[cable_id] = {
-            'start': support_id,
-            'end': anchor_id,
-            'type': 'rhs',
-            'name': f'Rhs {i+1}',
-            'force': 0.0,
-            'has_load_cell': True,
-            'color': 'green',
-            'start_coords': {
-                'x': supports[support_id]['top']['x'],
-                'y': supports[support_id]['top']['y'],
-                'z': supports[support_id]['top']['z']
-            },
-            'end_coords': {
-                'x': anchors[anchor_id]['position']['x'],
-                'y': anchors[anchor_id]['position']['y'],
-                'z': anchors[anchor_id]['position']['z']
-            }
-        }
-        
-    # Next retention cables
-    for i in range(params['num_supports']):
-        cable_id = f'rhs{i+params["num_supports"]+1}'
-        support_id = f's{i+1}'
-        
-        if i == params['num_supports']-1:  # Last support connects to last anchor
-            anchor_id = f'v{params["num_supports"]+1}'
-        else:
-            anchor_id = f'v{i+2}'
-        
-        cables[cable_id] = {
-            'start': support_id,
-            'end': anchor_id,
-            'type': 'rhs',
-            'name': f'Rhs {i+params["num_supports"]+1}',
-            'force': 0.0,
-            'has_load_cell': True,
-            'color': 'green',
-            'start_coords': {
-                'x': supports[support_id]['top']['x'],
-                'y': supports[support_id]['top']['y'],
-                'z': supports[support_id]['top']['z']
-            },
-            'end_coords': {
-                'x': anchors[anchor_id]['position']['x'],
-                'y': anchors[anchor_id]['position']['y'],
-                'z': anchors[anchor_id]['position']['z']
-            }
-        }
-    
-## UPPER SUPPORT CABLES (Tragseil oben)
-    # First segment: First anchor to first support top
-    cables['tso_a1s1'] = {
-        'start': 'tso1_anchor',
-        'end': 's1',
-        'type': 'tso',
-        'name': 'Tso A1-S1',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'red',
-        'start_coords': {
-            'x': anchors['tso1_anchor']['position']['x'],
-            'y': anchors['tso1_anchor']['position']['y'],
-            'z': anchors['tso1_anchor']['position']['z']
-        },
-        'end_coords': {
-            'x': supports['s1']['top']['x'],
-            'y': supports['s1']['top']['y'],
-            'z': supports['s1']['top']['z']
-        }
-    }
+    support_ids = [f's{i+1}' for i in range(n)]
+    anchor_ids = [f'v{i+1}' for i in range(n + 1)] + [anchor_id for anchor_id, _ in END_ANCHORS]
+    node_element = support_ids * 3 + anchor_ids
+    node_point = ['base'] * n + ['top'] * n + ['mid'] * n + ['position'] * len(anchor_ids)
 
-    # Middle segments: Support top to next support top
-    for i in range(1, params['num_supports']):
-        start_id = f's{i}'
-        end_id = f's{i+1}'
-        cable_id = f'tso_s{i}s{i+1}'
-        
-        cables[cable_id] = {
-            'start': start_id,
-            'end': end_id,
-            'type': 'tso',
-            'name': f'Tso S{i}-S{i+1}',
-            'force': 0.0,
-            'has_load_cell': False,
-            'color': 'red',
-            'start_coords': {
-                'x': supports[start_id]['top']['x'],
-                'y': supports[start_id]['top']['y'],
-                'z': supports[start_id]['top']['z']
-            },
-            'end_coords': {
-                'x': supports[end_id]['top']['x'],
-                'y': supports[end_id]['top']['y'],
-                'z': supports[end_id]['top']['z']
-            }
-        }
-
-    # Last segment: Last support top to second anchor
-    last_support = f's{params["num_supports"]}'
-    cables[f'tso_s{params["num_supports"]}a2'] = {
-        'start': last_support,
-        'end': 'tso2_anchor',
-        'type': 'tso',
-        'name': f'Tso S{params["num_supports"]}-A2',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'red',
-        'start_coords': {
-            'x': supports[last_support]['top']['x'],
-            'y': supports[last_support]['top']['y'],
-            'z': supports[last_support]['top']['z']
-        },
-        'end_coords': {
-            'x': anchors['tso2_anchor']['position']['x'],
-            'y': anchors['tso2_anchor']['position']['y'],
-            'z': anchors['tso2_anchor']['position']['z']
-        }
-    }
-    
-## LOWER SUPPORT CABLES (Tragseil unten)
-    # First segment: First anchor to first support base
-    cables['tsu_a1s1'] = {
-        'start': 'tsu1_anchor',
-        'end': 's1',
-        'type': 'tsu',
-        'name': 'Tsu A1-S1',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'red',
-        'start_coords': {
-            'x': anchors['tsu1_anchor']['position']['x'],
-            'y': anchors['tsu1_anchor']['position']['y'],
-            'z': anchors['tsu1_anchor']['position']['z']
-        },
-        'end_coords': {
-            'x': supports['s1']['base']['x'],
-            'y': supports['s1']['base']['y'],
-            'z': supports['s1']['base']['z']
-        }
-    }
+# ======= CABLES =======
 
-    # Middle segments: Support base to next support base
-    for i in range(1, params['num_supports']):
-        start_id = f's{i}'
-        end_id = f's{i+1}'
-        cable_id = f'tsu_s{i}s{i+1}'
-        
-        cables[cable_id] = {
-            'start': start_id,
-            'end': end_id,
-            'type': 'tsu',
-            'name': f'Tsu S{i}-S{i+1}',
-            'force': 0.0,
-            'has_load_cell': False,
-            'color': 'red',
-            'start_coords': {
-                'x': supports[start_id]['base']['x'],
-                'y': supports[start_id]['base']['y'],
-                'z': supports[start_id]['base']['z']
-            },
-            'end_coords': {
-                'x': supports[end_id]['base']['x'],
-                'y': supports[end_id]['base']['y'],
-                'z': supports[end_id]['base']['z']
-            }
-        }
-
-    # Last segment: Last support base to second anchor
-    last_support = f's{params["num_supports"]}'
-    cables[f'tsu_s{params["num_supports"]}a2'] = {
-        'start': last_support,
-        'end': 'tsu2_anchor',
-        'type': 'tsu',
-        'name': f'Tsu S{params["num_supports"]}-A2',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'red',
-        'start_coords': {
-            'x': supports[last_support]['base']['x'],
-            'y': supports[last_support]['base']['y'],
-            'z': supports[last_support]['base']['z']
-        },
-        'end_coords': {
-            'x': anchors['tsu2_anchor']['position']['x'],
-            'y': anchors['tsu2_anchor']['position']['y'],
-            'z': anchors['tsu2_anchor']['position']['z']
-        }
-    }
-    
-# CATCHING CABLES (Fangseile) between supports
-    # Calculate intermediate heights (50% of the way up each support)
-    for i in range(params['num_supports']):
-        support_id = f's{i+1}'
-        # Calculate intermediate position for this support (50% height)
-        mid_x = (supports[support_id]['base']['x'] + supports[support_id]['top']['x']) / 2
-        mid_y = supports[support_id]['base']['y']  # Keep same y-coordinate as base
-        mid_z = (supports[support_id]['base']['z'] + supports[support_id]['top']['z']) / 2
-        
-        # Add mid-point to support data
-        if 'mid' not in supports[support_id]:
-            supports[support_id]['mid'] = {}
-        
-        supports[support_id]['mid'] = {
-            'x': mid_x,
-            'y': mid_y,
-            'z': mid_z
-        }
-
-    # First segment: First anchor to first support mid-point
-    cables['zw_a1s1'] = {
-        'start': 'tso1_anchor',  # Using upper support cable anchor
-        'end': 's1',
-        'type': 'zw',
-        'name': 'Zw A1-S1',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'gold',
-        'start_coords': {
-            'x': anchors['tso1_anchor']['position']['x'],
-            'y': anchors['tso1_anchor']['position']['y'],
-            'z': anchors['tso1_anchor']['position']['z']
-        },
-        'end_coords': {
-            'x': supports['s1']['mid']['x'],
-            'y': supports['s1']['mid']['y'],
-            'z': supports['s1']['mid']['z']
-        }
-    }
+    connectivity, cable_ids, cable_names, cable_types, has_load_cell = [], [], [], [], []
+
+    def add_cables(ids, names, cable_type, start, end, load_cell):
+        connectivity.append(np.column_stack(np.broadcast_arrays(start, end)))
+        cable_ids.extend(ids)
+        cable_names.extend(names)
+        cable_types.append(np.full(len(ids), cable_type))
+        has_load_cell.append(np.full(len(ids), load_cell))
+
+    ## RETENTION CABLES (Rückhalteseile): each support top to the anchors on both sides
+    add_cables([f'rhs{i+1}' for i in range(n)], [f'Rhs {i+1}' for i in range(n)],
+               'rhs', top + support_index, v + support_index, True)
+    add_cables([f'rhs{i+n+1}' for i in range(n)], [f'Rhs {i+n+1}' for i in range(n)],
+               'rhs', top + support_index, v + support_index + 1, True)
+
+    ## SUPPORT AND CATCHING CABLES: anchor - support chain - anchor
+    # (type, label, support point offset, first anchor, last anchor)
+    chains = (
+        ('tso', 'Tso', top, 'tso1_anchor', 'tso2_anchor'),   # Tragseil oben
+        ('tsu', 'Tsu', base, 'tsu1_anchor', 'tsu2_anchor'),  # Tragseil unten
+        ('zw', 'Zw', mid, 'tso1_anchor', 'tso2_anchor')      # Fangseile, using upper support cable anchors
+    )
+    segments = support_index[1:]
+    for cable_type, label, point, first_anchor, last_anchor in chains:
+        add_cables([f'{cable_type}_a1s1'], [f'{label} A1-S1'], cable_type,
+                   end_anchor[first_anchor], point, True)
+        add_cables([f'{cable_type}_s{i}s{i+1}' for i in range(1, n)], [f'{label} S{i}-S{i+1}' for i in range(1, n)],
+                   cable_type, point + segments - 1, point + segments, False)
+        add_cables([f'{cable_type}_s{n}a2'], [f'{label} S{n}-A2'], cable_type,
+                   point + n - 1, end_anchor[last_anchor], True)
+
+    ## LATERAL BRACING CABLES (seitliche Abspannung)
+    add_cables(['sa1', 'sa2'], ['Sa 1', 'Sa 2'], 'sa',
+               [top, top + n - 1], [end_anchor['sa1_anchor'], end_anchor['sa2_anchor']], True)
 
-    # Middle segments: Connect intermediate points between supports
-    for i in range(1, params['num_supports']):
-        start_id = f's{i}'
-        end_id = f's{i+1}'
-        cable_id = f'zw_s{i}s{i+1}'
-        
-        cables[cable_id] = {
-            'start': start_id,
-            'end': end_id,
-            'type': 'zw',
-            'name': f'Zw S{i}-S{i+1}',
-            'force': 0.0,
-            'has_load_cell': False,
-            'color': 'gold',
-            'start_coords': {
-                'x': supports[start_id]['mid']['x'],
-                'y': supports[start_id]['mid']['y'],
-                'z': supports[start_id]['mid']['z']
-            },
-            'end_coords': {
-                'x': supports[end_id]['mid']['x'],
-                'y': supports[end_id]['mid']['y'],
-                'z': supports[end_id]['mid']['z']
-            }
-        }
-
-    # Last segment: Last support mid-point to second anchor
-    last_support = f's{params["num_supports"]}'
-    cables[f'zw_s{params["num_supports"]}a2'] = {
-        'start': last_support,
-        'end': 'tso2_anchor',  # Using upper support cable anchor
-        'type': 'zw',
-        'name': f'Zw S{params["num_supports"]}-A2',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'gold',
-        'start_coords': {
-            'x': supports[last_support]['mid']['x'],
-            'y': supports[last_support]['mid']['y'],
-            'z': supports[last_support]['mid']['z']
-        },
-        'end_coords': {
-            'x': anchors['tso2_anchor']['position']['x'],
-            'y': anchors['tso2_anchor']['position']['y'],
-            'z': anchors['tso2_anchor']['position']['z']
-        }
-    }
-    
-## LATERAL BRACING CABLES (seitliche Abspannung)
-    cables['sa1'] = {
-        'start': 's1',
-        'end': 'sa1_anchor',
-        'type': 'sa',
-        'name': 'Sa 1',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'blue',
-        'start_coords': {
-            'x': supports['s1']['top']['x'],
-            'y': supports['s1']['top']['y'],
-            'z': supports['s1']['top']['z']
-        },
-        'end_coords': {
-            'x': anchors['sa1_anchor']['position']['x'],
-            'y': anchors['sa1_anchor']['position']['y'],
-            'z': anchors['sa1_anchor']['position']['z']
-        }
-    }
-    
-    cables['sa2'] = {
-        'start': f's{params["num_supports"]}',
-        'end': 'sa2_anchor',
-        'type': 'sa',
-        'name': 'Sa 2',
-        'force': 0.0,
-        'has_load_cell': True,
-        'color': 'blue',
-        'start_coords': {
-            'x': supports[f's{params["num_supports"]}']['top']['x'],
-            'y': supports[f's{params["num_supports"]}']['top']['y'],
-            'z': supports[f's{params["num_supports"]}']['top']['z']
-        },
-        'end_coords': {
-            'x': anchors['sa2_anchor']['position']['x'],
-            'y': anchors['sa2_anchor']['position']['y'],
-            'z': anchors['sa2_anchor']['position']['z']
-        }
-    }
-    
     # Create intermediate cables if specified
     if params['has_delta1']:
         # Implementation for intermediate cable 1
         pass
-    
+
     if params['has_delta2']:
         # Implementation for intermediate cable 2
         pass
-    
-    # Return the complete barrier configuration
-    barrier_config = {
-        'supports': supports,
-        'anchors': anchors,
-        'cables': cables,
-        'params': params  # Store the original parameters
-    }
-    
-    return barrier_config
+
+    model = BarrierModel(
+        params, nodes, node_element, node_point,
+        support_ids, [f'S{i+1}' for i in range(n)],
+        anchor_ids, [f'V{i+1}' for i in range(n + 1)] + [name for _, name in END_ANCHORS],
+        np.concatenate(connectivity), cable_ids, cable_names, np.concatenate(cable_types),
+        has_load_cell=np.concatenate(has_load_cell)
+    )
+    model.node_groups = groups
+    return model
+
+def update_barrier_model(model, params, changed_params=None):
+    """
+    Update a barrier model for new parameters, recomputing only affected node groups.
+
+    Cable endpoints follow their nodes through the connectivity array, so e.g. an
+    h change only moves the retention anchors. Topology changes (TOPOLOGY_PARAMETERS)
+    and models without known node groups are rebuilt completely. Force and load
+    cell values are kept for all cables that still exist.
+
+    Args:
+        model: BarrierModel the update starts from
+        params: New parameter values
+        changed_params: Names of changed parameters, derived from model.params if None
+
+    Returns:
+        Updated BarrierModel (the given model is not modified)
+    """
+    if changed_params is None:
+        changed_params = [name for name, value in params.items() if model.params.get(name) != value]
+    changed_params = set(changed_params)
+
+    if model.node_groups is None or changed_params.intersection(TOPOLOGY_PARAMETERS):
+        rebuilt = build_barrier_model(params)
+        rebuilt.copy_measurements(model)
+        return rebuilt
+
+    nodes = model.nodes.copy()
+    for group, rows in model.node_groups.items():
+        if changed_params.intersection(GEOMETRY_DEPENDENCIES[group]):
+            nodes[rows] = calculate_node_group(group, params)
+
+    return model.with_nodes(params, nodes)
+
+def calculate_3d_coordinates(params):
+    """
+    Calculate 3D coordinates for all components of the rockfall barrier
+    based on the geometric parameters.
+
+    The nested dictionary is the view of build_barrier_model(params), callers
+    that work with arrays should use the model directly.
+    """
+    return build_barrier_model(params).to_config()
+
+def update_3d_coordinates(barrier_config, params, changed_params=None):
+    """
+    Incremental version of calculate_3d_coordinates.
+
+    Only the coordinates depending on changed parameters are recomputed and the
+    force and load cell values entered in barrier_config are kept.
+
+    Args:
+        barrier_config: Current barrier configuration
+        params: New parameter values
+        changed_params: Names of changed parameters, None compares with the
+            parameters the current geometry was built with
+
+    Returns:
+        Updated barrier configuration
+    """
+    model = get_barrier_model(barrier_config)
+    model.read_measurements(barrier_config.get('cables', {}))
+    return update_barrier_model(model, params, changed_params).to_config()
 
 def calculate_3d_coordinates_with_params(base_params, **param_changes):
     """
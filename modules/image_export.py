@@ -0,0 +1,536 @@
+import io
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+import numpy as np
+from plotly.colors import get_colorscale
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+from modules.forces import calculate_forces
+from modules.visualization import create_barrier_diagram, create_top_view, create_3d_view
+
+try:
+    import kaleido
+except ImportError:  # kaleido is optional, the built-in renderer is used without it
+    kaleido = None
+
+IMAGE_FORMATS = ('png', 'svg')
+EXPORT_VIEWS = ('side', 'top', '3d')
+
+# Default image size in pixels
+EXPORT_WIDTH = 1200
+EXPORT_HEIGHT = 800
+
+# Direction the 3D view is seen from, Plotly's default camera
+EXPORT_CAMERA_EYE = (1.25, 1.25, 1.25)
+
+# PNG images are drawn at this scale and downsampled for smooth edges
+PNG_SUPERSAMPLING = 2
+
+# Batch exports keep at most this many finished or running jobs per worker
+EXPORT_PENDING_PER_WORKER = 2
+
+# TrueType fonts tried for PNG text, Pillow's built-in font is used if none is installed
+EXPORT_FONTS = ('DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'Arial.ttf', 'arial.ttf')
+
+# Plot area margins (left, right, top, bottom) in pixels
+MARGINS = (80, 30, 60, 60)
+
+# Dash patterns in pixels (on, off)
+DASH_PATTERNS = {
+    'dash': (10, 6),
+    'dot': (2, 4),
+    'dashdot': (10, 4, 2, 4),
+    'longdash': (16, 6)
+}
+
+# Approximation of Plotly's 'Earth' colorscale used for terrain surfaces
+EARTH_COLORS = ((0.0, (0, 0, 130)), (0.1, (0, 180, 180)), (0.2, (40, 210, 40)),
+                (0.4, (230, 230, 50)), (0.6, (120, 70, 20)), (1.0, (255, 255, 255)))
+
+# ======= Figure to primitives =======
+
+def _color(value, default='black'):
+    return value if isinstance(value, str) and value else default
+
+def _per_point(value, count, default):
+    """Expand a scalar or per-point style attribute to a list"""
+    if value is None:
+        return [default] * count
+    if isinstance(value, (str, int, float)):
+        return [value] * count
+    return list(value)
+
+def _point_colors(style, count, default, coloraxis):
+    """Per-point colors of a marker or line style, numbers are mapped through its colorscale"""
+    values = style.color
+    if values is None or isinstance(values, str) or np.ndim(values) == 0:
+        return _per_point(values, count, default)
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.number):
+        return list(values)
+
+    # The color scale and range are set on the style or on the shared color axis
+    scale = coloraxis if style.coloraxis else style
+    cmin = np.nanmin(values) if scale.cmin is None else scale.cmin
+    cmax = np.nanmax(values) if scale.cmax is None else scale.cmax
+    levels = np.nan_to_num(np.clip((values - cmin) / ((cmax - cmin) or 1.0), 0.0, 1.0))
+
+    colorscale = scale.colorscale or 'Viridis'
+    if isinstance(colorscale, str):
+        colorscale = get_colorscale(colorscale)
+    positions = [float(position) for position, _ in colorscale]
+    channels = np.array([ImageColor.getrgb(color)[:3] for _, color in colorscale], dtype=float)
+    rgb = np.column_stack([np.interp(levels, positions, channels[:, c]) for c in range(3)])
+    return ['#%02x%02x%02x' % tuple(int(round(c)) for c in color) for color in rgb]
+
+def _split_nan(points):
+    """Split an (n, d) array at rows containing NaN into polylines of at least two points"""
+    valid = np.all(np.isfinite(points), axis=1)
+    breaks = np.flatnonzero(np.diff(np.r_[0, valid.astype(int), 0]))
+    return [points[start:stop] for start, stop in zip(breaks[::2], breaks[1::2]) if stop - start >= 2]
+
+def _earth_color(value):
+    positions = [position for position, _ in EARTH_COLORS]
+    channels = np.array([color for _, color in EARTH_COLORS], dtype=float)
+    rgb = [np.interp(value, positions, channels[:, c]) for c in range(3)]
+    return '#%02x%02x%02x' % tuple(int(round(c)) for c in rgb)
+
+def _camera(eye=EXPORT_CAMERA_EYE):
+    """Orthographic projection basis (right, up, towards camera) for a camera eye position"""
+    toward = np.asarray(eye, dtype=float)
+    toward /= np.linalg.norm(toward)
+    right = np.cross([0.0, 0.0, 1.0], toward)
+    right /= np.linalg.norm(right)
+    up = np.cross(toward, right)
+    return np.stack([right, up, toward])
+
+def figure_primitives(fig, eye=EXPORT_CAMERA_EYE):
+    """
+    Convert a Plotly figure into drawing primitives in data coordinates.
+
+    Scatter traces and annotations are taken as they are. Scatter3d, Mesh3d and
+    Surface traces are projected orthographically along the camera eye and
+    sorted back to front.
+
+    Returns:
+        Dictionary with 'items' (list of primitive dictionaries in drawing order),
+        'legend' (name, color) pairs, 'title', 'x_title', 'y_title', 'axes'
+        (draw axes) and 'equal_aspect'
+    """
+    items = []
+    legend = []
+    is_3d = any(trace.type in ('scatter3d', 'mesh3d', 'surface') for trace in fig.data)
+    basis = _camera(eye) if is_3d else None
+
+    def project(*coords):
+        points = np.column_stack([np.asarray(c, dtype=float) for c in coords])
+        if basis is None:
+            return points, np.zeros(len(points))
+        projected = points @ basis.T
+        return projected[:, :2], projected[:, 2]
+
+    for trace in fig.data:
+        if trace.type in ('scatter', 'scatter3d'):
+            coords = (trace.x, trace.y) if trace.type == 'scatter' else (trace.x, trace.y, trace.z)
+            if trace.x is None or len(trace.x) == 0:
+                continue
+            points, depth = project(*coords)
+            mode = trace.mode or 'lines+markers'
+            line_color = _color(trace.line.color)
+
+            if 'lines' in mode:
+                width = trace.line.width or 2
+                line_colors = _point_colors(trace.line, len(points), line_color, fig.layout.coloraxis)
+                # Polylines are split at NaN gaps, the index column keeps track of the depths
+                for piece in _split_nan(np.column_stack([np.arange(len(points)), points])):
+                    rows = piece[:, 0].astype(int)
+                    items.append({'kind': 'line', 'points': points[rows], 'color': _color(line_colors[rows[0]]),
+                                  'width': width, 'dash': trace.line.dash, 'depth': depth[rows].mean()})
+
+            outline = trace.marker.line.color if trace.marker.line else None
+            if 'markers' in mode:
+                count = len(points)
+                colors = _point_colors(trace.marker, count, line_color, fig.layout.coloraxis)
+                sizes = _per_point(trace.marker.size, count, 6)
+                for i in np.flatnonzero(np.all(np.isfinite(points), axis=1)):
+                    items.append({'kind': 'marker', 'point': points[i], 'symbol': trace.marker.symbol or 'circle',
+                                  'size': sizes[i], 'color': _color(colors[i]),
+                                  'outline': outline, 'depth': depth[i] + 1e-6})
+
+            if trace.showlegend is not False and trace.name:
+                swatch = _color(line_colors[0], line_color) if 'lines' in mode else _color(outline, _color(trace.marker.color))
+                legend.append((trace.name, swatch))
+
+        elif trace.type == 'mesh3d':
+            vertices, depth = project(trace.x, trace.y, trace.z)
+            for a, b, c in zip(trace.i, trace.j, trace.k):
+                items.append({'kind': 'polygon', 'points': vertices[[a, b, c]], 'color': _color(trace.color, 'grey'),
+                              'depth': depth[[a, b, c]].mean()})
+
+        elif trace.type == 'surface':
+            x, y, z = (np.asarray(c, dtype=float) for c in (trace.x, trace.y, trace.z))
+            rows, columns = z.shape
+            x, y = np.broadcast_to(x, z.shape), np.broadcast_to(y, z.shape)
+            vertices, depth = project(x.ravel(), y.ravel(), z.ravel())
+            z_range = np.ptp(z) or 1.0
+            for r in range(rows - 1):
+                for c in range(columns - 1):
+                    quad = [r * columns + c, r * columns + c + 1, (r + 1) * columns + c + 1, (r + 1) * columns + c]
+                    level = (z.ravel()[quad].mean() - z.min()) / z_range
+                    items.append({'kind': 'polygon', 'points': vertices[quad], 'color': _earth_color(0.2 + 0.5 * level),
+                                  'depth': depth[quad].mean(), 'layer': 0})
+
+    if is_3d:
+        # Painter's algorithm, the terrain is always drawn behind the barrier
+        items.sort(key=lambda item: (item.get('layer', 1), item['depth']))
+
+    for annotation in fig.layout.annotations or ():
+        items.append({'kind': 'text', 'point': np.array([annotation.x, annotation.y], dtype=float),
+                      'text': annotation.text, 'color': _color(annotation.font.color if annotation.font else None),
+                      'box': annotation.bgcolor is not None})
+
+    title = fig.layout.title.text if fig.layout.title else None
+    return {
+        'items': items,
+        'legend': legend,
+        'title': title,
+        'x_title': None if is_3d else fig.layout.xaxis.title.text,
+        'y_title': None if is_3d else fig.layout.yaxis.title.text,
+        'axes': not is_3d,
+        'equal_aspect': is_3d or fig.layout.yaxis.scaleanchor == 'x'
+    }
+
+# ======= Layout =======
+
+def _nice_ticks(lower, upper, count=6):
+    """Round tick values covering [lower, upper]"""
+    span = upper - lower
+    if span <= 0:
+        return np.array([lower])
+    raw = span / count
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    # Adding zero turns -0.0 into 0.0 for the labels
+    return np.arange(np.ceil(lower / step) * step, upper + step * 1e-9, step) + 0.0
+
+def _transform(scene, width, height):
+    """Map data coordinates into the plot area, returns the mapping and the visible data range"""
+    points = [item['points'] for item in scene['items'] if 'points' in item]
+    points += [item['point'][None, :] for item in scene['items'] if 'point' in item]
+    points = np.concatenate(points) if points else np.zeros((1, 2))
+    points = points[np.all(np.isfinite(points), axis=1)]
+
+    lower, upper = points.min(axis=0), points.max(axis=0)
+    pad = np.maximum((upper - lower) * 0.05, 0.5)
+    lower, upper = lower - pad, upper + pad
+
+    left, right, top, bottom = MARGINS
+    plot_width, plot_height = width - left - right, height - top - bottom
+    scale = np.array([plot_width, plot_height]) / (upper - lower)
+    offset = np.array([left, top], dtype=float)
+    if scene['equal_aspect']:
+        scale[:] = scale.min()
+        offset += (np.array([plot_width, plot_height]) - scale * (upper - lower)) / 2
+
+    # Data range covering the whole plot area
+    visible_lower = lower - (offset - [left, top]) / scale
+    visible_upper = visible_lower + np.array([plot_width, plot_height]) / scale
+
+    def to_pixels(data):
+        data = np.atleast_2d(np.asarray(data, dtype=float))
+        pixels = offset + (data - lower) * scale
+        pixels[:, 1] = 2 * offset[1] + scale[1] * (upper[1] - lower[1]) - pixels[:, 1]
+        return pixels
+
+    return to_pixels, visible_lower, visible_upper
+
+def _dash_segments(pixels, pattern):
+    """Split a pixel polyline into the visible pieces of a dash pattern"""
+    if not pattern:
+        return [pixels]
+    lengths = np.r_[0, np.cumsum(np.linalg.norm(np.diff(pixels, axis=0), axis=1))]
+    period = sum(pattern)
+    edges = np.cumsum((0,) + tuple(pattern))
+    pieces = []
+    start = 0.0
+    while start < lengths[-1]:
+        for i in range(0, len(pattern), 2):
+            a, b = start + edges[i], min(start + edges[i + 1], lengths[-1])
+            if a >= lengths[-1]:
+                break
+            inside = (lengths > a) & (lengths < b)
+            distances = np.r_[a, lengths[inside], b]
+            pieces.append(np.column_stack([np.interp(distances, lengths, pixels[:, 0]),
+                                           np.interp(distances, lengths, pixels[:, 1])]))
+        start += period
+    return pieces
+
+def _draw_scene(canvas, scene, width, height):
+    """Draw a scene from figure_primitives() onto a canvas"""
+    to_pixels, lower, upper = _transform(scene, width, height)
+    left, right, top, bottom = MARGINS
+
+    canvas.rectangle((0, 0, width, height), fill='white')
+
+    if scene['axes']:
+        for tick in _nice_ticks(lower[0], upper[0]):
+            x = to_pixels([[tick, lower[1]]])[0, 0]
+            canvas.polyline(np.array([[x, top], [x, height - bottom]]), '#e5e5e5', 1)
+            canvas.text((x, height - bottom + 14), f"{tick:g}", 'black', 12, anchor='middle')
+        for tick in _nice_ticks(lower[1], upper[1]):
+            y = to_pixels([[lower[0], tick]])[0, 1]
+            canvas.polyline(np.array([[left, y], [width - right, y]]), '#e5e5e5', 1)
+            canvas.text((left - 8, y), f"{tick:g}", 'black', 12, anchor='end')
+        if scene['x_title']:
+            canvas.text((left + (width - left - right) / 2, height - 18), scene['x_title'], 'black', 14, anchor='middle')
+        if scene['y_title']:
+            canvas.text((18, top + (height - top - bottom) / 2), scene['y_title'], 'black', 14, anchor='middle', rotate=True)
+
+    for item in scene['items']:
+        if item['kind'] == 'polygon':
+            canvas.polygon(to_pixels(item['points']), item['color'])
+        elif item['kind'] == 'line':
+            pixels = to_pixels(item['points'])
+            for piece in _dash_segments(pixels, DASH_PATTERNS.get(item['dash'])):
+                canvas.polyline(piece, item['color'], item['width'])
+        elif item['kind'] == 'marker':
+            canvas.marker(to_pixels(item['point'])[0], item['symbol'], item['size'], item['color'], item['outline'])
+        elif item['kind'] == 'text':
+            canvas.text(to_pixels(item['point'])[0], item['text'], item['color'], 10, anchor='middle', box=item['box'])
+
+    if scene['axes']:
+        canvas.rectangle((left, top, width - right, height - bottom), outline='black')
+
+    if scene['title']:
+        canvas.text((left, top / 2), scene['title'], 'black', 18)
+
+    # Legend in the top left corner of the plot area
+    for i, (name, color) in enumerate(scene['legend']):
+        y = top + 14 + 18 * i
+        canvas.polyline(np.array([[left + 10, y], [left + 30, y]]), color, 3)
+        canvas.text((left + 36, y), name, 'black', 12)
+
+# ======= Canvases =======
+
+class SvgCanvas:
+    """Collects SVG elements, coordinates in pixels"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.elements = []
+
+    def rectangle(self, box, fill='none', outline=None):
+        x0, y0, x1, y1 = box
+        stroke = f' stroke="{outline}"' if outline else ''
+        self.elements.append(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" fill="{fill}"{stroke}/>')
+
+    def polyline(self, pixels, color, width):
+        points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in pixels)
+        self.elements.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="{width}" stroke-linejoin="round"/>')
+
+    def polygon(self, pixels, color):
+        points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in pixels)
+        self.elements.append(f'<polygon points="{points}" fill="{color}" stroke="{color}" stroke-width="0.5"/>')
+
+    def marker(self, center, symbol, size, color, outline=None):
+        x, y = center
+        r = size / 2
+        stroke = f' stroke="{outline}" stroke-width="1"' if outline else ''
+        if symbol == 'square':
+            self.elements.append(f'<rect x="{x - r:.1f}" y="{y - r:.1f}" width="{size}" height="{size}" fill="{color}"{stroke}/>')
+        elif symbol == 'cross':
+            t = r / 3
+            self.elements.append(
+                f'<path d="M{x - t:.1f},{y - r:.1f}h{2 * t:.1f}v{r - t:.1f}h{r - t:.1f}v{2 * t:.1f}h{t - r:.1f}'
+                f'v{r - t:.1f}h{-2 * t:.1f}v{t - r:.1f}h{t - r:.1f}v{-2 * t:.1f}h{r - t:.1f}z" fill="{color}"{stroke}/>'
+            )
+        else:
+            self.elements.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{r:.1f}" fill="{color}"{stroke}/>')
+
+    def text(self, position, text, color, size, anchor='start', box=False, rotate=False):
+        x, y = position
+        transform = f' transform="rotate(-90 {x:.1f} {y:.1f})"' if rotate else ''
+        if box:
+            w = 0.6 * size * len(text) + 6
+            x0 = x - w / 2 if anchor == 'middle' else x
+            self.elements.append(f'<rect x="{x0:.1f}" y="{y - size * 0.8:.1f}" width="{w:.1f}" height="{size * 1.6:.1f}" fill="white" stroke="black"/>')
+        self.elements.append(
+            f'<text x="{x:.1f}" y="{y:.1f}" fill="{color}" font-size="{size}" font-family="sans-serif" '
+            f'text-anchor="{anchor}" dominant-baseline="middle"{transform}>{escape(str(text))}</text>'
+        )
+
+    def to_bytes(self):
+        header = f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" viewBox="0 0 {self.width} {self.height}">'
+        return '\n'.join([header] + self.elements + ['</svg>']).encode('utf-8')
+
+def _load_font(size):
+    for name in EXPORT_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+class PngCanvas:
+    """Pillow based raster canvas with the same interface as SvgCanvas"""
+
+    def __init__(self, width, height, scale=PNG_SUPERSAMPLING):
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.image = Image.new('RGB', (width * scale, height * scale), 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self._fonts = {}
+
+    def _font(self, size):
+        if size not in self._fonts:
+            self._fonts[size] = _load_font(size * self.scale)
+        return self._fonts[size]
+
+    def _xy(self, pixels):
+        return [tuple(point) for point in (np.asarray(pixels) * self.scale).tolist()]
+
+    def rectangle(self, box, fill=None, outline=None):
+        self.draw.rectangle(self._xy(np.reshape(box, (2, 2))), fill=None if fill == 'none' else fill,
+                            outline=outline, width=self.scale)
+
+    def polyline(self, pixels, color, width):
+        self.draw.line(self._xy(pixels), fill=ImageColor.getrgb(color), width=max(int(width * self.scale), 1), joint='curve')
+
+    def polygon(self, pixels, color):
+        self.draw.polygon(self._xy(pixels), fill=ImageColor.getrgb(color))
+
+    def marker(self, center, symbol, size, color, outline=None):
+        x, y = np.asarray(center) * self.scale
+        r = size * self.scale / 2
+        fill = ImageColor.getrgb(color)
+        if symbol == 'square':
+            self.draw.rectangle([x - r, y - r, x + r, y + r], fill=fill, outline=outline, width=self.scale)
+        elif symbol == 'cross':
+            t = r / 3
+            self.draw.rectangle([x - t, y - r, x + t, y + r], fill=fill, outline=outline)
+            self.draw.rectangle([x - r, y - t, x + r, y + t], fill=fill, outline=outline)
+        else:
+            self.draw.ellipse([x - r, y - r, x + r, y + r], fill=fill, outline=outline, width=self.scale)
+
+    def text(self, position, text, color, size, anchor='start', box=False, rotate=False):
+        x, y = np.asarray(position) * self.scale
+        font = self._font(size)
+        pil_anchor = {'start': 'lm', 'middle': 'mm', 'end': 'rm'}[anchor]
+        if rotate:
+            # Draw on a separate image and paste it rotated
+            left, top, right, bottom = self.draw.textbbox((0, 0), str(text), font=font)
+            label = Image.new('RGBA', (right - left + 4, bottom - top + 4), (255, 255, 255, 0))
+            ImageDraw.Draw(label).text((2 - left, 2 - top), str(text), fill=color, font=font)
+            label = label.rotate(90, expand=True)
+            self.image.paste(label, (int(x - label.width / 2), int(y - label.height / 2)), label)
+            return
+        if box:
+            left, top, right, bottom = self.draw.textbbox((x, y), str(text), font=font, anchor=pil_anchor)
+            pad = 3 * self.scale
+            self.draw.rectangle([left - pad, top - pad, right + pad, bottom + pad], fill='white', outline='black', width=self.scale)
+        self.draw.text((x, y), str(text), fill=color, font=font, anchor=pil_anchor)
+
+    def to_bytes(self):
+        image = self.image.resize((self.width, self.height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+
+# ======= Rendering =======
+
+def render_figure(fig, fmt='png', width=EXPORT_WIDTH, height=EXPORT_HEIGHT, engine=None):
+    """
+    Render a barrier figure to PNG or SVG bytes without a browser.
+
+    Args:
+        fig: Plotly figure from create_barrier_diagram, create_top_view or create_3d_view
+        fmt: 'png' or 'svg'
+        width: Image width in pixels
+        height: Image height in pixels
+        engine: 'kaleido' or 'builtin', defaults to kaleido if it is installed
+
+    Returns:
+        Image file content as bytes
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}")
+
+    if engine is None:
+        engine = 'kaleido' if kaleido is not None else 'builtin'
+    if engine == 'kaleido':
+        return fig.to_image(format=fmt, width=width, height=height)
+
+    canvas = PngCanvas(width, height) if fmt == 'png' else SvgCanvas(width, height)
+    _draw_scene(canvas, figure_primitives(fig), width, height)
+    return canvas.to_bytes()
+
+def create_view(barrier_config, view, lang='en', results=None):
+    """Figure of one export view ('side', 'top' or '3d') with force results where shown"""
+    if view == 'side':
+        return create_barrier_diagram(barrier_config, results, lang=lang)
+    if view == 'top':
+        return create_top_view(barrier_config, lang=lang)
+    if view == '3d':
+        return create_3d_view(barrier_config, results, lang=lang)
+    raise ValueError(f"Unknown view: {view}")
+
+def export_config_images(barrier_config, views=EXPORT_VIEWS, fmt='png', lang='en',
+                         width=EXPORT_WIDTH, height=EXPORT_HEIGHT, engine=None):
+    """
+    Render the views of one barrier configuration.
+
+    Returns:
+        Dictionary mapping view name to image bytes
+    """
+    results = calculate_forces(barrier_config)
+    return {
+        view: render_figure(create_view(barrier_config, view, lang, results), fmt, width, height, engine)
+        for view in views
+    }
+
+def _render_job(job):
+    """Worker entry point: render all views of one configuration given directly or as a JSON file path"""
+    name, source, views, fmt, lang, width, height, engine = job
+    if isinstance(source, str):
+        with open(source, "r") as f:
+            source = json.load(f)
+    return name, export_config_images(source, views, fmt, lang, width, height, engine)
+
+def export_images_batch(configs, views=EXPORT_VIEWS, fmt='png', lang='en', processes=None,
+                        width=EXPORT_WIDTH, height=EXPORT_HEIGHT, engine=None):
+    """
+    Render the views of many barrier configurations, optionally in worker processes.
+
+    Results are yielded in input order as they complete. At most
+    EXPORT_PENDING_PER_WORKER jobs per worker are in flight, so memory stays
+    bounded however many configurations are exported; pass file paths instead of
+    loaded configurations to keep them out of this process as well.
+
+    Args:
+        configs: Iterable of (name, barrier_config or path to a saved JSON file)
+        views: Views to render per configuration
+        fmt: 'png' or 'svg'
+        lang: Display language of the figures
+        processes: Number of worker processes, None renders in this process
+
+    Yields:
+        (name, {view: image bytes}) per configuration
+    """
+    jobs = ((name, source, tuple(views), fmt, lang, width, height, engine) for name, source in configs)
+
+    if not processes:
+        for job in jobs:
+            yield _render_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append(executor.submit(_render_job, job))
+            if len(pending) >= processes * EXPORT_PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,178 @@
+import numpy as np
+
+# Default absolute tolerance for the inverse solvers (degrees or meters)
+SOLVER_TOL = 1e-9
+
+# Number of points used to search for a bracket when no closed form applies
+BRACKET_SAMPLES = 64
+
+def solver_result(value, converged, iterations, residual):
+    """Build the result dictionary returned by all solvers"""
+    return {
+        'value': float(value),
+        'converged': bool(converged),
+        'iterations': int(iterations),
+        'residual': float(residual)
+    }
+
+def brent_root(func, lower, upper, tol=SOLVER_TOL, max_iter=100):
+    """
+    Find a root of func within a sign-changing bracket using Brent's method.
+
+    Args:
+        func: Scalar function of one variable
+        lower: Lower end of the bracket
+        upper: Upper end of the bracket
+        tol: Absolute tolerance on the root
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    a, b = float(lower), float(upper)
+    fa, fb = float(func(a)), float(func(b))
+
+    if fa == 0:
+        return solver_result(a, True, 0, 0.0)
+    if fb == 0:
+        return solver_result(b, True, 0, 0.0)
+    if fa * fb > 0:
+        # No sign change, return the better end point
+        best, f_best = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+        return solver_result(best, False, 0, f_best)
+
+    # b is always the best estimate, c the previous one and [b, c] brackets the root
+    c, fc = a, fa
+    e = d = b - a
+
+    for iteration in range(1, max_iter + 1):
+        if fb * fc > 0:
+            c, fc = a, fa
+            e = d = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * np.finfo(float).eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+
+        if abs(xm) <= tol1 or fb == 0:
+            return solver_result(b, True, iteration, fb)
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Attempt inverse quadratic interpolation (secant step if only two points)
+            s = fb / fa
+            if a == c:
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Accept the interpolation only if it stays well inside the bracket
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = xm
+                e = d
+        else:
+            # Fall back to bisection
+            d = xm
+            e = d
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else np.copysign(tol1, xm)
+        fb = float(func(b))
+
+    return solver_result(b, False, max_iter, fb)
+
+def golden_section_min(func, lower, upper, tol=SOLVER_TOL, max_iter=100):
+    """Minimize a unimodal scalar function within [lower, upper]"""
+    ratio = (np.sqrt(5) - 1) / 2
+    a, b = float(lower), float(upper)
+    c = b - ratio * (b - a)
+    d = a + ratio * (b - a)
+    fc, fd = func(c), func(d)
+
+    iteration = 0
+    while abs(b - a) > tol and iteration < max_iter:
+        iteration += 1
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - ratio * (b - a)
+            fc = func(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + ratio * (b - a)
+            fd = func(d)
+
+    return (a + b) / 2, iteration
+
+def solve_inverse(forward, target, lower, upper, candidates=(), tol=SOLVER_TOL,
+                  max_iter=100, samples=BRACKET_SAMPLES, prefer=None):
+    """
+    Solve forward(x) = target for x within [lower, upper].
+
+    Closed-form candidates are checked first. If none of them is valid, the
+    interval is sampled in a single vectorized call to find a bracket which is
+    refined with Brent's method. If no root exists in the interval the closest
+    point is returned and the result is marked as not converged.
+
+    Args:
+        forward: Function of x, must accept NumPy arrays
+        target: Target value of the forward function
+        lower: Lower bound of the search interval
+        upper: Upper bound of the search interval
+        candidates: Analytic solutions to verify, in order of preference
+        tol: Absolute tolerance on the residual and on the root
+        max_iter: Maximum number of Brent iterations
+        samples: Number of points used to search for a bracket
+        prefer: Optional value used to pick among several valid candidates
+
+    Returns:
+        Solver result dictionary (value, converged, iterations, residual)
+    """
+    def residual(x):
+        return forward(x) - target
+
+    # Analytic inversions
+    valid = []
+    for candidate in candidates:
+        if candidate is None or not np.isfinite(candidate):
+            continue
+        if lower - tol <= candidate <= upper + tol:
+            candidate = min(max(candidate, lower), upper)
+            r = float(residual(candidate))
+            if abs(r) <= tol:
+                valid.append((candidate, r))
+
+    if valid:
+        if prefer is not None:
+            valid.sort(key=lambda item: abs(item[0] - prefer))
+        return solver_result(valid[0][0], True, 0, valid[0][1])
+
+    # Bracket search with one vectorized evaluation
+    x = np.linspace(lower, upper, samples)
+    r = residual(x)
+
+    exact = np.flatnonzero(r == 0)
+    if exact.size:
+        return solver_result(x[exact[0]], True, 0, 0.0)
+
+    sign_change = np.flatnonzero(np.sign(r[:-1]) * np.sign(r[1:]) < 0)
+    if sign_change.size:
+        i = sign_change[0]
+        return brent_root(residual, x[i], x[i + 1], tol=tol, max_iter=max_iter)
+
+    # No root in the interval: refine the closest sampled point
+    i = int(np.argmin(np.abs(r)))
+    lo = x[max(i - 1, 0)]
+    hi = x[min(i + 1, samples - 1)]
+    best, iterations = golden_section_min(lambda v: abs(residual(v)), lo, hi, tol=tol, max_iter=max_iter)
+    return solver_result(best, False, iterations, residual(best))
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from modules.geometry import (
+    PARAM_LIMITS, calculate_angles_batch, validate_parameter_limits_batch
+)
+
+# Input parameters that can be swept, derived angles are computed from them
+SWEEP_PARAMETERS = ('b', 'd', 'h', 'f', 'L', 'epsilon', 'phi')
+DERIVED_PARAMETERS = ('tau', 'theta', 'delta')
+
+# Number of combinations evaluated per chunk (bounds the temporary memory)
+SWEEP_CHUNK_SIZE = 250_000
+
+def sweep_dtype():
+    """Structured dtype of the sweep result table"""
+    columns = SWEEP_PARAMETERS + DERIVED_PARAMETERS
+    fields = [(name, np.float64) for name in columns]
+    fields += [(f'{name}_valid', np.bool_) for name in columns if name in PARAM_LIMITS]
+    fields.append(('valid', np.bool_))
+    return np.dtype(fields)
+
+def _axes(base_params, ranges):
+    """Value array for every sweep parameter, fixed ones taken from base_params"""
+    unknown = set(ranges) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Cannot sweep parameter(s): {', '.join(sorted(unknown))}")
+
+    return [
+        np.atleast_1d(np.asarray(ranges[name] if name in ranges else base_params[name], dtype=np.float64))
+        for name in SWEEP_PARAMETERS
+    ]
+
+def _evaluate_chunk(axes, mode, start, stop, decimals, out=None):
+    """Evaluate combinations [start, stop) of the sweep into a structured array"""
+    index = np.arange(start, stop)
+    if mode == 'grid':
+        positions = np.unravel_index(index, [len(axis) for axis in axes])
+        columns = {name: axis[pos] for name, axis, pos in zip(SWEEP_PARAMETERS, axes, positions)}
+    else:
+        columns = {name: axis[index] if len(axis) > 1 else np.repeat(axis, len(index))
+                   for name, axis in zip(SWEEP_PARAMETERS, axes)}
+
+    columns.update(calculate_angles_batch(
+        columns['epsilon'], columns['h'], columns['L'], columns['f'], columns['d'], columns['b'],
+        decimals=decimals
+    ))
+
+    table = np.empty(len(index), dtype=sweep_dtype()) if out is None else out
+    for name in SWEEP_PARAMETERS + DERIVED_PARAMETERS:
+        table[name] = columns[name]
+
+    valid = np.ones(len(index), dtype=bool)
+    for name, within_limits in validate_parameter_limits_batch(columns).items():
+        table[f'{name}_valid'] = within_limits
+        valid &= within_limits
+    table['valid'] = valid
+
+    return table
+
+def sweep_parameters(base_params, ranges, mode='grid', decimals=None, as_frame=False,
+                     processes=None, chunk_size=SWEEP_CHUNK_SIZE):
+    """
+    Evaluate derived angles and parameter validity for many parameter combinations.
+
+    Args:
+        base_params: Parameter dictionary providing values that are not swept
+        ranges: Dictionary of parameter name (b, d, h, f, L, epsilon, phi) to an
+            array of values, e.g. np.linspace(5, 15, 21)
+        mode: 'grid' for the cartesian product of all ranges, 'zip' to pair
+            values element-wise (ranges must then have equal length)
+        decimals: Round the derived angles like the UI does (1), None keeps full precision
+        as_frame: Return a pandas DataFrame instead of a NumPy structured array
+        processes: Number of worker processes, None evaluates in this process
+        chunk_size: Number of combinations evaluated per chunk
+
+    Returns:
+        Table with one row per combination: the input parameters, tau, theta,
+        delta, a '<param>_valid' column per limited parameter and 'valid'
+    """
+    axes = _axes(base_params, ranges)
+    lengths = [len(axis) for axis in axes]
+
+    if mode == 'grid':
+        total = int(np.prod(lengths))
+    elif mode == 'zip':
+        swept = {length for length in lengths if length > 1}
+        if len(swept) > 1:
+            raise ValueError("All swept ranges must have the same length in 'zip' mode")
+        total = swept.pop() if swept else 1
+    else:
+        raise ValueError(f"Unknown sweep mode: {mode}")
+
+    bounds = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+    # Chunks are written into one preallocated table
+    table = np.empty(total, dtype=sweep_dtype())
+
+    if processes and len(bounds) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunks = executor.map(
+                _evaluate_chunk,
+                [axes] * len(bounds), [mode] * len(bounds),
+                [start for start, _ in bounds], [stop for _, stop in bounds],
+                [decimals] * len(bounds)
+            )
+            for (start, stop), chunk in zip(bounds, chunks):
+                table[start:stop] = chunk
+    else:
+        for start, stop in bounds:
+            _evaluate_chunk(axes, mode, start, stop, decimals, out=table[start:stop])
+
+    if as_frame:
+        return pd.DataFrame(table)
+    return table
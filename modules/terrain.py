@@ -0,0 +1,154 @@
+import numpy as np
+from modules.cache import LRUCache
+from modules.geometry import deg_to_rad
+
+# Terrain surface shown for each range of terrain inclinations, first match wins:
+# (minimum phi, x clip, z clip, maximum resolution). Steep slopes are clipped in x
+# so the surface does not stretch far beyond the barrier.
+TERRAIN_PROFILES = (
+    (87.0, 1.0, 20.0, 50),
+    (85.0, 2.0, 20.0, 50),
+    (80.0, 4.0, 20.0, 50),
+    (70.0, None, 25.0, 50),
+    (float('-inf'), None, 20.0, 20)
+)
+
+# Height range of the vertical plane drawn for phi = 90
+VERTICAL_TERRAIN_Z = (-20.0, 20.0)
+
+# Target spacing of terrain grid points in meters
+TERRAIN_CELL_SIZE = 1.0
+
+# Upper limit of grid points per axis for raster terrain
+TERRAIN_MAX_RESOLUTION = 200
+
+# Terrain meshes by (phi or raster name, extent, resolution)
+TERRAIN_CACHE = LRUCache(maxsize=32)
+
+def terrain_profile(phi):
+    """Clipping and resolution limit used for a terrain inclination"""
+    for min_phi, x_clip, z_clip, max_resolution in TERRAIN_PROFILES:
+        if phi >= min_phi:
+            return x_clip, z_clip, max_resolution
+    return TERRAIN_PROFILES[-1][1:]
+
+def terrain_resolution(length, max_resolution=TERRAIN_MAX_RESOLUTION, cell_size=TERRAIN_CELL_SIZE):
+    """Number of grid points needed along an axis of the given length"""
+    return int(np.clip(np.ceil(length / cell_size) + 1, 2, max_resolution))
+
+def _extent_key(extent):
+    return tuple(float(value) for value in extent)
+
+def _freeze(*arrays):
+    # Cached meshes are shared between figures and must not be modified
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+def terrain_mesh(phi, extent, resolution=None):
+    """
+    Inclined terrain surface z = x * tan(phi) covering the view extent.
+
+    The surface does not vary along y, so two rows are enough. Along x the
+    points are spaced by TERRAIN_CELL_SIZE (up to the profile's resolution) and
+    the points where the clipping starts are added exactly. Meshes are cached,
+    repeated calls only cost a dictionary lookup.
+
+    Args:
+        phi: Terrain inclination in degrees
+        extent: (x_min, x_max, y_min, y_max) of the view
+        resolution: Fixed number of points along x instead of the adaptive choice
+
+    Returns:
+        Read-only (x_grid, y_grid, z_grid) arrays for go.Surface
+    """
+    extent = _extent_key(extent)
+    key = ('plane', round(float(phi), 6), extent, resolution)
+    return TERRAIN_CACHE.get_or_compute(key, lambda: _plane_mesh(phi, extent, resolution))
+
+def _plane_mesh(phi, extent, resolution):
+    x_min, x_max, y_min, y_max = extent
+    y_terrain = np.array([y_min, y_max])
+
+    if phi == 90:
+        # For vertical terrain, a vertical plane at x=0
+        z_terrain = np.array(VERTICAL_TERRAIN_Z)
+        y_grid, z_grid = np.meshgrid(y_terrain, z_terrain)
+        x_grid = np.zeros_like(y_grid)
+        return _freeze(x_grid, y_grid, z_grid)
+
+    x_clip, z_clip, max_resolution = terrain_profile(phi)
+    if resolution is None:
+        resolution = terrain_resolution(x_max - x_min, max_resolution)
+
+    tan_phi = np.tan(deg_to_rad(phi))
+    x_terrain = np.linspace(x_min, x_max, resolution)
+
+    # Add the x values where z or x reach their clipping limits
+    breaks = [limit for limit in (x_clip, z_clip / tan_phi if tan_phi else None) if limit is not None]
+    breaks = [value for limit in breaks for value in (-limit, limit) if x_min < value < x_max]
+    x_terrain = np.unique(np.concatenate([x_terrain, breaks]))
+
+    x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
+
+    # Calculate z values using terrain inclination and clip to reasonable range
+    z_grid = np.clip(x_grid * tan_phi, -z_clip, z_clip)
+    if x_clip is not None:
+        x_grid = np.clip(x_grid, -x_clip, x_clip)
+
+    return _freeze(x_grid, y_grid, z_grid)
+
+def sample_raster(raster, x, y):
+    """
+    Bilinear interpolation of raster heights, clamped at the raster borders.
+
+    Args:
+        raster: Dictionary with ascending 'x' and 'y' axes and a (len(y), len(x)) 'z' grid
+        x: x coordinates, any shape
+        y: y coordinates, same shape as x
+
+    Returns:
+        Heights with the shape of x
+    """
+    x_axis = np.asarray(raster['x'], dtype=float)
+    y_axis = np.asarray(raster['y'], dtype=float)
+    z = np.asarray(raster['z'], dtype=float)
+
+    def cell(axis, values):
+        values = np.clip(values, axis[0], axis[-1])
+        i = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+        weight = (values - axis[i]) / (axis[i + 1] - axis[i])
+        return i, weight
+
+    i, wx = cell(x_axis, np.asarray(x, dtype=float))
+    j, wy = cell(y_axis, np.asarray(y, dtype=float))
+
+    bottom = z[j, i] * (1 - wx) + z[j, i + 1] * wx
+    top = z[j + 1, i] * (1 - wx) + z[j + 1, i + 1] * wx
+    return bottom * (1 - wy) + top * wy
+
+def raster_terrain_mesh(raster, extent, resolution=None):
+    """
+    Terrain surface sampled from a digital surface model (DSM) raster.
+
+    Args:
+        raster: Dictionary with ascending 'x' and 'y' axes, a (len(y), len(x)) 'z'
+            grid and an optional 'name' under which the mesh is cached
+        extent: (x_min, x_max, y_min, y_max) of the view
+        resolution: Fixed number of points per axis instead of the adaptive choice
+
+    Returns:
+        Read-only (x_grid, y_grid, z_grid) arrays for go.Surface
+    """
+    extent = _extent_key(extent)
+
+    def build():
+        x_min, x_max, y_min, y_max = extent
+        nx = resolution or min(terrain_resolution(x_max - x_min), len(raster['x']))
+        ny = resolution or min(terrain_resolution(y_max - y_min), len(raster['y']))
+        x_grid, y_grid = np.meshgrid(np.linspace(x_min, x_max, max(nx, 2)), np.linspace(y_min, y_max, max(ny, 2)))
+        return _freeze(x_grid, y_grid, sample_raster(raster, x_grid, y_grid))
+
+    if raster.get('name') is None:
+        return build()
+    return TERRAIN_CACHE.get_or_compute(('raster', raster['name'], extent, resolution), build)
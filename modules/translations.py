@@ -562,6 +562,54 @@ TRANSLATIONS = {
         "fr": "Visualisation de la distribution des forces",
         "it": "Visualizzazione della distribuzione delle forze"
     },
+    "color_by_force": {
+        "en": "Colour by force",
+        "de": "Nach Kraft einfärben",
+        "fr": "Colorer selon la force",
+        "it": "Colora in base alla forza"
+    },
+    "force_playback": {
+        "en": "Force Playback",
+        "de": "Kraftverlauf abspielen",
+        "fr": "Lecture des forces",
+        "it": "Riproduzione delle forze"
+    },
+    "upload_force_recording": {
+        "en": "Upload load cell recording (CSV)",
+        "de": "Aufzeichnung der Kraftmesszellen hochladen (CSV)",
+        "fr": "Charger l'enregistrement des cellules de charge (CSV)",
+        "it": "Carica registrazione delle celle di carico (CSV)"
+    },
+    "force_recording_help": {
+        "en": "First column: time in s, further columns: cable force in kN, named by cable (e.g. Rhs 1)",
+        "de": "Erste Spalte: Zeit in s, weitere Spalten: Seilkraft in kN, benannt nach Seil (z.B. Rhs 1)",
+        "fr": "Première colonne : temps en s, autres colonnes : force du câble en kN, nommées par câble (p. ex. Rhs 1)",
+        "it": "Prima colonna: tempo in s, altre colonne: forza della fune in kN, denominate per fune (es. Rhs 1)"
+    },
+    "invalid_force_recording": {
+        "en": "Invalid recording",
+        "de": "Ungültige Aufzeichnung",
+        "fr": "Enregistrement invalide",
+        "it": "Registrazione non valida"
+    },
+    "play": {
+        "en": "Play",
+        "de": "Abspielen",
+        "fr": "Lecture",
+        "it": "Riproduci"
+    },
+    "pause": {
+        "en": "Pause",
+        "de": "Pause",
+        "fr": "Pause",
+        "it": "Pausa"
+    },
+    "time": {
+        "en": "Time",
+        "de": "Zeit",
+        "fr": "Temps",
+        "it": "Tempo"
+    },
     "total_forces": {
         "en": "Total Forces",
         "de": "Gesamtkräfte",
@@ -682,6 +730,120 @@ TRANSLATIONS = {
         "fr": "Télécharger toutes les données (JSON)",
         "it": "Scarica tutti i dati (JSON)"
     },
+    "export_columnar": {
+        "en": "Columnar Archive",
+        "de": "Spaltenarchiv",
+        "fr": "Archive en colonnes",
+        "it": "Archivio a colonne"
+    },
+    "download_columnar": {
+        "en": "Download Configuration Archive",
+        "de": "Konfigurationsarchiv herunterladen",
+        "fr": "Télécharger l'archive de configuration",
+        "it": "Scarica archivio della configurazione"
+    },
+    "import_columnar": {
+        "en": "Import configuration archive (Parquet or NPZ)",
+        "de": "Konfigurationsarchiv importieren (Parquet oder NPZ)",
+        "fr": "Importer une archive de configuration (Parquet ou NPZ)",
+        "it": "Importa archivio della configurazione (Parquet o NPZ)"
+    },
+    "config_imported": {
+        "en": "Configuration imported successfully!",
+        "de": "Konfiguration erfolgreich importiert!",
+        "fr": "Configuration importée avec succès !",
+        "it": "Configurazione importata con successo!"
+    },
+    "invalid_archive": {
+        "en": "Invalid configuration archive",
+        "de": "Ungültiges Konfigurationsarchiv",
+        "fr": "Archive de configuration invalide",
+        "it": "Archivio della configurazione non valido"
+    },
+    "bulk_export": {
+        "en": "Bulk Export of Saved Configurations",
+        "de": "Sammelexport gespeicherter Konfigurationen",
+        "fr": "Export groupé des configurations enregistrées",
+        "it": "Esportazione cumulativa delle configurazioni salvate"
+    },
+    "select_saved_configs": {
+        "en": "Saved configurations",
+        "de": "Gespeicherte Konfigurationen",
+        "fr": "Configurations enregistrées",
+        "it": "Configurazioni salvate"
+    },
+    "download_bulk_export": {
+        "en": "Download Results of Selected Configurations (ZIP)",
+        "de": "Ergebnisse der ausgewählten Konfigurationen herunterladen (ZIP)",
+        "fr": "Télécharger les résultats des configurations sélectionnées (ZIP)",
+        "it": "Scarica i risultati delle configurazioni selezionate (ZIP)"
+    },
+    "no_saved_configs": {
+        "en": "No saved configurations found",
+        "de": "Keine gespeicherten Konfigurationen gefunden",
+        "fr": "Aucune configuration enregistrée trouvée",
+        "it": "Nessuna configurazione salvata trovata"
+    },
+    "num_load_cells": {
+        "en": "Load Cells",
+        "de": "Kraftmesszellen",
+        "fr": "Cellules de charge",
+        "it": "Celle di carico"
+    },
+    "max_anchor_force": {
+        "en": "Max. Anchor Force",
+        "de": "Max. Ankerkraft",
+        "fr": "Force d'ancrage max.",
+        "it": "Forza d'ancoraggio max."
+    },
+    "max_support_force": {
+        "en": "Max. Support Force",
+        "de": "Max. Stützenkraft",
+        "fr": "Force de support max.",
+        "it": "Forza del supporto max."
+    },
+    "max_cable_force": {
+        "en": "Max. Cable Force",
+        "de": "Max. Seilkraft",
+        "fr": "Force de câble max.",
+        "it": "Forza della fune max."
+    },
+    "last_saved": {
+        "en": "Last Saved",
+        "de": "Zuletzt gespeichert",
+        "fr": "Dernier enregistrement",
+        "it": "Ultimo salvataggio"
+    },
+    "error": {
+        "en": "Error",
+        "de": "Fehler",
+        "fr": "Erreur",
+        "it": "Errore"
+    },
+    "export_images": {
+        "en": "Export Figures as Images",
+        "de": "Abbildungen als Bilder exportieren",
+        "fr": "Exporter les figures en images",
+        "it": "Esporta le figure come immagini"
+    },
+    "image_format": {
+        "en": "Image format",
+        "de": "Bildformat",
+        "fr": "Format d'image",
+        "it": "Formato immagine"
+    },
+    "generate_image": {
+        "en": "Generate Image",
+        "de": "Bild erzeugen",
+        "fr": "Générer l'image",
+        "it": "Genera immagine"
+    },
+    "download_image": {
+        "en": "Download Image",
+        "de": "Bild herunterladen",
+        "fr": "Télécharger l'image",
+        "it": "Scarica immagine"
+    },
     "anchors": {
         "en": "Anchors",
         "de": "Anker",
@@ -1,61 +1,256 @@
 import numpy as np
 import plotly.graph_objects as go
 from modules.geometry import deg_to_rad, get_default_params
+from modules.forces import build_force_incidence, calculate_forces_batch
+from modules.terrain import terrain_mesh, raster_terrain_mesh
 from modules.translations import get_translation
 import streamlit as st
 
-def create_barrier_diagram(barrier_config, results=None):
-    """Create a 2D side view (x-z plane) diagram of the barrier"""
-    # Get current language
-    lang = st.session_state.get('language', 'en')
-    
-    fig = go.Figure()
-    
-    # Extract configuration
-    supports = barrier_config.get('supports', {})
-    anchors = barrier_config.get('anchors', {})
-    cables = barrier_config.get('cables', {})
-    
-    # Set up 2D view (x-z plane)
-    # Find the min and max x values to set axis range
-    x_values = []
-    for anchor_id, anchor in anchors.items():
-        if 'position' in anchor and 'x' in anchor['position']:
-            x_values.append(anchor['position']['x'])
-    
-    for support_id, support in supports.items():
-        if 'base' in support and 'x' in support['base']:
-            x_values.append(support['base']['x'])
-        if 'top' in support and 'x' in support['top']:
-            x_values.append(support['top']['x'])
-    
-    # Default values if no valid points were found
-    if not x_values:
-        x_min, x_max = -10, 10
-    else:
-        x_min = min(x_values) - 5
-        x_max = max(x_values) + 5
-    
-    # Horizontal line representing terrain
-    terrain_x = [x_min, x_max]
-    terrain_z = []
-    
-    # Use terrain inclination from params to calculate terrain profile
-    params = barrier_config.get('params', get_default_params())
-    phi_rad = deg_to_rad(params['phi'])
-    
-    for x in terrain_x:
-        terrain_z.append(x * np.tan(phi_rad))
-    
-    # Add terrain line
-    fig.add_trace(go.Scatter(
-        x=terrain_x,
-        y=terrain_z,
-        mode='lines',
-        line=dict(color='brown', width=2, dash='dash'),
-        name=get_translation("terrain", lang)
-    ))
-    
+# Barriers with at least this many supports are drawn with merged traces
+BATCHED_MIN_SUPPORTS = 10
+
+# Force annotations shown in the compact side view of the results
+MAX_RESULT_ANNOTATIONS = 40
+
+# Point budget of the optional details (base cubes, load cell markers) in the analyzer's 3D views
+LOD_DETAIL_POINTS = 4000
+
+# Colour scale and (min, max) marker size of the force heat map
+FORCE_COLORSCALE = 'YlOrRd'
+FORCE_MARKER_SIZES = (6, 24)
+
+# Frame budget of animated force playback and the shortest frame duration in ms
+ANIMATION_MAX_FRAMES = 200
+ANIMATION_MIN_FRAME_DURATION = 40
+
+# Corner offsets of the grey cube drawn at each support base and its triangles
+CUBE_SIZE = 0.5
+CUBE_VERTICES = np.array([
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]
+]) * np.array([CUBE_SIZE / 2, CUBE_SIZE / 2, CUBE_SIZE / 4])
+CUBE_FACES = np.array([
+    [0, 0, 0, 2, 2, 4],
+    [1, 2, 3, 3, 6, 5],
+    [2, 3, 7, 7, 7, 6]
+])
+
+def _point_coords(points, axes):
+    """(n, len(axes)) array of the given coordinates of a list of point dictionaries"""
+    return np.array([[point[axis] for axis in axes] for point in points], dtype=float).reshape(-1, len(axes))
+
+def _segment_arrays(start, end):
+    """
+    Interleave start and end points with NaN gaps so many segments fit in one line trace.
+
+    Returns:
+        One array per axis of length 3 * n_segments
+    """
+    segments = np.full((len(start), 3, start.shape[1]), np.nan)
+    segments[:, 0] = start
+    segments[:, 1] = end
+    return segments.reshape(-1, start.shape[1]).T
+
+def _segment_values(values):
+    """Per-point hover texts or customdata matching the points of _segment_arrays"""
+    return [item for value in values for item in (value, value, None)]
+
+def _cable_groups(cables, axes):
+    """
+    Group cables with complete coordinates for merged line traces.
+
+    Returns:
+        Dictionary mapping (type, color, has_load_cell) to a list of (cable_id, cable)
+    """
+    groups = {}
+    for cable_id, cable in cables.items():
+        if 'start_coords' not in cable or 'end_coords' not in cable:
+            continue
+        if not all(axis in cable['start_coords'] and axis in cable['end_coords'] for axis in axes):
+            continue
+        key = (cable.get('type', ''), cable.get('color', 'gray'), cable.get('has_load_cell', False))
+        groups.setdefault(key, []).append((cable_id, cable))
+    return groups
+
+def _cable_group_name(cable_type, measured, lang):
+    """Legend entry of a merged cable trace"""
+    name = get_translation(cable_type, lang) if cable_type else get_translation('cables', lang)
+    if not measured:
+        name = f"{name}: {get_translation('no_measurement', lang)}"
+    return name
+
+def _decimate_annotations(annotations, forces, max_annotations):
+    """Keep the max_annotations annotations with the largest force, in their original order"""
+    if max_annotations is None or len(annotations) <= max_annotations:
+        return annotations
+    keep = np.sort(np.argsort(-np.abs(np.asarray(forces, dtype=float)), kind='stable')[:max(max_annotations, 0)])
+    return [annotations[i] for i in keep]
+
+def force_heatmap_style(forces, max_force=None, sizes=FORCE_MARKER_SIZES):
+    """
+    Marker sizes and shared colour axis for forces shown on one colour scale.
+
+    Args:
+        forces: Forces of all elements in kN
+        max_force: Upper end of the scale, defaults to the largest force magnitude
+        sizes: (min, max) marker size, interpolated linearly over the force magnitude
+
+    Returns:
+        (marker sizes array, layout coloraxis dictionary)
+    """
+    magnitude = np.abs(np.asarray(forces, dtype=float))
+    if max_force is None:
+        max_force = magnitude.max() if magnitude.size else 0.0
+    max_force = float(max_force) or 1.0
+
+    marker_sizes = np.interp(magnitude, (0.0, max_force), sizes)
+    coloraxis = dict(colorscale=FORCE_COLORSCALE, cmin=0.0, cmax=max_force, colorbar=dict(title='kN'))
+    return marker_sizes, coloraxis
+
+def _trace_coords(arrays):
+    """Trace keyword arguments x, y (and z) from one array per axis"""
+    return dict(zip('xyz', arrays))
+
+def _heatmap_elements(supports, anchors, cables, axes):
+    """
+    Elements of the force heat map in drawing order.
+
+    Returns:
+        Dictionary with the valid 'supports' and 'anchors' and the 'measured' and
+        'unmeasured' cables, each a list of (id, element)
+    """
+    elements = {
+        'supports': [
+            (support_id, support) for support_id, support in supports.items()
+            if 'base' in support and 'top' in support
+            and all(axis in support['base'] and axis in support['top'] for axis in axes)
+        ],
+        # The side view shows the retention anchors only like the other side views
+        'anchors': [
+            (anchor_id, anchor) for anchor_id, anchor in anchors.items()
+            if (len(axes) == 3 or anchor_id.startswith('v')) and 'position' in anchor
+            and all(axis in anchor['position'] for axis in axes)
+        ],
+        'measured': [],
+        'unmeasured': []
+    }
+    for (_, _, measured), group in _cable_groups(cables, axes).items():
+        elements['measured' if measured else 'unmeasured'].extend(group)
+    return elements
+
+def _add_force_heatmap(fig, supports, anchors, cables, results, lang, axes):
+    """
+    Add the barrier coloured and sized by force magnitude with a fixed number of traces.
+
+    Supports, anchors and measured cables share one marker trace (uid
+    'force_points') on the layout colour axis. In 3D the measured cables are
+    also coloured along their lines (uid 'force_cables'). Hover labels read the
+    names from text and the forces from customdata, so animation frames only
+    need to replace numeric arrays.
+    """
+    three_d = len(axes) == 3
+    scatter = go.Scatter3d if three_d else go.Scatter
+    name_template = "%{customdata}<extra></extra>"
+    force_template = "%{text}: %{customdata:.1f} kN<extra></extra>"
+    elements = _heatmap_elements(supports, anchors, cables, axes)
+
+    points = []
+    names = []
+    forces = []
+
+    # Supports as one black line trace, their forces are shown at the base
+    if elements['supports']:
+        base = _point_coords([support['base'] for _, support in elements['supports']], axes)
+        top = _point_coords([support['top'] for _, support in elements['supports']], axes)
+        support_names = [
+            support.get('name', f"{get_translation('support', lang)} {support_id}")
+            for support_id, support in elements['supports']
+        ]
+        fig.add_trace(scatter(
+            **_trace_coords(_segment_arrays(base, top)),
+            mode='lines',
+            line=dict(color='black', width=3),
+            name=get_translation('supports', lang),
+            customdata=_segment_values(support_names),
+            hovertemplate=name_template
+        ))
+
+        points.append(base)
+        names.extend(support_names)
+        forces.extend(results.get(support_id, 0) for support_id, _ in elements['supports'])
+
+    if elements['anchors']:
+        points.append(_point_coords([anchor['position'] for _, anchor in elements['anchors']], axes))
+        names.extend(
+            anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}")
+            for anchor_id, anchor in elements['anchors']
+        )
+        forces.extend(results.get(anchor_id, 0) for anchor_id, _ in elements['anchors'])
+
+    # Measured and unmeasured cables as one line trace each
+    for measured in (False, True):
+        group = elements['measured' if measured else 'unmeasured']
+        if not group:
+            continue
+        start = _point_coords([cable['start_coords'] for _, cable in group], axes)
+        end = _point_coords([cable['end_coords'] for _, cable in group], axes)
+        cable_names = [cable.get('name', f"{get_translation('cable', lang)} {cable_id}") for cable_id, cable in group]
+
+        if not measured:
+            fig.add_trace(scatter(
+                **_trace_coords(_segment_arrays(start, end)),
+                mode='lines',
+                line=dict(color='darkgray', width=2, dash='dot'),
+                name=f"{get_translation('cables', lang)}: {get_translation('no_measurement', lang)}",
+                customdata=_segment_values(cable_names),
+                hovertemplate=name_template
+            ))
+            continue
+
+        # Each segment coloured by its force in 3D, the gap point repeats the value
+        cable_forces = np.array([cable.get('force', 0) for _, cable in group], dtype=float)
+        line = dict(color='darkgray', width=2, dash='solid')
+        if three_d:
+            line = dict(color=np.abs(np.repeat(cable_forces, 3)), coloraxis='coloraxis', width=6)
+
+        fig.add_trace(scatter(
+            **_trace_coords(_segment_arrays(start, end)),
+            mode='lines',
+            line=line,
+            name=get_translation('cables', lang),
+            text=_segment_values(cable_names),
+            customdata=np.repeat(cable_forces, 3),
+            hovertemplate=force_template,
+            uid='force_cables'
+        ))
+
+        points.append((start + end) / 2)
+        names.extend(cable_names)
+        forces.extend(cable_forces)
+
+    # All forces in one marker trace, colour and size computed over all elements at once
+    if points:
+        forces = np.asarray(forces, dtype=float)
+        sizes, coloraxis = force_heatmap_style(forces)
+        fig.add_trace(scatter(
+            **_trace_coords(np.concatenate(points).T),
+            mode='markers',
+            marker=dict(
+                size=sizes,
+                color=np.abs(forces),
+                coloraxis='coloraxis',
+                line=dict(color='black', width=1)
+            ),
+            name=get_translation('force_kn', lang),
+            text=names,
+            customdata=forces,
+            hovertemplate=force_template,
+            uid='force_points'
+        ))
+        fig.update_layout(coloraxis=coloraxis)
+
+def _add_side_elements(fig, supports, anchors, cables, results, lang):
+    """Add supports, anchors, cables and load cells to the side view with one trace per element"""
     # Add supports
     for support_id, support in supports.items():
         # Skip if support doesn't have required fields
@@ -175,6 +370,220 @@ def create_barrier_diagram(barrier_config, results=None):
                 showlegend=False,
                 hovertext=f"{get_translation('load_cell', lang)}: {cable.get('force', 0):.1f} kN"
             ))
+
+def _add_side_elements_compact(fig, supports, anchors, cables, results, lang, max_annotations=None):
+    """Add supports, anchors, cables and load cells to the side view in a few merged traces"""
+    # Hover labels are read from customdata ([name, force] per point)
+    name_template = "%{customdata[0]}<br>(%{x:.2f}, %{y:.2f})<extra></extra>"
+    force_template = "%{customdata[0]}: %{customdata[1]:.1f} kN<br>(%{x:.2f}, %{y:.2f})<extra></extra>"
+
+    annotations = []
+    annotation_forces = []
+
+    # Supports as one line trace with markers at base and top
+    valid_supports = [
+        (support_id, support) for support_id, support in supports.items()
+        if 'base' in support and 'top' in support
+        and all(axis in support['base'] and axis in support['top'] for axis in 'xz')
+    ]
+    if valid_supports:
+        base = _point_coords([support['base'] for _, support in valid_supports], 'xz')
+        top = _point_coords([support['top'] for _, support in valid_supports], 'xz')
+        x, z = _segment_arrays(base, top)
+
+        customdata = []
+        for support_id, support in valid_supports:
+            support_name = support.get('name', f"{get_translation('support', lang)} {support_id}")
+            force = results.get(support_id, 0) if results else 0
+            customdata.append([support_name, force])
+
+            if results:
+                annotations.append(dict(
+                    x=support['base']['x'],
+                    y=support['base']['z'] - 1,
+                    text=f"{support_name}: {force:.1f} kN",
+                    showarrow=False,
+                    font=dict(size=10, color='black'),
+                    bgcolor='white',
+                    bordercolor='black',
+                    borderwidth=1
+                ))
+                annotation_forces.append(force)
+
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=z,
+            mode='lines+markers',
+            line=dict(color='black', width=3),
+            marker=dict(symbol='square', size=10, color='white', line=dict(color='black', width=2)),
+            name=get_translation('supports', lang),
+            customdata=_segment_values(customdata),
+            hovertemplate=force_template if results else name_template
+        ))
+
+    # Retention cable anchors as one marker trace
+    valid_anchors = [
+        (anchor_id, anchor) for anchor_id, anchor in anchors.items()
+        if anchor_id.startswith('v') and 'position' in anchor
+        and all(axis in anchor['position'] for axis in 'xz')
+    ]
+    if valid_anchors:
+        positions = _point_coords([anchor['position'] for _, anchor in valid_anchors], 'xz')
+
+        customdata = []
+        for anchor_id, anchor in valid_anchors:
+            anchor_name = anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}")
+            force = results.get(anchor_id, 0) if results else 0
+            customdata.append([anchor_name, force])
+
+            if results:
+                annotations.append(dict(
+                    x=anchor['position']['x'],
+                    y=anchor['position']['z'] + 1,
+                    text=f"{anchor_name}: {force:.1f} kN",
+                    showarrow=False,
+                    font=dict(size=10, color='green'),
+                    bgcolor='white',
+                    bordercolor='black',
+                    borderwidth=1
+                ))
+                annotation_forces.append(force)
+
+        fig.add_trace(go.Scatter(
+            x=positions[:, 0],
+            y=positions[:, 1],
+            mode='markers',
+            marker=dict(symbol='cross', size=12, color='black'),
+            name=get_translation('anchors', lang),
+            customdata=customdata,
+            hovertemplate=force_template if results else name_template
+        ))
+
+    # One trace per cable type, color and line style
+    load_cell_points = []
+    load_cell_forces = []
+    for (cable_type, color, measured), group in _cable_groups(cables, 'xz').items():
+        start = _point_coords([cable['start_coords'] for _, cable in group], 'xz')
+        end = _point_coords([cable['end_coords'] for _, cable in group], 'xz')
+        x, z = _segment_arrays(start, end)
+
+        customdata = [
+            [cable.get('name', f"{get_translation('cable', lang)} {cable_id}"), cable.get('force', 0)]
+            for cable_id, cable in group
+        ]
+        if measured:
+            load_cell_points.append((start + end) / 2)
+            load_cell_forces.extend(force for _, force in customdata)
+
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=z,
+            mode='lines',
+            line=dict(color=color, width=2, dash=None if measured else 'dot'),
+            name=_cable_group_name(cable_type, measured, lang),
+            legendgroup=cable_type,
+            customdata=_segment_values(customdata),
+            hovertemplate=(
+                force_template if measured
+                else f"%{{customdata[0]}}: {get_translation('no_measurement', lang)}<extra></extra>"
+            )
+        ))
+
+    # Load cell markers at the middle of the measured cables
+    if load_cell_points:
+        middle = np.concatenate(load_cell_points)
+        fig.add_trace(go.Scatter(
+            x=middle[:, 0],
+            y=middle[:, 1],
+            mode='markers',
+            marker=dict(
+                symbol='circle',
+                size=8,
+                color='white',
+                line=dict(color='black', width=1)
+            ),
+            name=get_translation('load_cell', lang),
+            showlegend=False,
+            customdata=load_cell_forces,
+            hovertemplate=f"{get_translation('load_cell', lang)}: %{{customdata:.1f}} kN<extra></extra>"
+        ))
+
+    # Add all force annotations at once
+    if annotations:
+        fig.update_layout(annotations=_decimate_annotations(annotations, annotation_forces, max_annotations))
+
+def create_barrier_diagram(barrier_config, results=None, compact=None, max_annotations=None, heatmap=False, lang=None):
+    """
+    Create a 2D side view (x-z plane) diagram of the barrier.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        results: Optional force results shown as hover texts and annotations
+        compact: Merge elements into a few traces (None: automatic by barrier size)
+        max_annotations: In compact mode, only annotate this many points with the largest forces
+        heatmap: With results, colour and size supports, anchors and load cells by force instead of annotating them
+        lang: Display language, defaults to the session language
+    """
+    # Get current language unless given
+    if lang is None:
+        lang = st.session_state.get('language', 'en')
+    
+    fig = go.Figure()
+    
+    # Extract configuration
+    supports = barrier_config.get('supports', {})
+    anchors = barrier_config.get('anchors', {})
+    cables = barrier_config.get('cables', {})
+    
+    # Set up 2D view (x-z plane)
+    # Find the min and max x values to set axis range
+    x_values = []
+    for anchor_id, anchor in anchors.items():
+        if 'position' in anchor and 'x' in anchor['position']:
+            x_values.append(anchor['position']['x'])
+    
+    for support_id, support in supports.items():
+        if 'base' in support and 'x' in support['base']:
+            x_values.append(support['base']['x'])
+        if 'top' in support and 'x' in support['top']:
+            x_values.append(support['top']['x'])
+    
+    # Default values if no valid points were found
+    if not x_values:
+        x_min, x_max = -10, 10
+    else:
+        x_min = min(x_values) - 5
+        x_max = max(x_values) + 5
+    
+    # Horizontal line representing terrain
+    terrain_x = [x_min, x_max]
+    terrain_z = []
+    
+    # Use terrain inclination from params to calculate terrain profile
+    params = barrier_config.get('params', get_default_params())
+    phi_rad = deg_to_rad(params['phi'])
+    
+    for x in terrain_x:
+        terrain_z.append(x * np.tan(phi_rad))
+    
+    # Add terrain line
+    fig.add_trace(go.Scatter(
+        x=terrain_x,
+        y=terrain_z,
+        mode='lines',
+        line=dict(color='brown', width=2, dash='dash'),
+        name=get_translation("terrain", lang)
+    ))
+    
+    # Add supports, anchors, cables and load cells
+    if compact is None:
+        compact = len(supports) >= BATCHED_MIN_SUPPORTS
+    if heatmap and results:
+        _add_force_heatmap(fig, supports, anchors, cables, results, lang, 'xz')
+    elif compact:
+        _add_side_elements_compact(fig, supports, anchors, cables, results, lang, max_annotations)
+    else:
+        _add_side_elements(fig, supports, anchors, cables, results, lang)
     
     # Update layout
     fig.update_layout(
@@ -193,18 +602,8 @@ def create_barrier_diagram(barrier_config, results=None):
     
     return fig
 
-def create_top_view(barrier_config):
-    """Create a top view of the barrier (x-y plane)"""
-    # Get current language
-    lang = st.session_state.get('language', 'en')
-    
-    fig = go.Figure()
-    
-    # Extract configuration
-    supports = barrier_config.get('supports', {})
-    anchors = barrier_config.get('anchors', {})
-    cables = barrier_config.get('cables', {})
-    
+def _add_top_elements(fig, supports, anchors, cables, lang):
+    """Add supports, anchors and cables to the top view with one trace per element"""
     # Add supports
     for support_id, support in supports.items():
         # Skip if base doesn't have required fields
@@ -268,6 +667,97 @@ def create_top_view(barrier_config):
             line=dict(color=cable.get('color', 'gray'), width=2, dash=line_dash),
             name=cable_name
         ))
+
+def _add_top_elements_compact(fig, supports, anchors, cables, lang):
+    """Add supports, anchors and cables to the top view in a few merged traces"""
+    name_template = "%{customdata}<br>(%{x:.2f}, %{y:.2f})<extra></extra>"
+
+    # Support bases as one marker trace
+    valid_supports = [
+        (support_id, support) for support_id, support in supports.items()
+        if 'base' in support and all(axis in support['base'] for axis in 'xy')
+    ]
+    if valid_supports:
+        base = _point_coords([support['base'] for _, support in valid_supports], 'xy')
+        fig.add_trace(go.Scatter(
+            x=base[:, 0],
+            y=base[:, 1],
+            mode='markers',
+            marker=dict(symbol='square', size=10, color='white', line=dict(color='black', width=2)),
+            name=get_translation('supports', lang),
+            customdata=[
+                support.get('name', f"{get_translation('support', lang)} {support_id}")
+                for support_id, support in valid_supports
+            ],
+            hovertemplate=name_template
+        ))
+
+    # Anchors as one marker trace
+    valid_anchors = [
+        (anchor_id, anchor) for anchor_id, anchor in anchors.items()
+        if 'position' in anchor and all(axis in anchor['position'] for axis in 'xy')
+    ]
+    if valid_anchors:
+        positions = _point_coords([anchor['position'] for _, anchor in valid_anchors], 'xy')
+        fig.add_trace(go.Scatter(
+            x=positions[:, 0],
+            y=positions[:, 1],
+            mode='markers',
+            marker=dict(symbol='cross', size=12, color='black'),
+            name=get_translation('anchors', lang),
+            customdata=[
+                anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}")
+                for anchor_id, anchor in valid_anchors
+            ],
+            hovertemplate=name_template
+        ))
+
+    # One trace per cable type, color and line style
+    for (cable_type, color, measured), group in _cable_groups(cables, 'xy').items():
+        start = _point_coords([cable['start_coords'] for _, cable in group], 'xy')
+        end = _point_coords([cable['end_coords'] for _, cable in group], 'xy')
+        x, y = _segment_arrays(start, end)
+
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=y,
+            mode='lines',
+            line=dict(color=color, width=2, dash=None if measured else 'dot'),
+            name=_cable_group_name(cable_type, measured, lang),
+            legendgroup=cable_type,
+            customdata=_segment_values([
+                cable.get('name', f"{get_translation('cable', lang)} {cable_id}") for cable_id, cable in group
+            ]),
+            hovertemplate=name_template
+        ))
+
+def create_top_view(barrier_config, compact=None, lang=None):
+    """
+    Create a top view of the barrier (x-y plane).
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        compact: Merge elements into a few traces (None: automatic by barrier size)
+        lang: Display language, defaults to the session language
+    """
+    # Get current language unless given
+    if lang is None:
+        lang = st.session_state.get('language', 'en')
+    
+    fig = go.Figure()
+    
+    # Extract configuration
+    supports = barrier_config.get('supports', {})
+    anchors = barrier_config.get('anchors', {})
+    cables = barrier_config.get('cables', {})
+    
+    # Add supports, anchors and cables
+    if compact is None:
+        compact = len(supports) >= BATCHED_MIN_SUPPORTS
+    if compact:
+        _add_top_elements_compact(fig, supports, anchors, cables, lang)
+    else:
+        _add_top_elements(fig, supports, anchors, cables, lang)
     
     # Update layout
     fig.update_layout(
@@ -292,132 +782,8 @@ def create_top_view(barrier_config):
     
     return fig
 
-def create_3d_view(barrier_config, results=None):
-    """Create a 3D view of the barrier configuration"""
-    # Get current language
-    lang = st.session_state.get('language', 'en')
-    
-    fig = go.Figure()
-    
-    # Extract configuration
-    supports = barrier_config.get('supports', {})
-    anchors = barrier_config.get('anchors', {})
-    cables = barrier_config.get('cables', {})
-    
-    # Find the min and max x and y values to set terrain range
-    x_values = []
-    y_values = []
-    
-    for anchor_id, anchor in anchors.items():
-        if 'position' in anchor:
-            if 'x' in anchor['position']:
-                x_values.append(anchor['position']['x'])
-            if 'y' in anchor['position']:
-                y_values.append(anchor['position']['y'])
-    
-    for support_id, support in supports.items():
-        if 'base' in support:
-            if 'x' in support['base']:
-                x_values.append(support['base']['x'])
-            if 'y' in support['base']:
-                y_values.append(support['base']['y'])
-    
-    # Default values if no valid points were found
-    if not x_values:
-        x_min, x_max = -10, 10
-    else:
-        x_min = min(x_values) - 5
-        x_max = max(x_values) + 5
-        
-    if not y_values:
-        y_min, y_max = -10, 10
-    else:
-        y_min = min(y_values) - 5
-        y_max = max(y_values) + 5
-    
-    # Create a terrain mesh grid
-    params = barrier_config.get('params', get_default_params())
-    phi = params['phi']
-    phi_rad = deg_to_rad(params['phi'])
-    
-    if phi == 90:
-        # For vertical terrain, create a vertical plane at x=0
-        n_points = 20
-        
-        # Create 2D arrays for the vertical plane
-        y_grid = np.linspace(y_min, y_max, n_points)
-        z_grid = np.linspace(-20, 20, n_points)
-        y_grid, z_grid = np.meshgrid(y_grid, z_grid)
-        
-        # Fixed x position at 0
-        x_grid = np.zeros_like(y_grid)
-
-    elif phi >= 87:
-        # Generate normal terrain grid points
-        x_terrain = np.linspace(x_min, x_max, 50)
-        y_terrain = np.linspace(y_min, y_max, 50)
-        x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
-        
-        # Calculate z values using terrain inclination and clip to reasonable range
-        z_grid = x_grid * np.tan(phi_rad)
-        z_grid = np.clip(z_grid, -20, 20)  # Limit to -20 to +20 range
-        x_grid = np.clip(x_grid, -1, 1)
-
-    elif phi >= 85:
-        # Generate normal terrain grid points
-        x_terrain = np.linspace(x_min, x_max, 50)
-        y_terrain = np.linspace(y_min, y_max, 50)
-        x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
-        
-        # Calculate z values using terrain inclination and clip to reasonable range
-        z_grid = x_grid * np.tan(phi_rad)
-        z_grid = np.clip(z_grid, -20, 20)  # Limit to -20 to +20 range
-        x_grid = np.clip(x_grid, -2, 2)
-    
-    elif phi >= 80:
-        # Generate normal terrain grid points
-        x_terrain = np.linspace(x_min, x_max, 50)
-        y_terrain = np.linspace(y_min, y_max, 50)
-        x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
-        
-        # Calculate z values using terrain inclination and clip to reasonable range
-        z_grid = x_grid * np.tan(phi_rad)
-        z_grid = np.clip(z_grid, -20, 20)  # Limit to -20 to +20 range
-        x_grid = np.clip(x_grid, -4, 4)
-
-    elif phi >= 70:
-        # Generate normal terrain grid points
-        x_terrain = np.linspace(x_min, x_max, 50)
-        y_terrain = np.linspace(y_min, y_max, 50)
-        x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
-        
-        # Calculate z values using terrain inclination and clip to reasonable range
-        z_grid = x_grid * np.tan(phi_rad)
-        z_grid = np.clip(z_grid, -25, 25)  # Limit to -20 to +20 range
-        # x_grid = np.clip(x_grid, -4, 4)
-
-    else:
-        # Generate normal terrain grid points
-        x_terrain = np.linspace(x_min, x_max, 20)
-        y_terrain = np.linspace(y_min, y_max, 20)
-        x_grid, y_grid = np.meshgrid(x_terrain, y_terrain)
-        
-        # Calculate z values using terrain inclination and clip to reasonable range
-        z_grid = x_grid * np.tan(phi_rad)
-        z_grid = np.clip(z_grid, -20, 20)  # Limit to -20 to +20 range
-    
-    # Add terrain surface (with hover disabled)
-    fig.add_trace(go.Surface(
-        x=x_grid,
-        y=y_grid,
-        z=z_grid,
-        colorscale='Earth',
-        opacity=0.8,
-        showscale=False,
-        name=get_translation("terrain", lang),
-        hoverinfo='skip'  # Disable hover for terrain
-    ))
-    
+def _add_3d_elements(fig, supports, anchors, cables, results, lang):
+    """Add supports, anchors, cables and load cells with one trace per element"""
     # Add supports as simple 3D lines with grey cube at base
     for support_id, support in supports.items():
         # Skip if support doesn't have required fields
@@ -587,6 +953,299 @@ def create_3d_view(barrier_config, results=None):
                 hoverinfo='text',
                 showlegend=False
             ))
+
+def lod_budget(detail_points, num_supports, num_anchors, num_cables, num_load_cells):
+    """
+    Decide which optional details of the 3D view fit into a point budget.
+
+    Supports, anchors and cables are always drawn at full detail and count
+    against the budget first. The remaining points go to the base cubes (8
+    vertices each, or a single marker each if the cubes do not fit) and then
+    to the load cell markers. The budget only limits these details, the total
+    number of points exceeds it when the supports, anchors and cables alone
+    need more.
+
+    Args:
+        detail_points: Point budget for the optional details, None for full detail
+        num_supports: Number of supports
+        num_anchors: Number of anchors
+        num_cables: Number of cables
+        num_load_cells: Number of cables with a load cell
+
+    Returns:
+        Dictionary with 'cubes' ('mesh', 'markers' or None) and the number of 'load_cells' to draw
+    """
+    if detail_points is None:
+        return {'cubes': 'mesh', 'load_cells': num_load_cells}
+
+    # Line traces need three points per segment (start, end, gap)
+    remaining = detail_points - 3 * num_supports - 3 * num_cables - num_anchors
+
+    if remaining >= 8 * num_supports:
+        cubes = 'mesh'
+        remaining -= 8 * num_supports
+    elif remaining >= num_supports:
+        cubes = 'markers'
+        remaining -= num_supports
+    else:
+        cubes = None
+
+    return {'cubes': cubes, 'load_cells': int(np.clip(remaining, 0, num_load_cells))}
+
+def _add_3d_elements_batched(fig, supports, anchors, cables, results, lang, detail_points=None):
+    """
+    Add supports, anchors, cables and load cells with one trace per element kind and cable style.
+
+    With a detail_points budget (level of detail mode) base cubes are simplified
+    or dropped, only the load cells with the largest forces are marked and the
+    legend shows one entry per cable type.
+    """
+    # Supports with complete base and top coordinates
+    valid_supports = [
+        (support_id, support) for support_id, support in supports.items()
+        if 'base' in support and 'top' in support
+        and all(axis in support['base'] and axis in support['top'] for axis in 'xyz')
+    ]
+
+    # Anchors with complete coordinates
+    valid_anchors = [
+        (anchor_id, anchor) for anchor_id, anchor in anchors.items()
+        if 'position' in anchor and all(axis in anchor['position'] for axis in 'xyz')
+    ]
+
+    groups = _cable_groups(cables, 'xyz')
+    num_cables = sum(len(group) for group in groups.values())
+    num_load_cells = sum(len(group) for (_, _, measured), group in groups.items() if measured)
+
+    budget = lod_budget(detail_points, len(valid_supports), len(valid_anchors), num_cables, num_load_cells)
+
+    if valid_supports:
+        base = _point_coords([support['base'] for _, support in valid_supports], 'xyz')
+        top = _point_coords([support['top'] for _, support in valid_supports], 'xyz')
+
+        if budget['cubes'] == 'mesh':
+            # All base cubes in one mesh, the vertex indices of cube n are offset by 8 * n
+            vertices = (base[:, None, :] + CUBE_VERTICES[None, :, :]).reshape(-1, 3)
+            faces = CUBE_FACES[None, :, :] + 8 * np.arange(len(base))[:, None, None]
+            fig.add_trace(go.Mesh3d(
+                x=vertices[:, 0],
+                y=vertices[:, 1],
+                z=vertices[:, 2],
+                i=faces[:, 0].ravel(),
+                j=faces[:, 1].ravel(),
+                k=faces[:, 2].ravel(),
+                color='grey',
+                opacity=1,
+                flatshading=True,
+                name=get_translation('base', lang),
+                hoverinfo='skip'
+            ))
+        elif budget['cubes'] == 'markers':
+            # Simplified bases, one square marker per support
+            fig.add_trace(go.Scatter3d(
+                x=base[:, 0],
+                y=base[:, 1],
+                z=base[:, 2],
+                mode='markers',
+                marker=dict(size=4, color='grey', symbol='square'),
+                name=get_translation('base', lang),
+                hoverinfo='skip',
+                showlegend=False
+            ))
+
+        hover_text = []
+        for support_id, support in valid_supports:
+            support_name = support.get('name', f"{get_translation('support', lang)} {support_id}")
+            hover_text.append(f"{support_name} - {results.get(support_id, 0):.1f} kN" if results else support_name)
+
+        x, y, z = _segment_arrays(base, top)
+        fig.add_trace(go.Scatter3d(
+            x=x,
+            y=y,
+            z=z,
+            mode='lines',
+            line=dict(color='black', width=6),
+            name=get_translation('supports', lang),
+            text=_segment_values(hover_text),
+            hoverinfo='text'
+        ))
+
+    # Anchors as one marker trace, retention anchors in red
+    if valid_anchors:
+        positions = _point_coords([anchor['position'] for _, anchor in valid_anchors], 'xyz')
+
+        hover_text = []
+        for anchor_id, anchor in valid_anchors:
+            anchor_name = anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}")
+            hover_text.append(f"{anchor_name}: {results.get(anchor_id, 0):.1f} kN" if results else anchor_name)
+
+        fig.add_trace(go.Scatter3d(
+            x=positions[:, 0],
+            y=positions[:, 1],
+            z=positions[:, 2],
+            mode='markers',
+            marker=dict(
+                size=12,
+                color=['red' if anchor_id.startswith('v') else 'green' for anchor_id, _ in valid_anchors],
+                symbol='cross',
+                line=dict(color='black', width=1)
+            ),
+            name=get_translation('anchors', lang),
+            text=hover_text,
+            hoverinfo='text'
+        ))
+
+    # One trace per cable type, color and line style
+    load_cells = []
+    legend_types = set()
+    for (cable_type, color, measured), group in groups.items():
+        start = _point_coords([cable['start_coords'] for _, cable in group], 'xyz')
+        end = _point_coords([cable['end_coords'] for _, cable in group], 'xyz')
+        x, y, z = _segment_arrays(start, end)
+
+        hover_text = []
+        for cable_id, cable in group:
+            cable_name = cable.get('name', f"{get_translation('cable', lang)} {cable_id}")
+            if measured:
+                hover_text.append(f"{cable_name} - {cable.get('force', 0):.1f} kN")
+                load_cells.append(cable)
+            else:
+                hover_text.append(f"{cable_name}: {get_translation('no_measurement', lang)}")
+
+        if detail_points is None:
+            name = _cable_group_name(cable_type, measured, lang)
+            show_legend = True
+        else:
+            # Level of detail: one legend entry per cable type
+            name = get_translation(cable_type, lang) if cable_type else get_translation('cables', lang)
+            show_legend = cable_type not in legend_types
+            legend_types.add(cable_type)
+
+        fig.add_trace(go.Scatter3d(
+            x=x,
+            y=y,
+            z=z,
+            mode='lines',
+            line=dict(color=color, width=4, dash='solid' if measured else 'dash'),
+            name=name,
+            legendgroup=cable_type,
+            showlegend=show_legend,
+            text=_segment_values(hover_text),
+            hoverinfo='text'
+        ))
+
+    # Load cell markers at the middle of the measured cables, largest forces first if limited
+    if len(load_cells) > budget['load_cells']:
+        forces = np.array([abs(cable.get('force', 0)) for cable in load_cells])
+        keep = np.sort(np.argsort(-forces, kind='stable')[:budget['load_cells']])
+        load_cells = [load_cells[i] for i in keep]
+
+    if load_cells:
+        start = _point_coords([cable['start_coords'] for cable in load_cells], 'xyz')
+        end = _point_coords([cable['end_coords'] for cable in load_cells], 'xyz')
+        middle = (start + end) / 2
+
+        fig.add_trace(go.Scatter3d(
+            x=middle[:, 0],
+            y=middle[:, 1],
+            z=middle[:, 2],
+            mode='markers',
+            marker=dict(
+                size=6,
+                color='white',
+                symbol='circle',
+                line=dict(color='black', width=1)
+            ),
+            name=get_translation('load_cell', lang),
+            text=[f"{get_translation('load_cell', lang)}: {cable.get('force', 0):.1f} kN" for cable in load_cells],
+            hoverinfo='text',
+            showlegend=False
+        ))
+
+def create_3d_view(barrier_config, results=None, batched=None, terrain=None, detail_points=None, heatmap=False, lang=None):
+    """
+    Create a 3D view of the barrier configuration.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        results: Optional force results shown in the hover texts
+        batched: Merge elements into one trace per cable type (None: automatic by barrier size)
+        terrain: Optional DSM raster (see terrain.raster_terrain_mesh) instead of the inclined plane
+        detail_points: Point budget for base cubes and load cell markers in batched mode, the
+            barrier elements themselves are always drawn in full (see lod_budget)
+        heatmap: With results, colour and size the barrier elements by force (see force_heatmap_style)
+        lang: Display language, defaults to the session language
+    """
+    # Get current language unless given
+    if lang is None:
+        lang = st.session_state.get('language', 'en')
+    
+    fig = go.Figure()
+    
+    # Extract configuration
+    supports = barrier_config.get('supports', {})
+    anchors = barrier_config.get('anchors', {})
+    cables = barrier_config.get('cables', {})
+    
+    # Find the min and max x and y values to set terrain range
+    x_values = []
+    y_values = []
+    
+    for anchor_id, anchor in anchors.items():
+        if 'position' in anchor:
+            if 'x' in anchor['position']:
+                x_values.append(anchor['position']['x'])
+            if 'y' in anchor['position']:
+                y_values.append(anchor['position']['y'])
+    
+    for support_id, support in supports.items():
+        if 'base' in support:
+            if 'x' in support['base']:
+                x_values.append(support['base']['x'])
+            if 'y' in support['base']:
+                y_values.append(support['base']['y'])
+    
+    # Default values if no valid points were found
+    if not x_values:
+        x_min, x_max = -10, 10
+    else:
+        x_min = min(x_values) - 5
+        x_max = max(x_values) + 5
+        
+    if not y_values:
+        y_min, y_max = -10, 10
+    else:
+        y_min = min(y_values) - 5
+        y_max = max(y_values) + 5
+    
+    # Terrain mesh grid, cached by inclination and extent
+    params = barrier_config.get('params', get_default_params())
+    if terrain is not None:
+        x_grid, y_grid, z_grid = raster_terrain_mesh(terrain, (x_min, x_max, y_min, y_max))
+    else:
+        x_grid, y_grid, z_grid = terrain_mesh(params['phi'], (x_min, x_max, y_min, y_max))
+    
+    # Add terrain surface (with hover disabled)
+    fig.add_trace(go.Surface(
+        x=x_grid,
+        y=y_grid,
+        z=z_grid,
+        colorscale='Earth',
+        opacity=0.8,
+        showscale=False,
+        name=get_translation("terrain", lang),
+        hoverinfo='skip'  # Disable hover for terrain
+    ))
+    
+    # Add supports, anchors, cables and load cells
+    if batched is None:
+        batched = len(supports) >= BATCHED_MIN_SUPPORTS
+    if heatmap and results:
+        _add_force_heatmap(fig, supports, anchors, cables, results, lang, 'xyz')
+    elif batched:
+        _add_3d_elements_batched(fig, supports, anchors, cables, results, lang, detail_points)
+    else:
+        _add_3d_elements(fig, supports, anchors, cables, results, lang)
     
     # Update layout for 3D view - DISABLE GRID LINES ON HOVER
     fig.update_layout(
@@ -622,4 +1281,163 @@ def create_3d_view(barrier_config, results=None):
         )
     )
     
-    return fig
\ No newline at end of file
+    return fig
+
+def downsample_frames(force_matrix, max_frames=ANIMATION_MAX_FRAMES):
+    """
+    Pick at most max_frames samples of a force time series for playback.
+
+    The samples are split into max_frames consecutive bins and the sample with
+    the largest total force magnitude of each bin is kept, so short impact
+    peaks survive the downsampling.
+
+    Args:
+        force_matrix: (T, n_cables) array of cable forces
+        max_frames: Frame budget
+
+    Returns:
+        Sorted array of sample indices
+    """
+    forces = np.atleast_2d(np.asarray(force_matrix, dtype=float))
+    num_samples = len(forces)
+    if num_samples <= max_frames:
+        return np.arange(num_samples)
+
+    bins = np.arange(num_samples) * max_frames // num_samples
+    magnitude = np.nan_to_num(np.abs(forces)).sum(axis=1)
+
+    # Sort by bin, then by descending magnitude, and take the first sample of every bin
+    order = np.lexsort((-magnitude, bins))
+    return np.sort(order[np.searchsorted(bins[order], np.arange(max_frames))])
+
+def create_force_animation(barrier_config, force_matrix, times=None, cable_ids=None, max_frames=ANIMATION_MAX_FRAMES,
+                           frame_duration=None, terrain=None, lang=None):
+    """
+    Create an animated 3D force heat map replaying a load cell recording.
+
+    The first frame is drawn with create_3d_view(heatmap=True). The animation
+    frames only replace the force arrays of the cable and force marker traces
+    (colours, sizes and hover values), the geometry is sent once. All frames
+    share one colour scale over the whole recording.
+
+    Args:
+        barrier_config: Barrier configuration dictionary
+        force_matrix: (T, n_cables) array of measured cable forces in kN
+        times: (T,) sample times in seconds, defaults to the sample index
+        cable_ids: Cables in the order of the force_matrix columns, defaults to all cables
+        max_frames: Frame budget, longer recordings are downsampled (see downsample_frames)
+        frame_duration: Duration of a frame in ms, defaults to real-time playback
+        terrain: Optional DSM raster passed to create_3d_view
+        lang: Display language, defaults to the session language
+
+    Returns:
+        go.Figure with frames, a play/pause button and a time slider
+    """
+    # Get current language unless given
+    if lang is None:
+        lang = st.session_state.get('language', 'en')
+
+    forces = np.atleast_2d(np.asarray(force_matrix, dtype=float))
+    times = np.arange(len(forces), dtype=float) if times is None else np.asarray(times, dtype=float)
+    frames = downsample_frames(forces, max_frames)
+
+    incidence = build_force_incidence(barrier_config, cable_ids)
+    batch = calculate_forces_batch(barrier_config, forces[frames], incidence=incidence)
+
+    # Forces of all elements per frame, columns in the order of the heat map traces
+    elements = _heatmap_elements(
+        barrier_config.get('supports', {}), barrier_config.get('anchors', {}), barrier_config.get('cables', {}), 'xyz'
+    )
+    column = {cable_id: i for i, cable_id in enumerate(incidence['cable_ids'])}
+    support_column = {support_id: i for i, support_id in enumerate(batch['support_ids'])}
+    anchor_column = {anchor_id: i for i, anchor_id in enumerate(batch['anchor_ids'])}
+
+    def columns(matrix, index, items):
+        selected = np.zeros((len(frames), len(items)))
+        for i, (item_id, _) in enumerate(items):
+            if item_id in index:
+                selected[:, i] = matrix[:, index[item_id]]
+        return selected
+
+    cable_forces = columns(forces[frames], column, elements['measured'])
+    point_forces = np.hstack([
+        columns(batch['supports'], support_column, elements['supports']),
+        columns(batch['anchors'], anchor_column, elements['anchors']),
+        cable_forces
+    ])
+    sizes, coloraxis = force_heatmap_style(point_forces.ravel())
+    # Whole pixel sizes fit into one byte per point
+    sizes = np.round(sizes).astype(np.uint8).reshape(point_forces.shape)
+
+    # First frame as a static heat map
+    measured_column = {cable_id: i for i, (cable_id, _) in enumerate(elements['measured'])}
+    first = {
+        **barrier_config,
+        'cables': {
+            cable_id: {**cable, 'force': float(cable_forces[0, measured_column[cable_id]])}
+            if cable_id in measured_column else cable
+            for cable_id, cable in barrier_config.get('cables', {}).items()
+        }
+    }
+    results = {
+        **dict(zip(batch['anchor_ids'], batch['anchors'][0].tolist())),
+        **dict(zip(batch['support_ids'], batch['supports'][0].tolist()))
+    }
+    fig = create_3d_view(first, results, terrain=terrain, heatmap=True, lang=lang)
+    fig.update_layout(coloraxis=coloraxis)
+
+    def frame_traces(f):
+        # Only the force arrays change, float32 arrays are sent base64 encoded
+        traces = {
+            'force_cables': go.Scatter3d(
+                line=dict(color=np.abs(np.repeat(cable_forces[f], 3)).astype(np.float32)),
+                customdata=np.repeat(cable_forces[f], 3).astype(np.float32)
+            ),
+            'force_points': go.Scatter3d(
+                marker=dict(size=sizes[f], color=np.abs(point_forces[f]).astype(np.float32)),
+                customdata=point_forces[f].astype(np.float32)
+            )
+        }
+        return [traces[trace.uid] for trace in fig.data if trace.uid in traces]
+
+    animated = [i for i, trace in enumerate(fig.data) if trace.uid in ('force_cables', 'force_points')]
+    # Frames are looked up by name, times can round to the same label at high sample rates
+    fig.frames = [
+        go.Frame(name=str(f), traces=animated, data=frame_traces(f))
+        for f in range(len(frames))
+    ]
+
+    # Real-time playback unless a frame duration is given
+    if frame_duration is None:
+        span = times[frames[-1]] - times[frames[0]] if len(frames) > 1 else 0.0
+        frame_duration = max(ANIMATION_MIN_FRAME_DURATION, float(span) * 1000 / max(len(frames) - 1, 1))
+    play = dict(frame=dict(duration=frame_duration, redraw=True), transition=dict(duration=0), fromcurrent=True)
+    pause = dict(frame=dict(duration=0, redraw=False), mode='immediate', transition=dict(duration=0))
+
+    fig.update_layout(
+        updatemenus=[dict(
+            type='buttons',
+            direction='left',
+            x=0.01,
+            y=0.0,
+            xanchor='left',
+            yanchor='top',
+            buttons=[
+                dict(label=get_translation('play', lang), method='animate', args=[None, play]),
+                dict(label=get_translation('pause', lang), method='animate', args=[[None], pause])
+            ]
+        )],
+        sliders=[dict(
+            x=0.15,
+            y=0.0,
+            len=0.85,
+            currentvalue=dict(prefix=f"{get_translation('time', lang)}: ", suffix=" s"),
+            steps=[
+                dict(label=f"{times[sample]:.3f}", method='animate', args=[[frame.name], pause])
+                for frame, sample in zip(fig.frames, frames)
+            ]
+        )]
+    )
+
+    return fig
+
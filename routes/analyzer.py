@@ -1,21 +1,28 @@
 import streamlit as st
-import pandas as pd
 import json
 import base64
+import hashlib
 from datetime import datetime
 from modules.geometry import (
-    get_default_params, calculate_3d_coordinates, 
-    apply_parameter_changes, validate_parameter_limits, 
+    get_default_params, update_3d_coordinates, 
+    apply_parameter_changes_cached, validate_parameter_limits, 
     calculate_tau, calculate_theta, calculate_delta
 )
 from modules.forces import calculate_forces
-from modules.visualization import create_barrier_diagram, create_top_view, create_3d_view
-from modules.data import save_barrier_config
+from modules.visualization import (
+    create_barrier_diagram, create_top_view, create_3d_view, create_force_animation,
+    MAX_RESULT_ANNOTATIONS, LOD_DETAIL_POINTS
+)
+from modules.data import save_barrier_config, load_force_recording, list_saved_configs
+from modules.barrier_model import ConfigOverlay
+from modules.figure_cache import figure_cache_key, get_cached_figure
+from modules.image_export import IMAGE_FORMATS, export_config_images
+from modules.export import build_anchor_table, build_support_table, build_cable_table, iter_bulk_export
+from modules.columnar import DEFAULT_COLUMNAR_FORMAT, COLUMNAR_MIME_TYPES, export_columnar, import_columnar
 from modules.translations import get_translation
 from config import get_config
 import os
 from PIL import Image
-import copy
 
 def handle_parameter_change(param_name):
     """
@@ -25,9 +32,10 @@ def handle_parameter_change(param_name):
     new_value = st.session_state[f'param_{param_name}']
     
     params = st.session_state.barrier_config['params']
-    updated_params, changed_params, validation, warnings = apply_parameter_changes(params, param_name, new_value)
+    updated_params, changed_params, validation, warnings = apply_parameter_changes_cached(params, param_name, new_value)
     
     st.session_state.barrier_config['params'] = updated_params
+    bump_config_version()
     
     # Store any warnings for display
     if warnings:
@@ -37,17 +45,715 @@ def handle_parameter_change(param_name):
 
 def get_visualization_config(barrier_config):
     """
-    Creates a modified barrier config for visualization that uses the display_phi
-    instead of the current phi value.
+    Read-only view of the barrier config for visualization that uses the
+    display_phi instead of the current phi value, without copying the config.
+    """
+    if 'display_phi' in st.session_state:
+        return ConfigOverlay(barrier_config, phi=st.session_state.display_phi)
+    return barrier_config
+
+def bump_config_version():
+    """Mark the barrier config as changed so the results context is recomputed"""
+    st.session_state.config_version = st.session_state.get('config_version', 0) + 1
+
+def get_results_context(lang):
+    """
+    Force results and result tables of the current barrier config.
+
+    They are computed once per config version (see bump_config_version) and
+    language and shared by the Results and Export tabs. Replacing the config
+    object, e.g. on login, also invalidates the context.
+
+    Returns:
+        Dictionary with the force 'results' and the 'anchors', 'supports' and 'cables' DataFrames
+    """
+    barrier_config = st.session_state.barrier_config
+    key = (st.session_state.get('config_version', 0), lang)
+
+    # The config object itself is kept, an id() may be reused once a replaced config is freed
+    context = st.session_state.get('results_context')
+    if context is None or context['config'] is not barrier_config or context['key'] != key:
+        results = calculate_forces(barrier_config)
+        context = {
+            'config': barrier_config,
+            'key': key,
+            'results': results,
+            'anchors': build_anchor_table(barrier_config, results, lang),
+            'supports': build_support_table(barrier_config, results, lang),
+            'cables': build_cable_table(barrier_config, lang)
+        }
+        st.session_state.results_context = context
+    return context
+
+def normalize_load_cells(barrier_config):
+    """Mark which cables can have a load cell, only segments connected to an anchor can"""
+    for cable_id, cable in barrier_config['cables'].items():
+        if cable.get('start', '') in barrier_config['anchors'] or cable.get('end', '') in barrier_config['anchors']:
+            # Ensure it's marked as capable of having a load cell in the configuration
+            cable['can_have_load_cell'] = True
+        else:
+            # An intermediate segment is marked as not capable of having a load cell
+            cable['can_have_load_cell'] = False
+            if cable.get('has_load_cell', False):
+                cable['has_load_cell'] = False
+                bump_config_version()
+
+def render_geometry_tab(lang):
+    """Geometry setup tab: barrier parameters and preview of the configuration"""
+    st.subheader(get_translation("barrier_geometry", lang))
+    
+    # Create columns for parameters and schema
+    col1, col2 = st.columns([1, 1.5])
+    
+    with col1:
+        # Basic barrier configuration
+        st.markdown(f"### {get_translation('basic_config', lang)}")
+        num_supports = st.slider(
+            get_translation("num_supports", lang), 
+            min_value=2, 
+            max_value=6, 
+            value=st.session_state.barrier_config['params']['num_supports'], 
+            step=1,
+            key="param_num_supports",
+            on_change=lambda: handle_parameter_change('num_supports')
+        )
+        
+        # Create columns for parameters
+        col1a, col1b = st.columns(2)
+
+        with col1a:
+            # Distances
+            b = st.number_input(
+                f"b: {get_translation('edge_distance', lang)} (m)", 
+                min_value=0.5, 
+                value=float(st.session_state.barrier_config['params']['b']), 
+                step=0.1,
+                key="param_b",
+                on_change=lambda: handle_parameter_change('b')
+            )
+            
+            d = st.number_input(
+                f"d: {get_translation('support_distance', lang)} (m)", 
+                min_value=1.0, 
+                value=float(st.session_state.barrier_config['params']['d']), 
+                step=0.1,
+                key="param_d",
+                on_change=lambda: handle_parameter_change('d')
+            )
+            
+            h = st.number_input(
+                f"h: {get_translation('base_anchor_height', lang)} (m)", 
+                min_value=0.5, 
+                value=float(st.session_state.barrier_config['params']['h']), 
+                step=0.1,
+                key="param_h",
+                on_change=lambda: handle_parameter_change('h')
+            )
+            
+            f = st.number_input(
+                f"f: {get_translation('foundation_overhang', lang)} (m)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['f']), 
+                step=0.1,
+                key="param_f",
+                on_change=lambda: handle_parameter_change('f')
+            )
+            
+            L = st.number_input(
+                f"L: {get_translation('support_length', lang)} (m)", 
+                min_value=1.0, 
+                value=float(st.session_state.barrier_config['params']['L']), 
+                step=0.1,
+                key="param_L",
+                on_change=lambda: handle_parameter_change('L')
+            )
+
+        with col1b:
+            # Angles
+            theta = st.number_input(
+                f"θ ({get_translation('theta', lang)}): {get_translation('retention_cable_angle', lang)} (°)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['theta']), 
+                step=1.0,
+                key="param_theta",
+                on_change=lambda: handle_parameter_change('theta')
+            )
+            
+            delta = st.number_input(
+                f"δ ({get_translation('delta', lang)}): {get_translation('upper_support_cable_angle', lang)} (°)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['delta']), 
+                step=1.0,
+                key="param_delta",
+                on_change=lambda: handle_parameter_change('delta')
+            )
+            
+            epsilon = st.number_input(
+                f"ε ({get_translation('epsilon', lang)}): {get_translation('support_inclination', lang)} (°)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['epsilon']), 
+                step=1.0,
+                key="param_epsilon",
+                on_change=lambda: handle_parameter_change('epsilon')
+            )
+            
+            tau = st.number_input(
+                f"τ ({get_translation('tau', lang)}): {get_translation('support_cable_angle', lang)} (°)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['tau']), 
+                step=1.0,
+                key="param_tau",
+                on_change=lambda: handle_parameter_change('tau')
+            )
+            
+            phi = st.number_input(
+                f"φ ({get_translation('phi', lang)}): {get_translation('terrain_inclination', lang)} (°)", 
+                min_value=0.0, 
+                value=float(st.session_state.barrier_config['params']['phi']), 
+                step=1.0,
+                key="param_phi",
+                on_change=lambda: handle_parameter_change('phi')
+            )
+        
+        # Optional intermediate cables
+        st.markdown(f"### {get_translation('optional_components', lang)}")
+        col1c, col1d = st.columns(2)
+        
+        with col1c:
+            has_delta1 = st.checkbox(
+                get_translation("include_intermediate_cable1", lang), 
+                value=st.session_state.barrier_config['params']['has_delta1'],
+                key="param_has_delta1",
+                on_change=lambda: handle_parameter_change('has_delta1')
+            )
+            
+            if has_delta1:
+                delta1 = st.number_input(
+                    f"δ₁ ({get_translation('delta1', lang)}): {get_translation('intermediate_cable1_angle', lang)} (°)", 
+                    min_value=0.0, 
+                    value=float(st.session_state.barrier_config['params']['delta1']), 
+                    step=1.0,
+                    key="param_delta1",
+                    on_change=lambda: handle_parameter_change('delta1')
+                )
+            else:
+                st.session_state.barrier_config['params']['delta1'] = 0
+        
+        with col1d:
+            has_delta2 = st.checkbox(
+                get_translation("include_intermediate_cable2", lang), 
+                value=st.session_state.barrier_config['params']['has_delta2'],
+                key="param_has_delta2",
+                on_change=lambda: handle_parameter_change('has_delta2')
+            )
+            
+            if has_delta2:
+                delta2 = st.number_input(
+                    f"δ₂ ({get_translation('delta2', lang)}): {get_translation('intermediate_cable2_angle', lang)} (°)", 
+                    min_value=0.0, 
+                    value=float(st.session_state.barrier_config['params']['delta2']), 
+                    step=1.0,
+                    key="param_delta2",
+                    on_change=lambda: handle_parameter_change('delta2')
+                )
+            else:
+                st.session_state.barrier_config['params']['delta2'] = 0
+        
+        # Update geometry button
+        if st.button(get_translation("update_barrier_geometry", lang)):
+            # Display any accumulated warnings before updating
+            if 'param_warnings' in st.session_state and st.session_state.param_warnings:
+                st.warning("\n".join(st.session_state.param_warnings))
+                st.session_state.param_warnings = []  # Clear warnings after showing them
+            
+            # Update the display_phi to match the current phi
+            st.session_state.display_phi = st.session_state.barrier_config['params']['phi']
+
+            # Recalculate the coordinates affected by parameter changes, keeping entered forces
+            st.session_state.barrier_config = update_3d_coordinates(
+                st.session_state.barrier_config,
+                st.session_state.barrier_config['params']
+            )
+            bump_config_version()
+            save_barrier_config(st.session_state.username, st.session_state.barrier_config)
+            st.success(get_translation("geometry_updated", lang))
+    
+    with col2:
+        # Display preview of barrier using current configuration
+        st.markdown(f"### {get_translation('current_config_preview', lang)}")
+        
+        view_type = st.radio(
+            get_translation("select_view_type", lang), 
+            [
+                get_translation("3d_view", lang),
+                get_translation("2d_side_view", lang),
+                get_translation("2d_top_view", lang)
+            ],
+            horizontal=True,
+            key="config_view_type",
+            format_func=lambda x: x  # We're already passing translated values
+        )
+        
+        # Display the selected view, rebuilt only when the cached figure is outdated
+        barrier_config = st.session_state.barrier_config
+        display_phi = st.session_state.display_phi
+        if view_type == get_translation("2d_side_view", lang):
+            side_view = get_cached_figure(
+                figure_cache_key(barrier_config, 'geometry_side', lang, display_phi),
+                lambda: create_barrier_diagram(get_visualization_config(barrier_config))
+            )
+            st.plotly_chart(side_view, use_container_width=True, key="geometry_side_view")
+        elif view_type == get_translation("2d_top_view", lang):
+            top_view = get_cached_figure(
+                figure_cache_key(barrier_config, 'geometry_top', lang, display_phi),
+                lambda: create_top_view(get_visualization_config(barrier_config))
+            )
+            st.plotly_chart(top_view, use_container_width=True, key="geometry_top_view")
+        else:
+            view_3d = get_cached_figure(
+                figure_cache_key(barrier_config, 'geometry_3d', lang, display_phi),
+                lambda: create_3d_view(get_visualization_config(barrier_config), detail_points=LOD_DETAIL_POINTS)
+            )
+            st.plotly_chart(view_3d, use_container_width=True, key="geometry_3d_view")
+
+    # Display barrier schema
+    st.markdown(f"### {get_translation('barrier_schema', lang)}")
+
+    st.markdown('<div class="schema-container">', unsafe_allow_html=True)
+    schema_path = "assets/schema.png"  # Adjust path to match your schema location
+    
+    # Check if schema file exists
+    if os.path.exists(schema_path):
+        schema = Image.open(schema_path)
+        st.image(schema, use_container_width=True)  # Adjust width as needed
+    else:
+        # Fallback if image not found
+        st.warning("schema image not found. Please add the image file to assets/schema.png")
+        
+        # Placeholder rectangle for schema position
+        st.markdown("""
+        <div style="background-color: #f0f0f0; padding: 20px; border-radius: 10px; width: 200px; height: 80px; text-align: center;">
+            <p style="margin: 0; color: #666;">schema</p>
+        </div>
+        """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown(f"""
+    **{get_translation('parameters', lang)}:**""")
+
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown(f"""
+            **θ ({get_translation('theta', lang)})**: {get_translation('theta_desc', lang)}<br>
+            **δ ({get_translation('delta', lang)})**: {get_translation('delta_desc', lang)}<br>
+            **δ₁ ({get_translation('delta1', lang)})**: {get_translation('delta1_desc', lang)}<br>
+            **δ₂ ({get_translation('delta2', lang)})**: {get_translation('delta2_desc', lang)}<br>
+            **ε ({get_translation('epsilon', lang)})**: {get_translation('epsilon_desc', lang)}<br>
+            **τ ({get_translation('tau', lang)})**: {get_translation('tau_desc', lang)}<br>
+            **φ ({get_translation('phi', lang)})**: {get_translation('phi_desc', lang)}""", unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+            **a**: {get_translation('a_desc', lang)}<br>
+            **b**: {get_translation('b_desc', lang)}<br>
+            **d**: {get_translation('d_desc', lang)}<br>
+            **f**: {get_translation('f_desc', lang)}<br>
+            **h**: {get_translation('h_desc', lang)}<br>
+            **L**: {get_translation('L_desc', lang)}
+            """, unsafe_allow_html=True)
+
+def render_force_tab(lang):
+    """Force measurement tab: measured cable forces and load cells"""
+    st.subheader(get_translation("force_measurement_input", lang))
+    
+    # Display list of cables with force input fields
+    st.markdown(f"### {get_translation('cable_force_inputs', lang)}")
+    st.markdown(get_translation("enter_forces", lang))
+    
+    # Create a multi-column layout for cable inputs
+    force_cols = st.columns(3)
+    
+    # Group cables by type for better organization
+    cable_groups = {
+        'rhs': {'name': get_translation("rhs", lang), 'cables': []},
+        'tso': {'name': get_translation("tso", lang), 'cables': []},
+        'tsu': {'name': get_translation("tsu", lang), 'cables': []},
+        'fa': {'name': get_translation("fa", lang), 'cables': []},
+        'sa': {'name': get_translation("sa", lang), 'cables': []},
+        'zw': {'name': get_translation("zw", lang), 'cables': []}  # Add catching cables if missing
+    }
+
+    # Group cables by type, filtering out intermediate segments
+    for cable_id, cable in st.session_state.barrier_config['cables'].items():
+        cable_type = cable.get('type', '')
+        
+        # Check if this is an anchor-connected segment
+        is_anchor_segment = False
+        start_point = cable.get('start', '')
+        end_point = cable.get('end', '')
+        
+        # Only include anchor-connected segments, intermediate segments are not shown in the UI
+        if (start_point in st.session_state.barrier_config['anchors'] or 
+            end_point in st.session_state.barrier_config['anchors']):
+            # This is an anchor-connected segment, include it
+            if cable_type in cable_groups:
+                cable_groups[cable_type]['cables'].append((cable_id, cable))
+
+    # Distribute cable groups across columns
+    col_index = 0
+    for group_type, group in cable_groups.items():
+        # Only show groups that have cables
+        if group['cables']:
+            with force_cols[col_index % 3]:
+                st.markdown(f"#### {group['name']}")
+                
+                for cable_id, cable in group['cables']:
+                    # Create a row for each cable with force input and load cell toggle
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        # Force input field
+                        force = st.number_input(
+                            f"{cable['name']} {get_translation('force_kn', lang)}", 
+                            min_value=0.0, 
+                            value=float(cable['force']), 
+                            step=0.1,
+                            key=f"force_{cable_id}",
+                            format="%.1f"
+                        )
+                        if force != cable['force']:
+                            st.session_state.barrier_config['cables'][cable_id]['force'] = force
+                            bump_config_version()
+                    
+                    with col2:
+                        # Load cell toggle
+                        has_load_cell = st.checkbox(
+                            get_translation("load_cell", lang), 
+                            value=cable['has_load_cell'],
+                            key=f"load_cell_{cable_id}"
+                        )
+                        if has_load_cell != cable['has_load_cell']:
+                            st.session_state.barrier_config['cables'][cable_id]['has_load_cell'] = has_load_cell
+                            bump_config_version()
+                
+                st.markdown("---")
+            
+            col_index += 1
+    
+    # Save force measurements button
+    if st.button(get_translation("save_force_measurements", lang)):
+        save_barrier_config(st.session_state.username, st.session_state.barrier_config)
+        st.success(get_translation("forces_saved", lang))
+
+def render_results_tab(lang):
+    """Results tab: force visualization, totals, result tables and force playback"""
+    st.subheader(get_translation("force_calculation_results", lang))
+    
+    # Forces and tables of the current configuration, shared with the Export tab
+    results_context = get_results_context(lang)
+    results = results_context['results']
+    
+    # Display result visualization
+    st.markdown(f"### {get_translation('force_distribution_viz', lang)}")
+
+    results_view_type = st.radio(
+        get_translation("select_view_type", lang), 
+        [
+            get_translation("3d_view", lang),
+            get_translation("2d_side_view", lang)
+        ],
+        horizontal=True,
+        key="results_view_type",
+        format_func=lambda x: x  # We're already passing translated values
+    )
+    
+    # Colour and size the elements by force magnitude instead of labelling them
+    heatmap = st.checkbox(get_translation("color_by_force", lang), key="results_heatmap")
+    view_suffix = '_heatmap' if heatmap else ''
+    
+    # Display the selected view, the cache key covers the cable forces the results depend on
+    if results_view_type == get_translation("2d_side_view", lang):
+        result_view = get_cached_figure(
+            figure_cache_key(st.session_state.barrier_config, f"results_side{view_suffix}", lang),
+            lambda: create_barrier_diagram(
+                st.session_state.barrier_config, results, max_annotations=MAX_RESULT_ANNOTATIONS, heatmap=heatmap
+            )
+        )
+        st.plotly_chart(result_view, use_container_width=True, key="results_view")
+    else:  # 3D View
+        result_3d_view = get_cached_figure(
+            figure_cache_key(st.session_state.barrier_config, f"results_3d{view_suffix}", lang),
+            lambda: create_3d_view(
+                st.session_state.barrier_config, results, detail_points=LOD_DETAIL_POINTS, heatmap=heatmap
+            )
+        )
+        st.plotly_chart(result_3d_view, use_container_width=True, key="results_3d_view")
+    
+    # Display total forces
+    st.markdown(f"### {get_translation('total_forces', lang)}")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric(get_translation("total_anchor_force", lang), f"{results['total_anchor_force']:.1f} kN")
+    
+    with col2:
+        st.metric(get_translation("total_support_force", lang), f"{results['total_support_force']:.1f} kN")
+    
+    # Display detailed results in tables
+    st.markdown(f"### {get_translation('detailed_force_results', lang)}")
+    
+    df_anchors = results_context['anchors']
+    df_supports = results_context['supports']
+    
+    # Display tables
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.markdown(f"#### {get_translation('anchor_forces', lang)}")
+        st.dataframe(df_anchors, use_container_width=True)
+    
+    with col4:
+        st.markdown(f"#### {get_translation('support_forces', lang)}")
+        st.dataframe(df_supports, use_container_width=True)
+    
+    # Replay a logged load cell recording as an animated force heat map
+    st.markdown(f"### {get_translation('force_playback', lang)}")
+    recording = st.file_uploader(
+        get_translation("upload_force_recording", lang),
+        type=['csv'],
+        help=get_translation("force_recording_help", lang),
+        key="force_recording"
+    )
+    if recording is not None:
+        def build_playback():
+            times, force_matrix, cable_ids = load_force_recording(recording, st.session_state.barrier_config)
+            return create_force_animation(st.session_state.barrier_config, force_matrix, times, cable_ids)
+        
+        # The recording is read and downsampled once per file and configuration
+        recording_digest = hashlib.blake2b(recording.getvalue(), digest_size=8).hexdigest()
+        try:
+            playback = get_cached_figure(
+                figure_cache_key(st.session_state.barrier_config, f"playback_{recording_digest}", lang),
+                build_playback
+            )
+            st.plotly_chart(playback, use_container_width=True, key="playback_view")
+        except ValueError as e:
+            st.error(f"{get_translation('invalid_force_recording', lang)}: {e}")
+
+def deferred_export(results_context, name, build):
+    """
+    Download data that is serialized only when the download is requested.
+
+    Returns a callable for st.download_button. Streamlit calls it on a
+    separate thread when the button is clicked, so build must not use
+    st.session_state. The serialized data is kept per export name until the
+    results context is recomputed (new config, config version or language),
+    repeated downloads of an unchanged config reuse it.
     """
-    # Create a deep copy to avoid modifying the original
-    viz_config = copy.deepcopy(barrier_config)
+    cache = st.session_state.get('export_payloads')
+    if cache is None or cache['context'] is not results_context:
+        cache = {'context': results_context, 'payloads': {}}
+        st.session_state.export_payloads = cache
+    payloads = cache['payloads']
+
+    def data():
+        if name not in payloads:
+            payloads[name] = build()
+        return payloads[name]
+
+    return data
+
+def render_export_tab(lang):
+    """Export tab: JSON, CSV and image downloads"""
+    st.subheader(get_translation("export_data", lang))
+    
+    # Forces and tables computed once for the current configuration
+    results_context = get_results_context(lang)
+    results = results_context['results']
+    df_anchors = results_context['anchors']
+    df_supports = results_context['supports']
+    df_cables = results_context['cables']
+    
+    # Session values are read here, the payloads are built outside of the script run
+    barrier_config = st.session_state.barrier_config
+    username = st.session_state.username
+    
+    def build_export_json():
+        export_data = {
+            'barrier_config': barrier_config,
+            'force_results': results,
+            'exported_by': username,
+            'export_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        return json.dumps(export_data, indent=2)
+    
+    # Download button, the JSON is only serialized when requested
+    st.download_button(
+        label=get_translation("download_complete_config", lang),
+        data=deferred_export(results_context, 'complete_json', build_export_json),
+        file_name="rockfall_barrier_analysis.json",
+        mime="application/json"
+    )
+    
+    # Export CSV options
+    st.markdown(f"### {get_translation('export_results_csv', lang)}")
+    
+    # Prepare CSV data
+    col5, col6 = st.columns(2)
+    
+    with col5:
+        # Export anchor forces
+        st.download_button(
+            label=get_translation("download_anchor_forces_csv", lang),
+            data=deferred_export(results_context, 'anchors_csv', lambda: df_anchors.to_csv(index=False)),
+            file_name="anchor_forces.csv",
+            mime="text/csv",
+            key="download_anchors"
+        )
+    
+    with col6:
+        # Export support forces
+        st.download_button(
+            label=get_translation("download_support_forces_csv", lang),
+            data=deferred_export(results_context, 'supports_csv', lambda: df_supports.to_csv(index=False)),
+            file_name="support_forces.csv",
+            mime="text/csv",
+            key="download_supports"
+        )
+    
+    # Export cable forces
+    st.download_button(
+        label=get_translation("download_cable_forces_csv", lang),
+        data=deferred_export(results_context, 'cables_csv', lambda: df_cables.to_csv(index=False)),
+        file_name="cable_forces.csv",
+        mime="text/csv",
+        key="download_cables"
+    )
+    
+    # Export all data in one JSON
+    st.markdown(f"### {get_translation('export_all_data', lang)}")
+    
+    def build_all_json():
+        # Combine all data
+        all_data = {
+            get_translation('anchors', lang): df_anchors.to_dict(orient='records') if not df_anchors.empty else [],
+            get_translation('supports', lang): df_supports.to_dict(orient='records'),
+            get_translation('cables', lang): df_cables.to_dict(orient='records'),
+            get_translation('total_anchor_force', lang): results.get('total_anchor_force', 0),
+            get_translation('total_support_force', lang): results.get('total_support_force', 0),
+            get_translation('parameters', lang): barrier_config.get('params', get_default_params())
+        }
+        return json.dumps(all_data, indent=2)
+    
+    st.download_button(
+        label=get_translation("download_all_json", lang),
+        data=deferred_export(results_context, 'all_json', build_all_json),
+        file_name="all_data.json",
+        mime="application/json",
+        key="download_all_json"
+    )
+    
+    # Compact binary archive with typed columns, faster to load than JSON
+    st.markdown(f"### {get_translation('export_columnar', lang)}")
+    
+    st.download_button(
+        label=get_translation("download_columnar", lang),
+        data=deferred_export(results_context, 'columnar', lambda: export_columnar(barrier_config, results)),
+        file_name=f"barrier_config.{DEFAULT_COLUMNAR_FORMAT}",
+        mime=COLUMNAR_MIME_TYPES[DEFAULT_COLUMNAR_FORMAT],
+        key="download_columnar"
+    )
+    
+    archive = st.file_uploader(
+        get_translation("import_columnar", lang),
+        type=['parquet', 'npz'],
+        key="import_columnar"
+    )
+    # An uploaded archive replaces the configuration once, not on every rerun
+    if archive is not None:
+        archive_data = archive.getvalue()
+        archive_digest = hashlib.blake2b(archive_data, digest_size=8).hexdigest()
+        if st.session_state.get('imported_archive') == archive_digest:
+            st.success(get_translation("config_imported", lang))
+        else:
+            try:
+                st.session_state.barrier_config = import_columnar(archive_data)
+            except (ValueError, KeyError, ImportError) as e:
+                st.error(f"{get_translation('invalid_archive', lang)}: {e}")
+            else:
+                st.session_state.imported_archive = archive_digest
+                st.session_state.display_phi = st.session_state.barrier_config['params'].get('phi', 15.0)
+                bump_config_version()
+                save_barrier_config(st.session_state.username, st.session_state.barrier_config)
+                # The downloads above were created from the replaced configuration
+                st.rerun()
     
-    # Replace phi with the display version
-    if 'params' in viz_config and 'display_phi' in st.session_state:
-        viz_config['params']['phi'] = st.session_state.display_phi
+    # Results of several saved configurations in one ZIP archive
+    st.markdown(f"### {get_translation('bulk_export', lang)}")
     
-    return viz_config
+    # Only administrators can export the configurations of other users
+    saved_configs = list_saved_configs()
+    if st.session_state.users[username].get("role", "user") != "admin":
+        saved_configs = [name for name in saved_configs if name == username]
+    
+    if saved_configs:
+        selected_configs = st.multiselect(
+            get_translation("select_saved_configs", lang),
+            saved_configs,
+            default=saved_configs,
+            key="bulk_export_selection"
+        )
+        st.download_button(
+            label=get_translation("download_bulk_export", lang),
+            data=lambda: b"".join(iter_bulk_export(selected_configs, lang)),
+            file_name=f"barrier_reports_{datetime.now().strftime('%Y%m%d')}.zip",
+            mime="application/zip",
+            disabled=not selected_configs,
+            key="download_bulk_export"
+        )
+    else:
+        st.info(get_translation("no_saved_configs", lang))
+    
+    # Export figures as PNG or SVG images
+    st.markdown(f"### {get_translation('export_images', lang)}")
+    
+    image_views = {
+        'side': get_translation("2d_side_view", lang),
+        'top': get_translation("2d_top_view", lang),
+        '3d': get_translation("3d_view", lang)
+    }
+    col7, col8 = st.columns(2)
+    with col7:
+        image_view = st.selectbox(
+            get_translation("select_view_type", lang),
+            list(image_views),
+            format_func=image_views.get,
+            key="export_image_view"
+        )
+    with col8:
+        image_format = st.radio(
+            get_translation("image_format", lang),
+            IMAGE_FORMATS,
+            format_func=str.upper,
+            horizontal=True,
+            key="export_image_format"
+        )
+    
+    # Images are only rendered on request, the last one is kept as long as it is up to date
+    image_key = figure_cache_key(st.session_state.barrier_config, f"image_{image_view}_{image_format}", lang)
+    if st.button(get_translation("generate_image", lang), key="generate_image"):
+        image = export_config_images(st.session_state.barrier_config, (image_view,), image_format, lang)[image_view]
+        st.session_state.export_image = (image_key, image)
+    
+    export_image = st.session_state.get('export_image')
+    if export_image and export_image[0] == image_key:
+        st.download_button(
+            label=get_translation("download_image", lang),
+            data=export_image[1],
+            file_name=f"barrier_{image_view}.{image_format}",
+            mime="image/png" if image_format == 'png' else "image/svg+xml",
+            key="download_image"
+        )
 
 def analyzer_page():
     """Display the main analyzer page with barrier configuration and force calculation"""
@@ -92,593 +798,23 @@ def analyzer_page():
     # Ensure barrier_config has params
     if 'params' not in st.session_state.barrier_config:
         st.session_state.barrier_config['params'] = get_default_params()
+        bump_config_version()
     
-    # Create tabs for different sections
+    # Load cells are only possible on anchor-connected cables, whichever tab is shown
+    normalize_load_cells(st.session_state.barrier_config)
+    
+    # Create tabs for different sections, switching tabs reruns the page with the new tab open
     tabs = st.tabs([
         get_translation("geometry_setup", lang), 
         get_translation("force_measurement", lang), 
         get_translation("results", lang), 
         get_translation("export", lang)
-    ])
-    
-    # Tab 1: Geometry Setup
-    with tabs[0]:
-        st.subheader(get_translation("barrier_geometry", lang))
-        
-        # Create columns for parameters and schema
-        col1, col2 = st.columns([1, 1.5])
-        
-        with col1:
-            # Basic barrier configuration
-            st.markdown(f"### {get_translation('basic_config', lang)}")
-            num_supports = st.slider(
-                get_translation("num_supports", lang), 
-                min_value=2, 
-                max_value=6, 
-                value=st.session_state.barrier_config['params']['num_supports'], 
-                step=1,
-                key="param_num_supports",
-                on_change=lambda: handle_parameter_change('num_supports')
-            )
-            
-            # Create columns for parameters
-            col1a, col1b = st.columns(2)
-
-            with col1a:
-                # Distances
-                b = st.number_input(
-                    f"b: {get_translation('edge_distance', lang)} (m)", 
-                    min_value=0.5, 
-                    value=float(st.session_state.barrier_config['params']['b']), 
-                    step=0.1,
-                    key="param_b",
-                    on_change=lambda: handle_parameter_change('b')
-                )
-                
-                d = st.number_input(
-                    f"d: {get_translation('support_distance', lang)} (m)", 
-                    min_value=1.0, 
-                    value=float(st.session_state.barrier_config['params']['d']), 
-                    step=0.1,
-                    key="param_d",
-                    on_change=lambda: handle_parameter_change('d')
-                )
-                
-                h = st.number_input(
-                    f"h: {get_translation('base_anchor_height', lang)} (m)", 
-                    min_value=0.5, 
-                    value=float(st.session_state.barrier_config['params']['h']), 
-                    step=0.1,
-                    key="param_h",
-                    on_change=lambda: handle_parameter_change('h')
-                )
-                
-                f = st.number_input(
-                    f"f: {get_translation('foundation_overhang', lang)} (m)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['f']), 
-                    step=0.1,
-                    key="param_f",
-                    on_change=lambda: handle_parameter_change('f')
-                )
-                
-                L = st.number_input(
-                    f"L: {get_translation('support_length', lang)} (m)", 
-                    min_value=1.0, 
-                    value=float(st.session_state.barrier_config['params']['L']), 
-                    step=0.1,
-                    key="param_L",
-                    on_change=lambda: handle_parameter_change('L')
-                )
-
-            with col1b:
-                # Angles
-                theta = st.number_input(
-                    f"θ ({get_translation('theta', lang)}): {get_translation('retention_cable_angle', lang)} (°)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['theta']), 
-                    step=1.0,
-                    key="param_theta",
-                    on_change=lambda: handle_parameter_change('theta')
-                )
-                
-                delta = st.number_input(
-                    f"δ ({get_translation('delta', lang)}): {get_translation('upper_support_cable_angle', lang)} (°)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['delta']), 
-                    step=1.0,
-                    key="param_delta",
-                    on_change=lambda: handle_parameter_change('delta')
-                )
-                
-                epsilon = st.number_input(
-                    f"ε ({get_translation('epsilon', lang)}): {get_translation('support_inclination', lang)} (°)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['epsilon']), 
-                    step=1.0,
-                    key="param_epsilon",
-                    on_change=lambda: handle_parameter_change('epsilon')
-                )
-                
-                tau = st.number_input(
-                    f"τ ({get_translation('tau', lang)}): {get_translation('support_cable_angle', lang)} (°)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['tau']), 
-                    step=1.0,
-                    key="param_tau",
-                    on_change=lambda: handle_parameter_change('tau')
-                )
-                
-                phi = st.number_input(
-                    f"φ ({get_translation('phi', lang)}): {get_translation('terrain_inclination', lang)} (°)", 
-                    min_value=0.0, 
-                    value=float(st.session_state.barrier_config['params']['phi']), 
-                    step=1.0,
-                    key="param_phi",
-                    on_change=lambda: handle_parameter_change('phi')
-                )
-            
-            # Optional intermediate cables
-            st.markdown(f"### {get_translation('optional_components', lang)}")
-            col1c, col1d = st.columns(2)
-            
-            with col1c:
-                has_delta1 = st.checkbox(
-                    get_translation("include_intermediate_cable1", lang), 
-                    value=st.session_state.barrier_config['params']['has_delta1'],
-                    key="param_has_delta1",
-                    on_change=lambda: handle_parameter_change('has_delta1')
-                )
-                
-                if has_delta1:
-                    delta1 = st.number_input(
-                        f"δ₁ ({get_translation('delta1', lang)}): {get_translation('intermediate_cable1_angle', lang)} (°)", 
-                        min_value=0.0, 
-                        value=float(st.session_state.barrier_config['params']['delta1']), 
-                        step=1.0,
-                        key="param_delta1",
-                        on_change=lambda: handle_parameter_change('delta1')
-                    )
-                else:
-                    st.session_state.barrier_config['params']['delta1'] = 0
-            
-            with col1d:
-                has_delta2 = st.checkbox(
-                    get_translation("include_intermediate_cable2", lang), 
-                    value=st.session_state.barrier_config['params']['has_delta2'],
-                    key="param_has_delta2",
-                    on_change=lambda: handle_parameter_change('has_delta2')
-                )
-                
-                if has_delta2:
-                    delta2 = st.number_input(
-                        f"δ₂ ({get_translation('delta2', lang)}): {get_translation('intermediate_cable2_angle', lang)} (°)", 
-                        min_value=0.0, 
-                        value=float(st.session_state.barrier_config['params']['delta2']), 
-                        step=1.0,
-                        key="param_delta2",
-                        on_change=lambda: handle_parameter_change('delta2')
-                    )
-                else:
-                    st.session_state.barrier_config['params']['delta2'] = 0
-            
-            # Update geometry button
-            if st.button(get_translation("update_barrier_geometry", lang)):
-                # Display any accumulated warnings before updating
-                if 'param_warnings' in st.session_state and st.session_state.param_warnings:
-                    st.warning("\n".join(st.session_state.param_warnings))
-                    st.session_state.param_warnings = []  # Clear warnings after showing them
-                
-                # Update the display_phi to match the current phi
-                st.session_state.display_phi = st.session_state.barrier_config['params']['phi']
-
-                # Recalculate 3D coordinates with current parameters
-                st.session_state.barrier_config = calculate_3d_coordinates(st.session_state.barrier_config['params'])
-                save_barrier_config(st.session_state.username, st.session_state.barrier_config)
-                st.success(get_translation("geometry_updated", lang))
-        
-        with col2:
-            # Display preview of barrier using current configuration
-            st.markdown(f"### {get_translation('current_config_preview', lang)}")
-            
-            view_type = st.radio(
-                get_translation("select_view_type", lang), 
-                [
-                    get_translation("3d_view", lang),
-                    get_translation("2d_side_view", lang),
-                    get_translation("2d_top_view", lang)
-                ],
-                horizontal=True,
-                key="config_view_type",
-                format_func=lambda x: x  # We're already passing translated values
-            )
-            
-            # Display the selected view
-            if view_type == get_translation("2d_side_view", lang):
-                viz_config = get_visualization_config(st.session_state.barrier_config)
-                side_view = create_barrier_diagram(viz_config)
-                st.plotly_chart(side_view, use_container_width=True, key="geometry_side_view")
-            elif view_type == get_translation("2d_top_view", lang):
-                viz_config = get_visualization_config(st.session_state.barrier_config)
-                top_view = create_top_view(viz_config)
-                st.plotly_chart(top_view, use_container_width=True, key="geometry_top_view")
-            else:
-                viz_config = get_visualization_config(st.session_state.barrier_config)
-                view_3d = create_3d_view(viz_config)
-                st.plotly_chart(view_3d, use_container_width=True, key="geometry_3d_view")
-
-        # Display barrier schema
-        st.markdown(f"### {get_translation('barrier_schema', lang)}")
-
-        st.markdown('<div class="schema-container">', unsafe_allow_html=True)
-        schema_path = "assets/schema.png"  # Adjust path to match your schema location
-        
-        # Check if schema file exists
-        if os.path.exists(schema_path):
-            schema = Image.open(schema_path)
-            st.image(schema, use_container_width=True)  # Adjust width as needed
-        else:
-            # Fallback if image not found
-            st.warning("schema image not found. Please add the image file to assets/schema.png")
-            
-            # Placeholder rectangle for schema position
-            st.markdown("""
-            <div style="background-color: #f0f0f0; padding: 20px; border-radius: 10px; width: 200px; height: 80px; text-align: center;">
-                <p style="margin: 0; color: #666;">schema</p>
-            </div>
-            """, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-
-        st.markdown(f"""
-        **{get_translation('parameters', lang)}:**""")
-
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown(f"""
-                **θ ({get_translation('theta', lang)})**: {get_translation('theta_desc', lang)}<br>
-                **δ ({get_translation('delta', lang)})**: {get_translation('delta_desc', lang)}<br>
-                **δ₁ ({get_translation('delta1', lang)})**: {get_translation('delta1_desc', lang)}<br>
-                **δ₂ ({get_translation('delta2', lang)})**: {get_translation('delta2_desc', lang)}<br>
-                **ε ({get_translation('epsilon', lang)})**: {get_translation('epsilon_desc', lang)}<br>
-                **τ ({get_translation('tau', lang)})**: {get_translation('tau_desc', lang)}<br>
-                **φ ({get_translation('phi', lang)})**: {get_translation('phi_desc', lang)}""", unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"""
-                **a**: {get_translation('a_desc', lang)}<br>
-                **b**: {get_translation('b_desc', lang)}<br>
-                **d**: {get_translation('d_desc', lang)}<br>
-                **f**: {get_translation('f_desc', lang)}<br>
-                **h**: {get_translation('h_desc', lang)}<br>
-                **L**: {get_translation('L_desc', lang)}
-                """, unsafe_allow_html=True)
-    
-    # Tab 2: Force Measurement
-    with tabs[1]:
-        st.subheader(get_translation("force_measurement_input", lang))
-        
-        # Display list of cables with force input fields
-        st.markdown(f"### {get_translation('cable_force_inputs', lang)}")
-        st.markdown(get_translation("enter_forces", lang))
-        
-        # Create a multi-column layout for cable inputs
-        force_cols = st.columns(3)
-        
-        # Group cables by type for better organization
-        cable_groups = {
-            'rhs': {'name': get_translation("rhs", lang), 'cables': []},
-            'tso': {'name': get_translation("tso", lang), 'cables': []},
-            'tsu': {'name': get_translation("tsu", lang), 'cables': []},
-            'fa': {'name': get_translation("fa", lang), 'cables': []},
-            'sa': {'name': get_translation("sa", lang), 'cables': []},
-            'zw': {'name': get_translation("zw", lang), 'cables': []}  # Add catching cables if missing
-        }
-
-        # Group cables by type, filtering out intermediate segments
-        for cable_id, cable in st.session_state.barrier_config['cables'].items():
-            cable_type = cable.get('type', '')
-            
-            # Check if this is an anchor-connected segment
-            is_anchor_segment = False
-            start_point = cable.get('start', '')
-            end_point = cable.get('end', '')
-            
-            # Only include anchor-connected segments
-            if (start_point in st.session_state.barrier_config['anchors'] or 
-                end_point in st.session_state.barrier_config['anchors']):
-                # This is an anchor-connected segment, include it
-                if cable_type in cable_groups:
-                    cable_groups[cable_type]['cables'].append((cable_id, cable))
-                
-                # Ensure it's marked as capable of having a load cell in the configuration
-                st.session_state.barrier_config['cables'][cable_id]['can_have_load_cell'] = True
-            else:
-                # This is an intermediate segment, don't include it in the UI
-                # But ensure it's marked as not capable of having a load cell in the configuration
-                st.session_state.barrier_config['cables'][cable_id]['can_have_load_cell'] = False
-                st.session_state.barrier_config['cables'][cable_id]['has_load_cell'] = False
-
-        # Distribute cable groups across columns
-        col_index = 0
-        for group_type, group in cable_groups.items():
-            # Only show groups that have cables
-            if group['cables']:
-                with force_cols[col_index % 3]:
-                    st.markdown(f"#### {group['name']}")
-                    
-                    for cable_id, cable in group['cables']:
-                        # Create a row for each cable with force input and load cell toggle
-                        col1, col2 = st.columns([3, 1])
-                        
-                        with col1:
-                            # Force input field
-                            force = st.number_input(
-                                f"{cable['name']} {get_translation('force_kn', lang)}", 
-                                min_value=0.0, 
-                                value=float(cable['force']), 
-                                step=0.1,
-                                key=f"force_{cable_id}",
-                                format="%.1f"
-                            )
-                            st.session_state.barrier_config['cables'][cable_id]['force'] = force
-                        
-                        with col2:
-                            # Load cell toggle
-                            has_load_cell = st.checkbox(
-                                get_translation("load_cell", lang), 
-                                value=cable['has_load_cell'],
-                                key=f"load_cell_{cable_id}"
-                            )
-                            st.session_state.barrier_config['cables'][cable_id]['has_load_cell'] = has_load_cell
-                    
-                    st.markdown("---")
-                
-                col_index += 1
-        
-        # Save force measurements button
-        if st.button(get_translation("save_force_measurements", lang)):
-            save_barrier_config(st.session_state.username, st.session_state.barrier_config)
-            st.success(get_translation("forces_saved", lang))
+    ], key="analyzer_tab", on_change="rerun")
     
-    # Tab 3: Results
-    with tabs[2]:
-        st.subheader(get_translation("force_calculation_results", lang))
-        
-        # Calculate forces based on current configuration
-        results = calculate_forces(st.session_state.barrier_config)
-        
-        # Display result visualization
-        st.markdown(f"### {get_translation('force_distribution_viz', lang)}")
+    # Only the selected tab is executed, the others cost nothing on a rerun
+    tab_renderers = (render_geometry_tab, render_force_tab, render_results_tab, render_export_tab)
+    for tab, render_tab in zip(tabs, tab_renderers):
+        if tab.open:
+            with tab:
+                render_tab(lang)
 
-        results_view_type = st.radio(
-            get_translation("select_view_type", lang), 
-            [
-                get_translation("3d_view", lang),
-                get_translation("2d_side_view", lang)
-            ],
-            horizontal=True,
-            key="results_view_type",
-            format_func=lambda x: x  # We're already passing translated values
-        )
-        
-        # Display the selected view
-        if results_view_type == get_translation("2d_side_view", lang):
-            result_view = create_barrier_diagram(st.session_state.barrier_config, results)
-            st.plotly_chart(result_view, use_container_width=True, key="results_view")
-        else:  # 3D View
-            result_3d_view = create_3d_view(st.session_state.barrier_config, results)
-            st.plotly_chart(result_3d_view, use_container_width=True, key="results_3d_view")
-        
-        # Display total forces
-        st.markdown(f"### {get_translation('total_forces', lang)}")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric(get_translation("total_anchor_force", lang), f"{results['total_anchor_force']:.1f} kN")
-        
-        with col2:
-            st.metric(get_translation("total_support_force", lang), f"{results['total_support_force']:.1f} kN")
-        
-        # Display detailed results in tables
-        st.markdown(f"### {get_translation('detailed_force_results', lang)}")
-        
-        # Create anchor results table
-        anchor_data = []
-        for anchor_id, anchor in st.session_state.barrier_config['anchors'].items():
-            # Skip anchors without position data
-            if 'position' not in anchor:
-                continue
-                
-            if anchor_id.startswith('v'):  # Only include retention cable anchors
-                anchor_data.append({
-                    get_translation('anchor', lang): anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}"),
-                    f"{get_translation('force', lang)} (kN)": round(results.get(anchor_id, 0), 1),
-                    f"X ({get_translation('meter', lang)})": round(anchor['position'].get('x', 0), 2),
-                    f"Y ({get_translation('meter', lang)})": round(anchor['position'].get('y', 0), 2),
-                    f"Z ({get_translation('meter', lang)})": round(anchor['position'].get('z', 0), 2)
-                })
-        
-        df_anchors = pd.DataFrame(anchor_data)
-        
-        # Create support results table
-        support_data = []
-        for support_id, support in st.session_state.barrier_config['supports'].items():
-            # Skip supports without required data
-            if 'base' not in support or 'top' not in support:
-                continue
-                
-            support_data.append({
-                get_translation('support', lang): support.get('name', f"{get_translation('support', lang)} {support_id}"),
-                f"{get_translation('force', lang)} (kN)": round(results.get(support_id, 0), 1),
-                f"{get_translation('base', lang)} X ({get_translation('meter', lang)})": round(support['base'].get('x', 0), 2),
-                f"{get_translation('base', lang)} Y ({get_translation('meter', lang)})": round(support['base'].get('y', 0), 2),
-                f"{get_translation('base', lang)} Z ({get_translation('meter', lang)})": round(support['base'].get('z', 0), 2),
-                f"{get_translation('top', lang)} X ({get_translation('meter', lang)})": round(support['top'].get('x', 0), 2),
-                f"{get_translation('top', lang)} Y ({get_translation('meter', lang)})": round(support['top'].get('y', 0), 2),
-                f"{get_translation('top', lang)} Z ({get_translation('meter', lang)})": round(support['top'].get('z', 0), 2)
-            })
-        
-        df_supports = pd.DataFrame(support_data)
-        
-        # Display tables
-        col3, col4 = st.columns(2)
-        
-        with col3:
-            st.markdown(f"#### {get_translation('anchor_forces', lang)}")
-            st.dataframe(df_anchors, use_container_width=True)
-        
-        with col4:
-            st.markdown(f"#### {get_translation('support_forces', lang)}")
-            st.dataframe(df_supports, use_container_width=True)
-    
-    # Tab 4: Export
-    with tabs[3]:
-        st.subheader(get_translation("export_data", lang))
-        
-        # Calculate forces for export
-        export_results = calculate_forces(st.session_state.barrier_config)
-        
-        # Prepare export data
-        export_data = {
-            'barrier_config': st.session_state.barrier_config,
-            'force_results': export_results,
-            'exported_by': st.session_state.username,
-            'export_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        # Convert to JSON
-        export_json = json.dumps(export_data, indent=2)
-        
-        # Download button
-        st.download_button(
-            label=get_translation("download_complete_config", lang),
-            data=export_json,
-            file_name="rockfall_barrier_analysis.json",
-            mime="application/json"
-        )
-        
-        # Export CSV options
-        st.markdown(f"### {get_translation('export_results_csv', lang)}")
-        
-        # Calculate forces
-        results = calculate_forces(st.session_state.barrier_config)
-        
-        # Prepare CSV data
-        col5, col6 = st.columns(2)
-        
-        with col5:
-            # Export anchor forces
-            anchor_data = []
-            for anchor_id, anchor in st.session_state.barrier_config['anchors'].items():
-                # Skip anchors without position data
-                if 'position' not in anchor:
-                    continue
-                    
-                if anchor_id.startswith('v'):  # Only include retention cable anchors
-                    anchor_data.append({
-                        get_translation('anchor', lang): anchor.get('name', f"{get_translation('anchor', lang)} {anchor_id}"),
-                        f"{get_translation('force', lang)} (kN)": round(results.get(anchor_id, 0), 1),
-                        f"X ({get_translation('meter', lang)})": round(anchor['position'].get('x', 0), 2),
-                        f"Y ({get_translation('meter', lang)})": round(anchor['position'].get('y', 0), 2),
-                        f"Z ({get_translation('meter', lang)})": round(anchor['position'].get('z', 0), 2)
-                    })
-            
-            df_anchors = pd.DataFrame(anchor_data)
-            csv_anchors = df_anchors.to_csv(index=False)
-            
-            st.download_button(
-                label=get_translation("download_anchor_forces_csv", lang),
-                data=csv_anchors,
-                file_name="anchor_forces.csv",
-                mime="text/csv",
-                key="download_anchors"
-            )
-        
-        with col6:
-            # Export support forces
-            support_data = []
-            for support_id, support in st.session_state.barrier_config['supports'].items():
-                # Skip supports without required data
-                if 'base' not in support or 'top' not in support:
-                    continue
-                    
-                support_data.append({
-                    get_translation('support', lang): support.get('name', f"{get_translation('support', lang)} {support_id}"),
-                    f"{get_translation('force', lang)} (kN)": round(results.get(support_id, 0), 1),
-                    f"{get_translation('base', lang)} X ({get_translation('meter', lang)})": round(support['base'].get('x', 0), 2),
-                    f"{get_translation('base', lang)} Y ({get_translation('meter', lang)})": round(support['base'].get('y', 0), 2),
-                    f"{get_translation('base', lang)} Z ({get_translation('meter', lang)})": round(support['base'].get('z', 0), 2),
-                    f"{get_translation('top', lang)} X ({get_translation('meter', lang)})": round(support['top'].get('x', 0), 2),
-                    f"{get_translation('top', lang)} Y ({get_translation('meter', lang)})": round(support['top'].get('y', 0), 2),
-                    f"{get_translation('top', lang)} Z ({get_translation('meter', lang)})": round(support['top'].get('z', 0), 2)
-                })
-            
-            df_supports = pd.DataFrame(support_data)
-            csv_supports = df_supports.to_csv(index=False)
-            
-            st.download_button(
-                label=get_translation("download_support_forces_csv", lang),
-                data=csv_supports,
-                file_name="support_forces.csv",
-                mime="text/csv",
-                key="download_supports"
-            )
-        
-        # Export cable forces
-        cable_data = []
-        for cable_id, cable in st.session_state.barrier_config['cables'].items():
-            # Skip cables without required coordinates
-            if 'start_coords' not in cable or 'end_coords' not in cable:
-                continue
-                
-            # Use get() method to safely retrieve values with defaults
-            start_coords = cable.get('start_coords', {})
-            end_coords = cable.get('end_coords', {})
-            
-            cable_data.append({
-                get_translation('cable', lang): cable.get('name', f"{get_translation('cable', lang)} {cable_id}"),
-                get_translation('type', lang): cable.get('type', '').upper(),
-                f"{get_translation('force', lang)} (kN)": cable.get('force', 0) if cable.get('has_load_cell', False) else get_translation("no_measurement", lang),
-                get_translation('has_load_cell', lang): get_translation("yes", lang) if cable.get('has_load_cell', False) else get_translation("no", lang),
-                f"{get_translation('start', lang)} X": round(start_coords.get('x', 0), 2),
-                f"{get_translation('start', lang)} Y": round(start_coords.get('y', 0), 2),
-                f"{get_translation('start', lang)} Z": round(start_coords.get('z', 0), 2),
-                f"{get_translation('end', lang)} X": round(end_coords.get('x', 0), 2),
-                f"{get_translation('end', lang)} Y": round(end_coords.get('y', 0), 2),
-                f"{get_translation('end', lang)} Z": round(end_coords.get('z', 0), 2)
-            })
-        
-        df_cables = pd.DataFrame(cable_data)
-        csv_cables = df_cables.to_csv(index=False)
-        
-        st.download_button(
-            label=get_translation("download_cable_forces_csv", lang),
-            data=csv_cables,
-            file_name="cable_forces.csv",
-            mime="text/csv",
-            key="download_cables"
-        )
-        
-        # Export all data in one JSON
-        st.markdown(f"### {get_translation('export_all_data', lang)}")
-        
-        # Combine all data
-        all_data = {
-            get_translation('anchors', lang): df_anchors.to_dict(orient='records') if not df_anchors.empty else [],
-            get_translation('supports', lang): df_supports.to_dict(orient='records'),
-            get_translation('cables', lang): df_cables.to_dict(orient='records'),
-            get_translation('total_anchor_force', lang): results.get('total_anchor_force', 0),
-            get_translation('total_support_force', lang): results.get('total_support_force', 0),
-            get_translation('parameters', lang): st.session_state.barrier_config.get('params', get_default_params())
-        }
-        
-        # Convert to JSON
-        all_json = json.dumps(all_data, indent=2)
-        
-        st.download_button(
-            label=get_translation("download_all_json", lang),
-            data=all_json,
-            file_name="all_data.json",
-            mime="application/json",
-            key="download_all_json"
-        )
\ No newline at end of file